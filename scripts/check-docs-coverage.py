@@ -9,7 +9,10 @@ This is the new modular version that replaces the massive monolithic script.
 import sys
 import argparse
 import os
+import json
 from docs_coverage import DocumentationChecker
+from docs_coverage.progress import PROGRESS_MODES, create_progress
+from docs_coverage.whatif import DEFAULT_METRICS_CACHE, parse_override, run_what_if
 
 def is_ci_environment():
     """Check if we're running in a CI/CD environment"""
@@ -70,18 +73,117 @@ def prompt_for_format():
             print("\n\n👋 Analysis cancelled")
             sys.exit(0)
 
+def configure_progress(checker: DocumentationChecker, mode: str = None) -> None:
+    """Attach a progress display to the checker (mode from --progress or the config)"""
+    mode = mode or checker.get_config("progress.mode", "auto")
+    log_interval = checker.get_config("progress.log_interval_seconds", 10)
+    checker.set_progress(create_progress(mode, log_interval))
+
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(description="Industry-standard documentation coverage checker (modular version)")
+    parser.add_argument("command", nargs="?", choices=["check", "what-if", "import-budget", "numpy-parity"], default="check",
+                        help="'check' runs a full analysis (default); 'what-if' re-evaluates cached metrics with overridden thresholds; "
+                             "'import-budget' checks what the JSON/console path imports; "
+                             "'numpy-parity' checks that the NumPy and pure-Python analyses agree")
     parser.add_argument("--config", default="scripts/docs-coverage-config.json", help="Configuration file")
-    parser.add_argument("--format", choices=["console", "json", "markdown", "html", "csv"], help="Output format (prompts if not specified)")
+    parser.add_argument("--format", choices=["console", "json", "markdown", "markdown-site", "markdown-comment", "html", "html-site", "csv", "xlsx", "ndjson"], help="Output format (prompts if not specified)")
     parser.add_argument("--output", help="Output file (default: stdout for console/json, auto-generated for others)")
     parser.add_argument("--fail-under", type=float, help="Fail if coverage is under this percentage")
     parser.add_argument("--min-quality", type=float, help="Minimum quality score required")
     parser.add_argument("--quiet", "-q", action="store_true", help="Suppress interactive prompts (use defaults)")
+    parser.add_argument("--fail-fast", action="store_true",
+                        help="Gate mode: skip reports, stop as soon as minimum coverage is guaranteed or impossible, print a JSON summary")
+    sample_group = parser.add_mutually_exclusive_group()
+    sample_group.add_argument("--sample", type=int, metavar="N", help="Estimate coverage from a stratified sample of N files")
+    sample_group.add_argument("--sample-fraction", type=float, metavar="P", help="Estimate coverage from a stratified sample of this fraction (0-1] of files")
+    parser.add_argument("--top", type=int, metavar="K",
+                        help="Report only the K most urgent gaps (by priority, complexity, size and effort); totals stay exact")
+    parser.add_argument("--sample-seed", type=int, default=0, help="Random seed for --sample/--sample-fraction (default: 0)")
+    parser.add_argument("--set", dest="overrides", action="append", default=[], metavar="KEY=VALUE",
+                        help="what-if: override a config value, e.g. code_analysis.complexity_thresholds.medium=15 (repeatable)")
+    parser.add_argument("--metrics-cache", default=DEFAULT_METRICS_CACHE, help="what-if: raw metrics cache file")
+    parser.add_argument("--refresh-metrics", action="store_true", help="what-if: rescan files even if the metrics cache is valid")
+    parser.add_argument("--progress", choices=PROGRESS_MODES,
+                        help="Progress display: bar on a terminal, periodic log lines in CI (default: auto, from config)")
+    parser.add_argument("--max-modules", type=int, help="import-budget: maximum number of package modules imported (default: 14)")
+    parser.add_argument("--budget-ms", type=float, help="import-budget: also fail above this import time of the package's own modules")
     
     args = parser.parse_args()
     
+    if args.sample is not None and args.sample < 1:
+        parser.error("--sample must be at least 1")
+    if args.sample_fraction is not None and not 0 < args.sample_fraction <= 1:
+        parser.error("--sample-fraction must be in (0, 1]")
+    if args.top is not None and args.top < 1:
+        parser.error("--top must be at least 1")
+    
+    if args.command == "what-if":
+        try:
+            overrides = [parse_override(override) for override in args.overrides]
+        except ValueError as e:
+            parser.error(str(e))
+        if args.fail_under:
+            overrides.append(("fail_under", args.fail_under))
+        if args.min_quality:
+            overrides.append(("min_quality", args.min_quality))
+        
+        output = run_what_if(args.config, overrides, args.metrics_cache, args.refresh_metrics)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                f.write(output)
+            print(f"📄 What-if comparison written to {args.output}", file=sys.stderr)
+        else:
+            print(output)
+        sys.exit(0)
+    
+    if args.command == "import-budget":
+        from docs_coverage.import_budget import DEFAULT_MAX_PACKAGE_MODULES, print_import_budget, run_import_budget
+        result = run_import_budget(args.max_modules or DEFAULT_MAX_PACKAGE_MODULES, args.budget_ms)
+        print_import_budget(result)
+        output = json.dumps(result.to_dict(), indent=2)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                f.write(output)
+            print(f"📄 Import budget summary written to {args.output}", file=sys.stderr)
+        else:
+            print(output)
+        sys.exit(0 if result.passed else 1)
+    
+    if args.command == "numpy-parity":
+        from docs_coverage.parity import print_parity, run_parity_check
+        result = run_parity_check(args.config)
+        print_parity(result)
+        output = json.dumps(result.to_dict(), indent=2)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                f.write(output)
+            print(f"📄 Parity summary written to {args.output}", file=sys.stderr)
+        else:
+            print(output)
+        sys.exit(0 if result.passed else 1)
+    
+    if args.fail_fast:
+        checker = DocumentationChecker(args.config)
+        configure_progress(checker, args.progress)
+        if args.fail_under:
+            checker.set_threshold("fail_under", args.fail_under)
+        
+        from docs_coverage.gate import run_coverage_gate
+        result = run_coverage_gate(checker)
+        output = json.dumps(result.to_dict(), indent=2)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                f.write(output)
+            print(f"📄 Gate summary written to {args.output}", file=sys.stderr)
+        else:
+            print(output)
+        
+        if is_ci_environment() and not result.passed:
+            low, high = result.coverage_bounds
+            print(f"::error::Documentation coverage cannot reach the minimum {result.minimum_coverage_percentage}% (at most {high:.1f}%).", file=sys.stderr)
+        sys.exit(0 if result.passed else 1)
+    
     # Determine output format
     if args.format:
         # Format specified via argument
@@ -97,6 +199,8 @@ def main():
     # Create checker
     print("🔍 Initializing documentation coverage checker...", file=sys.stderr)
     checker = DocumentationChecker(args.config)
+    configure_progress(checker, args.progress)
+    checker.set_top_k(args.top)
     
     # Override thresholds if specified
     if args.fail_under:
@@ -105,8 +209,13 @@ def main():
         checker.set_threshold("min_quality", args.min_quality)
     
     # Check coverage
-    print("📊 Analyzing documentation coverage...", file=sys.stderr)
-    report = checker.check_coverage()
+    if args.sample is not None or args.sample_fraction is not None:
+        print("📊 Estimating documentation coverage from a sample...", file=sys.stderr)
+        from docs_coverage.sampling import run_sampled_check
+        report = run_sampled_check(checker, args.sample, args.sample_fraction, args.sample_seed)
+    else:
+        print("📊 Analyzing documentation coverage...", file=sys.stderr)
+        report = checker.check_coverage()
     
     # Generate and handle different output formats
     if output_format == "console":
@@ -119,7 +228,7 @@ def main():
         else:
             print(output)
     
-    elif output_format in ["html", "csv", "markdown"]:
+    elif output_format in ["html", "html-site", "csv", "xlsx", "markdown", "markdown-site", "markdown-comment"]:
         # File formats automatically save to files
         print(f"🎨 Generating {output_format.upper()} report...", file=sys.stderr)
         
@@ -127,27 +236,37 @@ def main():
         if args.output:
             output_file = args.output
             # Set custom output file for reporters that support it
-            if output_format == "csv":
+            if output_format in ["csv", "xlsx"]:
                 checker.reporters[output_format].set_output_file(output_file)
-            elif output_format == "html":
+            elif output_format in ["html", "html-site", "markdown-site"]:
                 checker.reporters[output_format].set_output_file(output_file)
         else:
             # Auto-generate filename based on format
-            extensions = {"html": "html", "csv": "csv", "markdown": "md"}
-            output_file = f"documentation-coverage-report.{extensions[output_format]}"
+            extensions = {"html": "html", "csv": "csv", "xlsx": "xlsx", "markdown": "md"}
+            if output_format == "html-site":
+                output_file = "documentation-coverage-site"
+            elif output_format == "markdown-site":
+                output_file = "documentation-coverage-docs"
+            elif output_format == "markdown-comment":
+                output_file = "documentation-coverage-comment.md"
+            else:
+                output_file = f"documentation-coverage-report.{extensions[output_format]}"
         
         # Generate the report
         console_summary = checker.generate_report(report, output_format)
         
         # For markdown, handle file writing here since it doesn't have internal file writing
-        if output_format == "markdown":
+        if output_format in ["markdown", "markdown-comment"]:
             with open(output_file, 'w', encoding='utf-8') as f:
-                # Get the actual markdown content
-                markdown_content = checker.reporters["markdown"].generate(report)
-                f.write(markdown_content)
+                # The markdown reporters return the content itself
+                f.write(console_summary)
         
         # Check if file was created and get its size
-        if os.path.exists(output_file):
+        if os.path.isdir(output_file):
+            pages_dir, suffix = ("gaps", ".md") if output_format == "markdown-site" else ("pages", ".html")
+            page_count = sum(1 for name in os.listdir(os.path.join(output_file, pages_dir)) if name.endswith(suffix))
+            print(f"✅ {output_format.upper()} report written to {output_file} ({page_count + 1:,} pages)", file=sys.stderr)
+        elif os.path.exists(output_file):
             file_size = os.path.getsize(output_file)
             print(f"✅ {output_format.upper()} report written to {output_file} ({file_size:,} bytes)", file=sys.stderr)
         else:
@@ -166,7 +285,9 @@ def main():
             # The console_summary returned by these reporters is already a summary
             print(console_summary, file=sys.stderr)
             
-            if output_format == "html":
+            if output_format == "html-site":
+                print(f"\n🌐 Open {os.path.join(output_file, 'index.html')} in your browser to explore the interactive report!", file=sys.stderr)
+            elif output_format == "html":
                 print(f"\n🌐 Open {output_file} in your browser to explore the interactive report!", file=sys.stderr)
     
     elif output_format == "json":
@@ -179,6 +300,14 @@ def main():
         else:
             print(output)
     
+    elif output_format == "ndjson":
+        # NDJSON streams one record per line to the file or to stdout
+        if args.output:
+            checker.reporters["ndjson"].set_output_file(args.output)
+        console_summary = checker.generate_report(report, "ndjson")
+        if args.output:
+            print(f"📄 NDJSON report written to {args.output} ({console_summary})", file=sys.stderr)
+    
     # Exit with appropriate code
     min_coverage = checker.get_config("documentation_standards.minimum_coverage_percentage", 85.0)
     min_quality = checker.get_config("documentation_standards.minimum_quality_score", 0.7)
@@ -10,7 +10,8 @@ import os
 import subprocess
 import json
 from datetime import datetime
-from docs_coverage import DocumentationChecker, CoverageReport, DocumentationGap, CodeFileAnalysis
+from docs_coverage import DocumentationChecker, CoverageReport, CodeFileAnalysis
+from docs_coverage.serialization import report_json
 
 def get_pr_changed_files(base_ref="origin/main", head_ref="HEAD"):
     """Get list of files changed in the current PR"""
@@ -93,8 +94,7 @@ class PRDocumentationChecker(DocumentationChecker):
             'scope': 'PR-specific analysis'
         }
         
-        # Add PR context to all reporters
-        for format_name, reporter in self.reporters.items():
+        def add_pr_context(reporter):
             if hasattr(reporter, 'set_pr_context'):
                 reporter.set_pr_context(pr_context)
             elif hasattr(reporter, 'pr_context'):
@@ -105,6 +105,9 @@ class PRDocumentationChecker(DocumentationChecker):
             
             # The set_pr_context method now handles propagation to internal components
             # No need for manual propagation here
+        
+        # Add PR context to each reporter as it is created
+        self.reporters.add_setup(add_pr_context)
     
     def filter_code_files_for_pr(self, all_code_files):
         """Filter the code files list to only include PR-changed files"""
@@ -158,81 +161,7 @@ class PRDocumentationChecker(DocumentationChecker):
         print(f"📚 Found {len(self.documentation_files)} documentation files for PR files", file=sys.stderr)
         
         # Assess documentation quality for PR files
-        gaps = []
-        adequately_documented = 0
-        total_quality_score = 0.0
-        
-        for code_file in pr_code_files:
-            if code_file.path in self.documentation_files:
-                doc_path = self.documentation_files[code_file.path]
-                quality = self.quality_assessor.assess_documentation_quality(
-                    doc_path, code_file.file_type, code_file.priority
-                )
-                self.quality_assessments[code_file.path] = quality
-                
-                min_quality = self.config_manager.config["documentation_standards"]["minimum_quality_score"]
-                if quality.quality_score >= min_quality:
-                    adequately_documented += 1
-                else:
-                    # Documentation exists but is inadequate
-                    gap = DocumentationGap(
-                        code_file=code_file.path,
-                        expected_doc_path=doc_path,
-                        gap_type="inadequate",
-                        priority=code_file.priority,
-                        required_sections=self.config_manager.config["documentation_standards"]["required_sections"].get(code_file.file_type, []),
-                        quality_issues=quality.missing_sections or [],
-                        estimated_effort=self.quality_assessor.estimate_effort(quality, code_file)
-                    )
-                    gaps.append(gap)
-                
-                total_quality_score += quality.quality_score
-            else:
-                # Documentation is missing
-                expected_doc_path = self.quality_assessor.get_expected_doc_path(code_file)
-                gap = DocumentationGap(
-                    code_file=code_file.path,
-                    expected_doc_path=expected_doc_path,
-                    gap_type="missing",
-                    priority=code_file.priority,
-                    required_sections=self.config_manager.config["documentation_standards"]["required_sections"].get(code_file.file_type, []),
-                    quality_issues=["Documentation file does not exist"],
-                    estimated_effort=self.quality_assessor.estimate_effort_for_missing(code_file)
-                )
-                gaps.append(gap)
-        
-        # Calculate metrics
-        documented_files = len(self.documentation_files)
-        total_files = len(pr_code_files)
-        coverage_percentage = (adequately_documented / total_files * 100) if total_files > 0 else 100
-        average_quality = (total_quality_score / documented_files) if documented_files > 0 else 0.0
-        
-        # Group by priority and file type
-        by_priority = {"critical": 0, "high": 0, "medium": 0, "low": 0}
-        by_file_type = {}
-        
-        for gap in gaps:
-            by_priority[gap.priority] += 1
-            
-            file_type = next((cf.file_type for cf in pr_code_files if cf.path == gap.code_file), "unknown")
-            if file_type not in by_file_type:
-                by_file_type[file_type] = {"missing": 0, "inadequate": 0}
-            
-            by_file_type[file_type][gap.gap_type] += 1
-        
-        return CoverageReport(
-            total_code_files=total_files,
-            documented_files=documented_files,
-            adequately_documented=adequately_documented,
-            missing_documentation=len([g for g in gaps if g.gap_type == "missing"]),
-            inadequate_documentation=len([g for g in gaps if g.gap_type == "inadequate"]),
-            coverage_percentage=coverage_percentage,
-            quality_score=average_quality,
-            gaps=gaps,
-            by_priority=by_priority,
-            by_file_type=by_file_type,
-            timestamp=datetime.now().isoformat()
-        )
+        return self._build_report(pr_code_files)
     
     def generate_report(self, report: CoverageReport, format: str = "console") -> str:
         """Generate comprehensive coverage report with PR context"""
@@ -244,6 +173,7 @@ class PRDocumentationChecker(DocumentationChecker):
         # Set code files for CSV reporter (needed for detailed analysis)
         if format == "csv":
             reporter.set_code_files(self.code_files)
+            reporter.set_quality_assessments(self.quality_assessments, self.documentation_files)
         
         # Ensure PR context is available in the report
         if hasattr(reporter, 'pr_context'):
@@ -261,7 +191,7 @@ def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(description="PR-specific documentation coverage checker")
     parser.add_argument("--config", default="scripts/docs-coverage-config.json", help="Configuration file")
-    parser.add_argument("--format", choices=["console", "json", "markdown", "html", "csv"], 
+    parser.add_argument("--format", choices=["console", "json", "markdown", "markdown-comment", "html", "csv"], 
                        default="json", help="Output format")
     parser.add_argument("--output", help="Output file (default: stdout for console/json)")
     parser.add_argument("--base-ref", default="origin/main", help="Base reference for PR comparison")
@@ -324,23 +254,7 @@ def main():
     # Generate output
     if args.format == "json":
         # Custom JSON output with PR information
-        pr_report = {
-            "pr_info": get_pr_info(),
-            "pr_files": pr_files,
-            "total_code_files": report.total_code_files,
-            "documented_files": report.documented_files,
-            "adequately_documented": report.adequately_documented,
-            "missing_documentation": report.missing_documentation,
-            "inadequate_documentation": report.inadequate_documentation,
-            "coverage_percentage": report.coverage_percentage,
-            "quality_score": report.quality_score,
-            "gaps": [gap.__dict__ for gap in report.gaps],
-            "by_priority": report.by_priority,
-            "by_file_type": report.by_file_type,
-            "timestamp": report.timestamp
-        }
-        
-        output = json.dumps(pr_report, indent=2)
+        output = report_json(report, head={"pr_info": get_pr_info(), "pr_files": pr_files})
         
         # Output the report
         if args.output:
@@ -351,7 +265,7 @@ def main():
         else:
             print(output)
     
-    elif args.format in ["html", "csv", "markdown"]:
+    elif args.format in ["html", "csv", "markdown", "markdown-comment"]:
         # File formats automatically save to files (like the main script)
         if not args.quiet:
             print(f"🎨 Generating {args.format.upper()} report...", file=sys.stderr)
@@ -365,17 +279,19 @@ def main():
         else:
             # Auto-generate filename based on format
             extensions = {"html": "html", "csv": "csv", "markdown": "md"}
-            output_file = f"pr-documentation-coverage-report.{extensions[args.format]}"
+            if args.format == "markdown-comment":
+                output_file = "pr-documentation-coverage-comment.md"
+            else:
+                output_file = f"pr-documentation-coverage-report.{extensions[args.format]}"
         
         # Generate the report (this writes to file and returns console summary)
         console_summary = checker.generate_report(report, args.format)
         
         # For markdown, handle file writing here since it doesn't have internal file writing
-        if args.format == "markdown":
+        if args.format in ["markdown", "markdown-comment"]:
             with open(output_file, 'w', encoding='utf-8') as f:
-                # Get the actual markdown content
-                markdown_content = checker.reporters["markdown"].generate(report)
-                f.write(markdown_content)
+                # The markdown reporters return the content itself
+                f.write(console_summary)
         
         # Check if file was created and get its size
         if os.path.exists(output_file):
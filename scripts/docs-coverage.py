@@ -41,7 +41,7 @@ def main():
         print(f"✅ HTML report generated: documentation-coverage-report.html")
         print(f"📊 Coverage: {report.coverage_percentage:.1f}% ({report.adequately_documented}/{report.total_code_files} files)")
         print(f"📚 Documentation files: {len(checker.documentation_files)}")
-        print(f"🔍 Gaps found: {len(report.gaps)}")
+        print(f"🔍 Gaps found: {report.total_gaps}")
         print(f"🌐 Open the HTML file in your browser to view the interactive report!")
         
         if args.syntax_highlighting:
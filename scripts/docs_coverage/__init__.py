@@ -11,7 +11,13 @@ from .models import (
     DocumentationQuality,
     CodeFileAnalysis,
     DocumentationGap,
-    CoverageReport
+    CoverageReport,
+    SampleEstimate,
+    FileType,
+    Language,
+    Priority,
+    GapType,
+    Effort
 )
 
 __version__ = "2.0.0"
@@ -23,5 +29,11 @@ __all__ = [
     'DocumentationQuality',
     'CodeFileAnalysis',
     'DocumentationGap',
-    'CoverageReport'
+    'CoverageReport',
+    'SampleEstimate',
+    'FileType',
+    'Language',
+    'Priority',
+    'GapType',
+    'Effort'
 ] 
\ No newline at end of file
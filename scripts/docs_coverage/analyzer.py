@@ -8,32 +8,88 @@ import sys
 import glob
 import re
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional
 
-from .models import CodeFileAnalysis
+from .models import CodeFileAnalysis, FileType, Language, Priority
 from .config import ConfigManager
+from .metrics import MetricsTable, PRIORITIES, get_numpy
+from .progress import NULL_PROGRESS
 
 class CodeAnalyzer:
     """Analyzes TypeScript/JavaScript code files for documentation requirements"""
     
     def __init__(self, config_manager: ConfigManager):
         self.config = config_manager.config
+        self.progress = NULL_PROGRESS
     
     def find_code_files(self) -> List[CodeFileAnalysis]:
         """Find and analyze all code files"""
-        code_files = []
-        
-        for file_type, pattern in self.config["code_analysis"]["file_patterns"].items():
-            files = glob.glob(pattern, recursive=True)
-            for file_path in files:
-                if self._should_exclude_file(file_path):
-                    continue
-                
-                analysis = self._analyze_typescript_file(file_path)
-                if analysis.documentation_required:
-                    code_files.append(analysis)
-        
-        return code_files
+        analyses = self.scan_code_files()
+        self.classify(analyses)
+        return [analysis for analysis in analyses if analysis.documentation_required]
+    
+    def discover_code_files(self) -> List[str]:
+        """List every code file matched by the configured patterns, without reading it"""
+        paths = []
+        
+        with self.progress.stage("walk") as stage:
+            for file_type, pattern in self.config["code_analysis"]["file_patterns"].items():
+                for file_path in glob.iglob(pattern, recursive=True):
+                    stage.advance()
+                    if not self._should_exclude_file(file_path):
+                        paths.append(file_path)
+        
+        return paths
+    
+    def scan_code_files(self, paths: Optional[List[str]] = None) -> List[CodeFileAnalysis]:
+        """Extract raw metrics for code files, without classifying them
+        
+        Scans all discovered files unless a list of paths is given.
+        """
+        analyses = []
+        if paths is None:
+            paths = self.discover_code_files()
+        
+        # Encoding a file back to UTF-8 for its byte count costs a copy, so it
+        # is only done when the throughput is actually shown
+        count_bytes = self.progress.enabled
+        with self.progress.stage("analyse", total=len(paths)) as stage:
+            for file_path in paths:
+                content = self._read_source(file_path)
+                # Unreadable files never require documentation
+                if content is not None:
+                    analyses.append(self._analyze_source(file_path, content, classify=False))
+                    stage.advance(nbytes=len(content.encode('utf-8')) if count_bytes else 0)
+                else:
+                    stage.advance()
+        
+        return analyses
+    
+    def classify(self, analyses: List[CodeFileAnalysis]) -> None:
+        """Set documentation_required and priority for a batch of analyses
+        
+        Uses the vectorized metrics table when NumPy is available and the
+        per-file rules otherwise; both produce identical results.
+        """
+        thresholds = self.config["code_analysis"]["complexity_thresholds"]
+        
+        if analyses and get_numpy() is not None:
+            table = MetricsTable.from_code_files(analyses)
+            required = table.requires_documentation(thresholds).tolist()
+            priority_codes = table.priority_codes(thresholds).tolist()
+            for analysis, is_required, code in zip(analyses, required, priority_codes):
+                analysis.documentation_required = is_required
+                analysis.priority = PRIORITIES[code]
+            return
+        
+        for analysis in analyses:
+            analysis.documentation_required = self._requires_documentation(
+                analysis.file_type, analysis.complexity_score, analysis.exported_functions,
+                analysis.exported_classes, analysis.is_public_api
+            )
+            analysis.priority = self._determine_priority(
+                analysis.file_type, analysis.complexity_score, analysis.is_public_api, analysis.size_lines
+            )
     
     def _should_exclude_file(self, file_path: str) -> bool:
         """Check if file should be excluded from analysis"""
@@ -42,20 +98,33 @@ class CodeAnalyzer:
                 return True
         return False
     
-    def _analyze_typescript_file(self, file_path: str) -> CodeFileAnalysis:
-        """Analyze a TypeScript/TSX file for documentation requirements"""
+    def _analyze_typescript_file(self, file_path: str, classify: bool = True) -> CodeFileAnalysis:
+        """Analyze a TypeScript/TSX file for documentation requirements
+        
+        With classify=False only the raw metrics are extracted; the caller is
+        expected to run classify() over the whole batch afterwards.
+        """
+        content = self._read_source(file_path)
+        if content is None:
+            return self._create_basic_analysis(file_path)
+        return self._analyze_source(file_path, content, classify)
+    
+    def _read_source(self, file_path: str) -> Optional[str]:
+        """Read a code file, returning None if it cannot be read"""
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+                return f.read()
         except Exception as e:
             print(f"⚠️  Error reading {file_path}: {e}", file=sys.stderr)
-            return self._create_basic_analysis(file_path)
-        
+            return None
+    
+    def _analyze_source(self, file_path: str, content: str, classify: bool = True) -> CodeFileAnalysis:
+        """Extract the metrics of a code file from its content"""
         # Basic file info
         path_obj = Path(file_path)
         name = path_obj.stem
         file_type = self._determine_file_type(file_path)
-        language = "typescript" if file_path.endswith('.ts') else "tsx"
+        language = Language.TYPESCRIPT if file_path.endswith('.ts') else Language.TSX
         size_lines = len(content.splitlines())
         
         # Extract exports using regex (more reliable than AST for TS/TSX)
@@ -77,15 +146,17 @@ class CodeAnalyzer:
         # Determine if this is a public API
         is_public_api = self._is_public_api(file_path, content)
         
-        # Determine documentation requirements
-        documentation_required = self._requires_documentation(
-            file_type, complexity_score, exported_functions, exported_classes, is_public_api
-        )
-        
-        # Determine priority
-        priority = self._determine_priority(
-            file_type, complexity_score, is_public_api, size_lines
-        )
+        # Determine documentation requirements and priority
+        if classify:
+            documentation_required = self._requires_documentation(
+                file_type, complexity_score, exported_functions, exported_classes, is_public_api
+            )
+            priority = self._determine_priority(
+                file_type, complexity_score, is_public_api, size_lines
+            )
+        else:
+            documentation_required = False
+            priority = Priority.LOW
         
         return CodeFileAnalysis(
             path=file_path,
@@ -111,7 +182,7 @@ class CodeAnalyzer:
             path=file_path,
             name=path_obj.stem,
             file_type=self._determine_file_type(file_path),
-            language="unknown",
+            language=Language.UNKNOWN,
             size_lines=0,
             complexity_score=0,
             exported_functions=[],
@@ -121,45 +192,45 @@ class CodeAnalyzer:
             has_tests=False,
             is_public_api=False,
             documentation_required=False,
-            priority="low"
+            priority=Priority.LOW
         )
     
-    def _determine_file_type(self, file_path: str) -> str:
+    def _determine_file_type(self, file_path: str) -> FileType:
         """Determine the type of code file"""
         path_lower = file_path.lower()
         
         if "components" in path_lower:
-            return "component"
+            return FileType.COMPONENT
         elif "services" in path_lower:
-            return "service"
+            return FileType.SERVICE
         elif "utils" in path_lower:
-            return "utility"
+            return FileType.UTILITY
         elif "hooks" in path_lower:
-            return "hook"
+            return FileType.HOOK
         elif "api" in path_lower and "route" in path_lower:
-            return "api_route"
+            return FileType.API_ROUTE
         elif "middleware" in path_lower:
-            return "middleware"
+            return FileType.MIDDLEWARE
         elif "types" in path_lower:
-            return "types"
+            return FileType.TYPES
         elif "page.tsx" in path_lower:
-            return "page"
+            return FileType.PAGE
         elif "layout.tsx" in path_lower:
-            return "layout"
+            return FileType.LAYOUT
         elif "loading.tsx" in path_lower:
-            return "loading"
+            return FileType.LOADING
         elif "error.tsx" in path_lower:
-            return "error"
+            return FileType.ERROR
         elif "not-found.tsx" in path_lower:
-            return "not_found"
+            return FileType.NOT_FOUND
         elif "globals.tsx" in path_lower:
-            return "globals"
+            return FileType.GLOBALS
         elif "constants" in path_lower:
-            return "constants"
+            return FileType.CONSTANTS
         elif "templates" in path_lower:
-            return "template"
+            return FileType.TEMPLATE
         else:
-            return "unknown"
+            return FileType.UNKNOWN
     
     def _extract_exported_functions(self, content: str) -> List[str]:
         """Extract exported function names"""
@@ -288,33 +359,33 @@ class CodeAnalyzer:
         return False
     
     def _determine_priority(self, file_type: str, complexity: int, 
-                          is_public: bool, size_lines: int) -> str:
+                          is_public: bool, size_lines: int) -> Priority:
         """Determine documentation priority"""
         # Critical: Complex public services and large components
         if is_public and file_type == "service" and complexity > 30:
-            return "critical"
+            return Priority.CRITICAL
         
         if file_type in ["component", "page", "layout"] and size_lines > 300:
-            return "critical"
+            return Priority.CRITICAL
         
         if complexity > self.config["code_analysis"]["complexity_thresholds"]["high"]:
-            return "critical"
+            return Priority.CRITICAL
         
         # High: Public APIs and substantial code files
         if file_type in ["component", "service", "page", "layout"] and size_lines > 150:
-            return "high"
+            return Priority.HIGH
         
         if complexity > self.config["code_analysis"]["complexity_thresholds"]["medium"]:
-            return "high"
+            return Priority.HIGH
         
         if is_public and file_type in ["api_route", "service"] and complexity > 15:
-            return "high"
+            return Priority.HIGH
         
         # Medium: Hooks, utilities, and smaller components
         if file_type in ["hook", "utility", "template"] and is_public:
-            return "medium"
+            return Priority.MEDIUM
         
         if file_type in ["component", "page"] and size_lines > 50:
-            return "medium"
+            return Priority.MEDIUM
         
-        return "low" 
\ No newline at end of file
+        return Priority.LOW 
\ No newline at end of file
@@ -5,13 +5,16 @@ Main documentation coverage checker class
 
 import sys
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 
-from .models import CoverageReport, DocumentationGap, CodeFileAnalysis
+from .models import CoverageReport, DocumentationGap, DocumentationQuality, CodeFileAnalysis, GapType, shared_sections
+from .metrics import aggregate_gaps
 from .config import ConfigManager
 from .analyzer import CodeAnalyzer
 from .quality import QualityAssessor
-from .reports import ConsoleReporter, JsonReporter, MarkdownReporter, HtmlReporter, CsvReporter
+from .reports import ReporterRegistry
+from .progress import NULL_PROGRESS
+from .triage import TopK, urgency_key
 
 class DocumentationChecker:
     """Main documentation coverage checker"""
@@ -21,19 +24,33 @@ class DocumentationChecker:
         self.analyzer = CodeAnalyzer(self.config_manager)
         self.quality_assessor = QualityAssessor(self.config_manager)
         
-        # Initialize reporters
-        self.reporters = {
-            'console': ConsoleReporter(self.config_manager),
-            'json': JsonReporter(self.config_manager),
-            'markdown': MarkdownReporter(self.config_manager),
-            'html': HtmlReporter(self.config_manager, enable_syntax_highlighting=True),
-            'csv': CsvReporter(self.config_manager)
-        }
+        # Reporters are imported and constructed on first use of their format
+        self.reporters = ReporterRegistry(self.config_manager, {
+            'html': {'enable_syntax_highlighting': True}
+        })
         
         # Data storage
         self.code_files: List[CodeFileAnalysis] = []
         self.documentation_files: Dict[str, str] = {}
         self.quality_assessments: Dict[str, Any] = {}
+        
+        # Progress is off unless the caller sets a reporter
+        self.progress = NULL_PROGRESS
+        
+        # Keep only the most urgent gaps in reports (None keeps all)
+        self.top_k: Optional[int] = None
+    
+    def set_top_k(self, top_k: Optional[int]) -> None:
+        """Report only the top_k most urgent gaps; totals still count every gap"""
+        if top_k is not None and top_k < 1:
+            raise ValueError(f"top_k must be at least 1, not {top_k}")
+        self.top_k = top_k
+    
+    def set_progress(self, progress: Any) -> None:
+        """Report pipeline stages (walk, analyse, docs, quality, render) to a progress reporter"""
+        self.progress = progress
+        self.analyzer.progress = progress
+        self.quality_assessor.progress = progress
     
     def check_coverage(self) -> CoverageReport:
         """Perform comprehensive documentation coverage analysis"""
@@ -47,20 +64,44 @@ class DocumentationChecker:
         self.documentation_files = self.quality_assessor.find_documentation_files(self.code_files)
         print(f"📚 Found {len(self.documentation_files)} meaningful documentation files", file=sys.stderr)
         
-        # Assess documentation quality
+        return self._build_report(self.code_files)
+    
+    def _build_report(self, code_files: List[CodeFileAnalysis],
+                      qualities: Optional[Dict[str, DocumentationQuality]] = None) -> CoverageReport:
+        """Assess documentation for the given code files and aggregate the results
+        
+        Pre-measured documentation metrics can be passed in as qualities
+        (keyed by code file path); otherwise documentation files are read.
+        """
+        # Measure documentation, then score all documented files in one pass
+        if qualities is None:
+            qualities = {}
+            with self.progress.stage("quality", total=len(self.documentation_files), unit="docs") as stage:
+                for code_file in code_files:
+                    doc_path = self.documentation_files.get(code_file.path)
+                    if doc_path is not None and code_file.path not in qualities:
+                        qualities[code_file.path] = self.quality_assessor.measure_documentation(
+                            doc_path, code_file.file_type
+                        )
+                        stage.advance()
+        self.quality_assessor.score_documentation(code_files, qualities)
+        self.quality_assessments.update(qualities)
+        
+        # Build gaps; in top-K mode a bounded heap keeps only the most urgent
         gaps = []
+        top_gaps = TopK(self.top_k) if self.top_k else None
+        gap_file_types = []
+        gap_priorities = []
+        gap_types = []
         adequately_documented = 0
         total_quality_score = 0.0
+        min_quality = self.config_manager.config["documentation_standards"]["minimum_quality_score"]
         
-        for code_file in self.code_files:
-            if code_file.path in self.documentation_files:
+        for code_file in code_files:
+            if code_file.path in qualities:
                 doc_path = self.documentation_files[code_file.path]
-                quality = self.quality_assessor.assess_documentation_quality(
-                    doc_path, code_file.file_type, code_file.priority
-                )
-                self.quality_assessments[code_file.path] = quality
+                quality = qualities[code_file.path]
                 
-                min_quality = self.config_manager.config["documentation_standards"]["minimum_quality_score"]
                 if quality.quality_score >= min_quality:
                     adequately_documented += 1
                 else:
@@ -68,13 +109,19 @@ class DocumentationChecker:
                     gap = DocumentationGap(
                         code_file=code_file.path,
                         expected_doc_path=doc_path,
-                        gap_type="inadequate",
+                        gap_type=GapType.INADEQUATE,
                         priority=code_file.priority,
-                        required_sections=self.config_manager.config["documentation_standards"]["required_sections"].get(code_file.file_type, []),
+                        required_sections=self._required_sections_for(code_file.file_type),
                         quality_issues=quality.missing_sections or [],
                         estimated_effort=self.quality_assessor.estimate_effort(quality, code_file)
                     )
-                    gaps.append(gap)
+                    if top_gaps is None:
+                        gaps.append(gap)
+                    else:
+                        top_gaps.push(urgency_key(code_file, gap.estimated_effort), gap)
+                    gap_file_types.append(code_file.file_type)
+                    gap_priorities.append(gap.priority)
+                    gap_types.append(GapType.INADEQUATE)
                 
                 total_quality_score += quality.quality_score
             else:
@@ -83,47 +130,52 @@ class DocumentationChecker:
                 gap = DocumentationGap(
                     code_file=code_file.path,
                     expected_doc_path=expected_doc_path,
-                    gap_type="missing",
+                    gap_type=GapType.MISSING,
                     priority=code_file.priority,
-                    required_sections=self.config_manager.config["documentation_standards"]["required_sections"].get(code_file.file_type, []),
+                    required_sections=self._required_sections_for(code_file.file_type),
                     quality_issues=["Documentation file does not exist"],
                     estimated_effort=self.quality_assessor.estimate_effort_for_missing(code_file)
                 )
-                gaps.append(gap)
+                if top_gaps is None:
+                    gaps.append(gap)
+                else:
+                    top_gaps.push(urgency_key(code_file, gap.estimated_effort), gap)
+                gap_file_types.append(code_file.file_type)
+                gap_priorities.append(gap.priority)
+                gap_types.append(GapType.MISSING)
         
         # Calculate metrics
         documented_files = len(self.documentation_files)
-        total_files = len(self.code_files)
+        total_files = len(code_files)
         coverage_percentage = (adequately_documented / total_files * 100) if total_files > 0 else 100
         average_quality = (total_quality_score / documented_files) if documented_files > 0 else 0.0
         
-        # Group by priority and file type
-        by_priority = {"critical": 0, "high": 0, "medium": 0, "low": 0}
-        by_file_type = {}
-        
-        for gap in gaps:
-            by_priority[gap.priority] += 1
-            
-            file_type = next((cf.file_type for cf in self.code_files if cf.path == gap.code_file), "unknown")
-            if file_type not in by_file_type:
-                by_file_type[file_type] = {"missing": 0, "inadequate": 0}
-            
-            by_file_type[file_type][gap.gap_type] += 1
+        # Group by priority and file type (over every gap, also in top-K mode)
+        by_priority, by_file_type = aggregate_gaps(gap_file_types, gap_priorities, gap_types)
+        missing_documentation = sum(by_type[GapType.MISSING.value] for by_type in by_file_type.values())
+        if top_gaps is not None:
+            gaps = top_gaps.items()
         
         return CoverageReport(
             total_code_files=total_files,
             documented_files=documented_files,
             adequately_documented=adequately_documented,
-            missing_documentation=len([g for g in gaps if g.gap_type == "missing"]),
-            inadequate_documentation=len([g for g in gaps if g.gap_type == "inadequate"]),
+            missing_documentation=missing_documentation,
+            inadequate_documentation=len(gap_types) - missing_documentation,
             coverage_percentage=coverage_percentage,
             quality_score=average_quality,
             gaps=gaps,
             by_priority=by_priority,
             by_file_type=by_file_type,
-            timestamp=datetime.now().isoformat()
+            timestamp=datetime.now().isoformat(),
+            top_k=self.top_k
         )
     
+    def _required_sections_for(self, file_type: str) -> Tuple[str, ...]:
+        """Get the shared required-sections tuple for a file type"""
+        sections = self.config_manager.config["documentation_standards"]["required_sections"].get(file_type, [])
+        return shared_sections(sections)
+    
     def generate_report(self, report: CoverageReport, format: str = "console") -> str:
         """Generate comprehensive coverage report"""
         if format not in self.reporters:
@@ -132,10 +184,13 @@ class DocumentationChecker:
         reporter = self.reporters[format]
         
         # Set code files for CSV and HTML reporters (needed for detailed analysis)
-        if format in ["csv", "html"]:
+        if format in ["csv", "xlsx", "ndjson", "html", "html-site"]:
             reporter.set_code_files(self.code_files)
+        if format in ["csv", "xlsx", "ndjson"]:
+            reporter.set_quality_assessments(self.quality_assessments, self.documentation_files)
         
-        return reporter.generate(report)
+        with self.progress.stage("render", heartbeat=True):
+            return reporter.generate(report)
     
     def set_threshold(self, key: str, value: Any) -> None:
         """Set configuration threshold (for CLI overrides)"""
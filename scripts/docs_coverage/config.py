@@ -95,6 +95,41 @@ class ConfigManager:
                 "centralized_patterns": [
                     "docs/**/*.md"
                 ]
+            },
+            "progress": {
+                "mode": "auto",
+                "log_interval_seconds": 10
+            },
+            "reporting": {
+                "html": {
+                    "source_embedding": "compact",
+                    "max_source_file_kb": 256,
+                    "max_embedded_source_kb": None,
+                    "asset_cache_dir": ".docs-coverage-cache/html-assets",
+                    "minify_assets": True,
+                    "source_sidecar_dir": "docs-coverage-sources",
+                    "fragment_cache_dir": None,
+                    "syntax_highlighting": "deferred",
+                    "pretokenize_min_kb": 16
+                },
+                "html_site": {
+                    "directory_depth": 2,
+                    "max_gaps_per_page": 500,
+                    "workers": None
+                },
+                "csv": {
+                    "output_dir": None,
+                    "buffer_kb": 256
+                },
+                "markdown": {
+                    "max_comment_chars": 60000
+                },
+                "markdown_site": {
+                    "split_by": "priority",
+                    "directory_depth": 2,
+                    "max_gaps_per_page": 500,
+                    "max_page_kb": 100
+                }
             }
         }
     
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Early-exit coverage gate for CI
+
+Processes code files one at a time while tracking the lowest and highest
+coverage still achievable given the files not yet seen, and stops as soon as
+the minimum coverage is either guaranteed or out of reach. No reports are
+generated; the result is a minimal pass/fail summary.
+"""
+
+import sys
+import time
+from dataclasses import dataclass, asdict
+from typing import Dict, Tuple
+
+from .checker import DocumentationChecker
+from .models import CodeFileAnalysis, Language
+from .quality import QualityAssessor
+
+
+@dataclass(slots=True)
+class GateResult:
+    """Outcome of an early-exit coverage gate"""
+    passed: bool
+    decided_early: bool
+    minimum_coverage_percentage: float
+    coverage_bounds: Tuple[float, float]
+    files_processed: int
+    files_total: int
+    requiring_documentation: int
+    adequately_documented: int
+    elapsed_seconds: float
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for JSON serialization"""
+        return {"mode": "fail-fast", **asdict(self)}
+
+
+def coverage_bounds(adequate: int, required: int, remaining: int) -> Tuple[float, float]:
+    """Lowest and highest final coverage percentage still achievable
+
+    The worst case is every remaining file requiring documentation and lacking
+    it; the best case is every remaining file being adequately documented.
+    With nothing left to process both bounds equal the final coverage, which
+    the checker reports as 100% when no file requires documentation.
+    """
+    if required + remaining == 0:
+        return 100.0, 100.0
+    low = adequate / (required + remaining) * 100
+    high = (adequate + remaining) / (required + remaining) * 100
+    return low, high
+
+
+def run_coverage_gate(checker: DocumentationChecker) -> GateResult:
+    """Check minimum_coverage_percentage, stopping as soon as the outcome is known"""
+    start = time.perf_counter()
+    min_coverage = checker.config_manager.config["documentation_standards"]["minimum_coverage_percentage"]
+    min_quality = checker.config_manager.config["documentation_standards"]["minimum_quality_score"]
+    analyzer = checker.analyzer
+    assessor = checker.quality_assessor
+
+    paths = analyzer.discover_code_files()
+    total = len(paths)
+    # Overlapping file patterns list some paths more than once; each occurrence
+    # counts towards coverage, but a file is only assessed once
+    outcomes: Dict[str, Tuple[bool, bool]] = {}
+    adequate = required = processed = 0
+    low, high = coverage_bounds(0, 0, total)
+
+    for path in paths:
+        if low >= min_coverage or high < min_coverage:
+            break
+
+        if path not in outcomes:
+            outcomes[path] = _assess_file(assessor, analyzer._analyze_typescript_file(path), min_quality)
+        is_required, is_adequate = outcomes[path]
+        required += is_required
+        adequate += is_adequate
+        processed += 1
+        low, high = coverage_bounds(adequate, required, total - processed)
+
+    passed = low >= min_coverage
+    print(f"🚦 Gate {'passed' if passed else 'failed'} after {processed:,} of {total:,} files "
+          f"(coverage bounds {low:.1f}% – {high:.1f}%, minimum {min_coverage}%)", file=sys.stderr)
+
+    return GateResult(
+        passed=passed,
+        decided_early=processed < total,
+        minimum_coverage_percentage=min_coverage,
+        coverage_bounds=(low, high),
+        files_processed=processed,
+        files_total=total,
+        requiring_documentation=required,
+        adequately_documented=adequate,
+        elapsed_seconds=round(time.perf_counter() - start, 3)
+    )
+
+
+def _assess_file(assessor: QualityAssessor, analysis: CodeFileAnalysis,
+                 min_quality: float) -> Tuple[bool, bool]:
+    """Return (requires documentation, adequately documented) for one analysed file"""
+    # Unreadable files never require documentation
+    if analysis.language == Language.UNKNOWN or not analysis.documentation_required:
+        return False, False
+
+    doc_path = assessor.find_documentation_files([analysis]).get(analysis.path)
+    if doc_path is None:
+        return True, False
+
+    quality = assessor.assess_documentation_quality(
+        doc_path, analysis.file_type, analysis.priority
+    )
+    return True, quality.quality_score >= min_quality
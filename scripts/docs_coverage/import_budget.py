@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Import-time budget for the JSON and console paths
+
+Hook and gate runs are dominated by interpreter startup, so the imports of a
+JSON or console run are measured with `python -X importtime` in a fresh
+interpreter. The check is deterministic: it fails if a reporter for another
+format (in particular any HTML component) or NumPy is loaded, or if more of
+the package's own modules are imported than the cap allows. Import time is
+reported for information and only enforced when a budget is given, since
+wall-clock timings vary too much between CI machines to gate on by default.
+"""
+
+import subprocess
+import sys
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# What a JSON or console run imports before analysing files
+JSON_CONSOLE_IMPORTS = (
+    "from docs_coverage import DocumentationChecker\n"
+    "from docs_coverage.reports import get_reporter_class\n"
+    "get_reporter_class('json')\n"
+    "get_reporter_class('console')\n"
+)
+
+# Modules (and their submodules) that must not be loaded on that path
+FORBIDDEN_MODULES = (
+    "docs_coverage.reports.html",
+    "docs_coverage.reports.html_components",
+    "docs_coverage.reports.html_site",
+    "docs_coverage.reports.csv",
+    "docs_coverage.reports.markdown",
+    "docs_coverage.reports.markdown_site",
+    "docs_coverage.reports.ndjson",
+    "docs_coverage.reports.output_files",
+    "docs_coverage.reports.xlsx",
+    # Loaded on first use by metrics.get_numpy(), i.e. only once files are analysed
+    "numpy",
+)
+
+PACKAGE = "docs_coverage"
+# The JSON/console path imports 11 package modules; the cap leaves room for a few more
+DEFAULT_MAX_PACKAGE_MODULES = 14
+
+
+@dataclass(slots=True)
+class ImportBudgetResult:
+    """Outcome of an import-time budget check"""
+    passed: bool
+    package_modules: int
+    max_package_modules: int
+    budget_ms: Optional[float]
+    package_ms: float
+    total_ms: float
+    forbidden_imports: List[str]
+    slowest_modules: List[Tuple[str, float]]
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for JSON serialization"""
+        return {"mode": "import-budget", **asdict(self)}
+
+
+def measure_imports(code: str = JSON_CONSOLE_IMPORTS) -> List[Tuple[str, int, int, int]]:
+    """Run code in a fresh interpreter with -X importtime
+
+    Returns (module, depth, self_us, cumulative_us) for every import, in the
+    order the interpreter reports them.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=Path(__file__).parent.parent, capture_output=True, text=True, check=True
+    )
+
+    imports = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # header line
+        name = fields[2].rstrip()
+        depth = (len(name) - len(name.lstrip())) // 2
+        imports.append((name.strip(), depth, int(fields[0]), int(fields[1])))
+    return imports
+
+
+def run_import_budget(max_package_modules: int = DEFAULT_MAX_PACKAGE_MODULES,
+                      budget_ms: Optional[float] = None, runs: int = 5) -> ImportBudgetResult:
+    """Check the JSON/console import path against the module cap and optional budget
+
+    The package's import time is the best of several runs, so a single slow
+    run on a busy CI machine does not fail a check with an explicit budget.
+    """
+    best = None
+    for _ in range(max(1, runs)):
+        imports = measure_imports()
+        package_us = sum(self_us for name, _, self_us, _ in imports if name.split(".")[0] == PACKAGE)
+        if best is None or package_us < best[0]:
+            best = (package_us, imports)
+
+    package_us, imports = best
+    forbidden = sorted({
+        name for name, _, _, _ in imports
+        if any(name == module or name.startswith(module + ".") for module in FORBIDDEN_MODULES)
+    })
+    package_modules = len({name for name, _, _, _ in imports if name.split(".")[0] == PACKAGE})
+    total_us = sum(cumulative_us for _, depth, _, cumulative_us in imports if depth == 0)
+    slowest = sorted(
+        ((name, self_us / 1000) for name, _, self_us, _ in imports if name.split(".")[0] == PACKAGE),
+        key=lambda item: -item[1]
+    )[:5]
+
+    package_ms = package_us / 1000
+    return ImportBudgetResult(
+        passed=(not forbidden and package_modules <= max_package_modules
+                and (budget_ms is None or package_ms <= budget_ms)),
+        package_modules=package_modules,
+        max_package_modules=max_package_modules,
+        budget_ms=budget_ms,
+        package_ms=round(package_ms, 2),
+        total_ms=round(total_us / 1000, 2),
+        forbidden_imports=forbidden,
+        slowest_modules=[(name, round(ms, 2)) for name, ms in slowest]
+    )
+
+
+def print_import_budget(result: ImportBudgetResult) -> None:
+    """Print a one-line verdict to stderr"""
+    if result.forbidden_imports:
+        print(f"❌ JSON/console path imports {', '.join(result.forbidden_imports)}", file=sys.stderr)
+    verdict = "✅" if result.package_modules <= result.max_package_modules else "❌"
+    print(f"{verdict} JSON/console path imports {result.package_modules} {PACKAGE} modules "
+          f"(cap {result.max_package_modules})", file=sys.stderr)
+    if result.budget_ms is None:
+        print(f"ℹ️  {PACKAGE} imports in {result.package_ms:.1f} ms "
+              f"({result.total_ms:.1f} ms with dependencies)", file=sys.stderr)
+    else:
+        verdict = "✅" if result.package_ms <= result.budget_ms else "❌"
+        print(f"{verdict} {PACKAGE} imports in {result.package_ms:.1f} ms "
+              f"(budget {result.budget_ms:.0f} ms, {result.total_ms:.1f} ms with dependencies)", file=sys.stderr)
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Column-oriented metrics table for vectorized classification and aggregation
+
+Per-file numeric and boolean metrics are held as NumPy arrays so that the
+documentation requirement, priority, quality score and group-by aggregates
+are computed for every file at once instead of per object. NumPy is optional:
+when it is not installed, callers fall back to the scalar rules in
+CodeAnalyzer and QualityAssessor. It is imported on first use by get_numpy(),
+so importing the package (and the JSON/console path) never loads it.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .models import CodeFileAnalysis, DocumentationQuality, FileType, GapType, Priority
+
+# Stable integer codes used for the categorical columns
+FILE_TYPES: Tuple[FileType, ...] = tuple(FileType)
+FILE_TYPE_CODES: Dict[str, int] = {file_type: code for code, file_type in enumerate(FILE_TYPES)}
+PRIORITIES: Tuple[Priority, ...] = (Priority.CRITICAL, Priority.HIGH, Priority.MEDIUM, Priority.LOW)
+PRIORITY_CODES: Dict[str, int] = {priority: code for code, priority in enumerate(PRIORITIES)}
+GAP_TYPES: Tuple[GapType, ...] = (GapType.MISSING, GapType.INADEQUATE)
+
+# Set by get_numpy(); None until then, and afterwards if NumPy is not installed
+np = None
+_numpy_checked = False
+
+
+def get_numpy() -> Any:
+    """Import NumPy on first use; returns the module, or None if it is not installed"""
+    global np, _numpy_checked
+    if not _numpy_checked:
+        try:
+            import numpy
+            np = numpy
+        except ImportError:
+            np = None
+        _numpy_checked = True
+    return np
+
+
+# Quality score weights, in the order _calculate_quality_score applies them
+QUALITY_WEIGHTS = {
+    "overview": 0.2,
+    "usage": 0.25,
+    "api_reference": 0.2,
+    "examples": 0.15,
+    "proper_headings": 0.1
+}
+
+
+class MetricsTable:
+    """Per-file metrics stored as parallel NumPy columns"""
+
+    __slots__ = (
+        "size", "file_type", "complexity", "size_lines",
+        "function_count", "class_count", "type_count", "constant_count",
+        "is_public_api", "has_doc",
+        "has_overview", "has_usage_examples", "has_api_documentation",
+        "has_code_examples", "has_proper_headings", "word_count"
+    )
+
+    def __init__(self, size: int):
+        if get_numpy() is None:
+            raise RuntimeError("MetricsTable requires NumPy")
+
+        self.size = size
+        self.file_type = np.zeros(size, dtype=np.int8)
+        self.complexity = np.zeros(size, dtype=np.int64)
+        self.size_lines = np.zeros(size, dtype=np.int64)
+        self.function_count = np.zeros(size, dtype=np.int32)
+        self.class_count = np.zeros(size, dtype=np.int32)
+        self.type_count = np.zeros(size, dtype=np.int32)
+        self.constant_count = np.zeros(size, dtype=np.int32)
+        self.is_public_api = np.zeros(size, dtype=bool)
+        self.has_doc = np.zeros(size, dtype=bool)
+        self.has_overview = np.zeros(size, dtype=bool)
+        self.has_usage_examples = np.zeros(size, dtype=bool)
+        self.has_api_documentation = np.zeros(size, dtype=bool)
+        self.has_code_examples = np.zeros(size, dtype=bool)
+        self.has_proper_headings = np.zeros(size, dtype=bool)
+        self.word_count = np.zeros(size, dtype=np.int64)
+
+    @classmethod
+    def from_code_files(cls, code_files: Sequence[CodeFileAnalysis],
+                        qualities: Optional[Dict[str, DocumentationQuality]] = None) -> "MetricsTable":
+        """Build a table from analysed code files and optional documentation metrics"""
+        table = cls(len(code_files))
+        unknown = FILE_TYPE_CODES[FileType.UNKNOWN]
+
+        table.file_type[:] = [FILE_TYPE_CODES.get(cf.file_type, unknown) for cf in code_files]
+        table.complexity[:] = [cf.complexity_score for cf in code_files]
+        table.size_lines[:] = [cf.size_lines for cf in code_files]
+        table.function_count[:] = [len(cf.exported_functions) for cf in code_files]
+        table.class_count[:] = [len(cf.exported_classes) for cf in code_files]
+        table.type_count[:] = [len(cf.exported_types) for cf in code_files]
+        table.constant_count[:] = [len(cf.exported_constants) for cf in code_files]
+        table.is_public_api[:] = [cf.is_public_api for cf in code_files]
+
+        if qualities:
+            table.set_documentation([qualities.get(cf.path) for cf in code_files])
+
+        return table
+
+    def set_documentation(self, qualities: Sequence[Optional[DocumentationQuality]]) -> None:
+        """Fill the documentation columns; None marks a file without documentation"""
+        self.has_doc[:] = [q is not None for q in qualities]
+        present = [q for q in qualities if q is not None]
+        if not present:
+            return
+
+        mask = self.has_doc
+        self.has_overview[mask] = [q.has_overview for q in present]
+        self.has_usage_examples[mask] = [q.has_usage_examples for q in present]
+        self.has_api_documentation[mask] = [q.has_api_documentation for q in present]
+        self.has_code_examples[mask] = [q.has_code_examples for q in present]
+        self.has_proper_headings[mask] = [q.has_proper_headings for q in present]
+        self.word_count[mask] = [q.word_count for q in present]
+
+    def _file_type_in(self, *file_types: FileType) -> "np.ndarray":
+        """Boolean mask of rows whose file type is one of the given types"""
+        return np.isin(self.file_type, [FILE_TYPE_CODES[ft] for ft in file_types])
+
+    def _file_type_is(self, file_type: FileType) -> "np.ndarray":
+        """Boolean mask of rows with the given file type"""
+        return self.file_type == FILE_TYPE_CODES[file_type]
+
+    def requires_documentation(self, complexity_thresholds: Dict[str, int]) -> "np.ndarray":
+        """Vectorized equivalent of CodeAnalyzer._requires_documentation"""
+        functions = self.function_count
+        classes = self.class_count
+        complexity = self.complexity
+
+        # Simple API routes never require docs
+        simple_route = (self._file_type_is(FileType.API_ROUTE) & (complexity < 15)
+                        & (functions <= 2) & (classes == 0))
+
+        required = (
+            (self.is_public_api & self._file_type_in(FileType.SERVICE, FileType.COMPONENT))
+            | (complexity > complexity_thresholds["medium"])
+            | (functions + classes > 3)
+            | self._file_type_in(FileType.SERVICE, FileType.COMPONENT, FileType.HOOK,
+                                 FileType.PAGE, FileType.LAYOUT)
+            | (self._file_type_is(FileType.UTILITY) & ((complexity > 20) | (functions > 2)))
+        )
+
+        return required & ~simple_route
+
+    def priority_codes(self, complexity_thresholds: Dict[str, int]) -> "np.ndarray":
+        """Vectorized equivalent of CodeAnalyzer._determine_priority, as PRIORITIES indices"""
+        complexity = self.complexity
+        size_lines = self.size_lines
+        is_public = self.is_public_api
+
+        conditions = [
+            is_public & self._file_type_is(FileType.SERVICE) & (complexity > 30),
+            self._file_type_in(FileType.COMPONENT, FileType.PAGE, FileType.LAYOUT) & (size_lines > 300),
+            complexity > complexity_thresholds["high"],
+            self._file_type_in(FileType.COMPONENT, FileType.SERVICE, FileType.PAGE, FileType.LAYOUT) & (size_lines > 150),
+            complexity > complexity_thresholds["medium"],
+            is_public & self._file_type_in(FileType.API_ROUTE, FileType.SERVICE) & (complexity > 15),
+            self._file_type_in(FileType.HOOK, FileType.UTILITY, FileType.TEMPLATE) & is_public,
+            self._file_type_in(FileType.COMPONENT, FileType.PAGE) & (size_lines > 50),
+        ]
+        critical, high, medium = (PRIORITY_CODES[p] for p in PRIORITIES[:3])
+        choices = [critical, critical, critical, high, high, high, medium, medium]
+
+        return np.select(conditions, choices, default=PRIORITY_CODES[Priority.LOW]).astype(np.int8)
+
+    def quality_scores(self, required_sections: Dict[str, List[str]],
+                       minimum_word_count: Dict[str, int],
+                       priority_codes: "np.ndarray") -> "np.ndarray":
+        """Vectorized equivalent of QualityAssessor._calculate_quality_score
+
+        Rows without documentation score 0.0.
+        """
+        # Per-file-type lookup tables of which weighted sections are required
+        def section_lookup(section: str) -> "np.ndarray":
+            return np.array([section in required_sections.get(ft, []) for ft in FILE_TYPES], dtype=bool)
+
+        score = np.zeros(self.size, dtype=np.float64)
+        total_weight = np.zeros(self.size, dtype=np.float64)
+
+        aspects = [
+            ("overview", self.has_overview),
+            ("usage", self.has_usage_examples),
+            ("api_reference", self.has_api_documentation),
+            ("examples", self.has_code_examples),
+        ]
+        for section, present in aspects:
+            weight = QUALITY_WEIGHTS[section]
+            required = section_lookup(section)[self.file_type]
+            total_weight += np.where(required, weight, 0.0)
+            score += np.where(required & present, weight, 0.0)
+
+        total_weight += QUALITY_WEIGHTS["proper_headings"]
+        score += np.where(self.has_proper_headings, QUALITY_WEIGHTS["proper_headings"], 0.0)
+
+        # Word count penalty/bonus
+        min_words = np.array([minimum_word_count.get(p, 50) for p in PRIORITIES],
+                             dtype=np.float64)[priority_codes]
+        words = self.word_count.astype(np.float64)
+        short = words < min_words
+        long = ~short & (words > min_words * 2)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            score = np.where(short, score * (words / min_words), score)
+        score = np.where(long, np.minimum(score * 1.1, 1.0), score)
+
+        return np.where(self.has_doc, score / total_weight, 0.0)
+
+
+def empty_file_type_breakdown() -> Dict[str, int]:
+    """Zeroed per-gap-type counters for one file type"""
+    return {gap_type.value: 0 for gap_type in GAP_TYPES}
+
+
+def aggregate_gaps(file_types: Sequence[Any], priorities: Sequence[Any],
+                   gap_types: Sequence[Any]) -> Tuple[Dict[str, int], Dict[str, Dict[str, int]]]:
+    """Group gaps by priority and by file type/gap type
+
+    Returns (by_priority, by_file_type) with file types in order of first
+    appearance, matching the original per-gap loop.
+    """
+    by_priority = {priority.value: 0 for priority in PRIORITIES}
+    by_file_type: Dict[str, Dict[str, int]] = {}
+
+    if len(gap_types) and get_numpy() is not None:
+        unknown = FILE_TYPE_CODES[FileType.UNKNOWN]
+        ft_codes = np.fromiter((FILE_TYPE_CODES.get(ft, unknown) for ft in file_types),
+                               dtype=np.int8, count=len(file_types))
+        pr_codes = np.fromiter((PRIORITY_CODES[p] for p in priorities),
+                               dtype=np.int8, count=len(priorities))
+        gt_codes = np.fromiter((int(g == GapType.INADEQUATE) for g in gap_types),
+                               dtype=np.int8, count=len(gap_types))
+
+        for code, count in enumerate(np.bincount(pr_codes, minlength=len(PRIORITIES)).tolist()):
+            by_priority[PRIORITIES[code].value] = count
+
+        counts = np.zeros((len(FILE_TYPES), len(GAP_TYPES)), dtype=np.int64)
+        np.add.at(counts, (ft_codes, gt_codes), 1)
+        present, first_seen = np.unique(ft_codes, return_index=True)
+        for code in present[np.argsort(first_seen)].tolist():
+            by_file_type[FILE_TYPES[code].value] = {
+                gap_type.value: int(counts[code, i]) for i, gap_type in enumerate(GAP_TYPES)
+            }
+        return by_priority, by_file_type
+
+    for file_type, priority, gap_type in zip(file_types, priorities, gap_types):
+        by_priority[str(priority)] += 1
+        breakdown = by_file_type.setdefault(str(file_type), empty_file_type_breakdown())
+        breakdown[str(gap_type)] += 1
+
+    return by_priority, by_file_type
@@ -4,10 +4,80 @@ Data models for documentation coverage analysis
 """
 
 from dataclasses import dataclass, asdict
-from typing import Dict, List, Optional
+from enum import Enum
+from typing import Dict, Iterable, List, Optional, Tuple
 from datetime import datetime
 
-@dataclass
+
+class _StrEnum(str, Enum):
+    """String-valued enum that formats, prints and serializes as its plain value"""
+    __str__ = str.__str__
+    __format__ = str.__format__
+
+
+class FileType(_StrEnum):
+    """Kind of code file, as determined from its path"""
+    COMPONENT = "component"
+    SERVICE = "service"
+    UTILITY = "utility"
+    HOOK = "hook"
+    API_ROUTE = "api_route"
+    MIDDLEWARE = "middleware"
+    TYPES = "types"
+    PAGE = "page"
+    LAYOUT = "layout"
+    LOADING = "loading"
+    ERROR = "error"
+    NOT_FOUND = "not_found"
+    GLOBALS = "globals"
+    CONSTANTS = "constants"
+    TEMPLATE = "template"
+    UNKNOWN = "unknown"
+
+
+class Language(_StrEnum):
+    """Source language of a code file"""
+    TYPESCRIPT = "typescript"
+    TSX = "tsx"
+    UNKNOWN = "unknown"
+
+
+class Priority(_StrEnum):
+    """Documentation priority, most urgent first"""
+    CRITICAL = "critical"
+    HIGH = "high"
+    MEDIUM = "medium"
+    LOW = "low"
+
+
+class GapType(_StrEnum):
+    """Kind of documentation gap"""
+    MISSING = "missing"
+    INADEQUATE = "inadequate"
+    OUTDATED = "outdated"
+
+
+class Effort(_StrEnum):
+    """Estimated effort to close a documentation gap"""
+    LOW = "low"
+    MEDIUM = "medium"
+    HIGH = "high"
+
+
+_SECTION_TUPLES: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+def shared_sections(sections: Optional[Iterable[str]]) -> Tuple[str, ...]:
+    """Return a shared immutable tuple for a list of section names.
+
+    Equal section lists map to the same tuple object, so every gap of a given
+    file type references one tuple instead of carrying its own list copy.
+    """
+    key = tuple(sections or ())
+    return _SECTION_TUPLES.setdefault(key, key)
+
+
+@dataclass(slots=True)
 class DocumentationQuality:
     """Represents the quality metrics of a documentation file"""
     has_overview: bool = False
@@ -22,18 +92,18 @@ class DocumentationQuality:
     line_count: int = 0
     quality_score: float = 0.0
     missing_sections: Optional[List[str]] = None
-    
+
     def __post_init__(self):
         if self.missing_sections is None:
             self.missing_sections = []
 
-@dataclass
+@dataclass(slots=True)
 class CodeFileAnalysis:
     """Analysis of a code file that needs documentation"""
     path: str
     name: str
-    file_type: str
-    language: str
+    file_type: FileType
+    language: Language
     size_lines: int
     complexity_score: int
     exported_functions: List[str]
@@ -43,20 +113,49 @@ class CodeFileAnalysis:
     has_tests: bool
     is_public_api: bool
     documentation_required: bool
-    priority: str  # 'critical', 'high', 'medium', 'low'
+    priority: Priority
 
-@dataclass
+@dataclass(slots=True)
 class DocumentationGap:
     """Represents missing or inadequate documentation"""
     code_file: str
     expected_doc_path: str
-    gap_type: str  # 'missing', 'inadequate', 'outdated'
-    priority: str
-    required_sections: List[str]
+    gap_type: GapType
+    priority: Priority
+    required_sections: Tuple[str, ...]
     quality_issues: List[str]
-    estimated_effort: str  # 'low', 'medium', 'high'
+    estimated_effort: Effort
 
-@dataclass
+    def to_dict(self) -> Dict:
+        """Convert to a plain dictionary with the same JSON shape as before"""
+        return {
+            "code_file": self.code_file,
+            "expected_doc_path": self.expected_doc_path,
+            "gap_type": str(self.gap_type),
+            "priority": str(self.priority),
+            "required_sections": list(self.required_sections),
+            "quality_issues": list(self.quality_issues),
+            "estimated_effort": str(self.estimated_effort)
+        }
+
+@dataclass(slots=True)
+class SampleEstimate:
+    """Sampling details and confidence intervals for an estimated coverage report"""
+    population_files: int
+    sampled_files: int
+    strata: int
+    confidence_level: float
+    estimated_requiring_docs: float
+    coverage_interval: Tuple[float, float]
+    quality_interval: Tuple[float, float]
+
+    def describe(self) -> str:
+        """One-line description of the sample, for report headers"""
+        return (f"ESTIMATE from a stratified sample of {self.sampled_files:,} of "
+                f"{self.population_files:,} files ({self.strata} strata, "
+                f"{self.confidence_level:.0%} confidence)")
+
+@dataclass(slots=True)
 class CoverageReport:
     """Comprehensive documentation coverage report"""
     total_code_files: int
@@ -70,7 +169,28 @@ class CoverageReport:
     by_priority: Dict[str, int]
     by_file_type: Dict[str, Dict[str, int]]
     timestamp: str
+    estimate: Optional[SampleEstimate] = None
+    top_k: Optional[int] = None
+
+    @property
+    def total_gaps(self) -> int:
+        """Number of gaps found, including any left out of a top-K report"""
+        return self.missing_documentation + self.inadequate_documentation
+
+    def describe_top_k(self) -> str:
+        """One-line description of a top-K report, for report headers"""
+        return (f"TOP {len(self.gaps):,} of {self.total_gaps:,} gaps, "
+                f"ranked by priority, complexity, size and effort")
 
     def to_dict(self) -> Dict:
-        """Convert to dictionary for JSON serialization"""
-        return asdict(self) 
\ No newline at end of file
+        """Convert to dictionary for JSON serialization
+
+        The estimate key is only present for sampled (estimated) reports, and
+        the top_k key only for top-K reports.
+        """
+        data = asdict(self)
+        if self.estimate is None:
+            del data["estimate"]
+        if self.top_k is None:
+            del data["top_k"]
+        return data
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+NumPy parity check
+
+Classification, quality scoring and gap aggregation have a vectorized NumPy
+path and a pure-Python path that must reach identical verdicts. The check
+runs the same analysis in two fresh interpreters, one with NumPy importable
+and one with it blocked, and compares the reports (without their timestamp)
+plus every file's priority and quality score.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Run in a fresh interpreter: argv[1] is the config path, argv[2] is "blocked"
+# to make `import numpy` fail, argv[3] is the directory containing the package
+PARITY_RUN = (
+    "import json, sys\n"
+    "if sys.argv[2] == 'blocked':\n"
+    "    sys.modules['numpy'] = None\n"
+    "sys.path.insert(0, sys.argv[3])\n"
+    "from docs_coverage import DocumentationChecker\n"
+    "from docs_coverage.metrics import get_numpy\n"
+    "checker = DocumentationChecker(sys.argv[1])\n"
+    "report = checker.check_coverage().to_dict()\n"
+    "del report['timestamp']\n"
+    "print(json.dumps({\n"
+    "    'numpy': get_numpy() is not None,\n"
+    "    'report': report,\n"
+    "    'priorities': {cf.path: str(cf.priority) for cf in checker.code_files},\n"
+    "    'quality_scores': {path: q.quality_score for path, q in checker.quality_assessments.items()}\n"
+    "}))\n"
+)
+
+
+@dataclass(slots=True)
+class ParityResult:
+    """Outcome of a NumPy parity check"""
+    passed: bool
+    numpy_available: bool
+    files_compared: int
+    gaps_compared: int
+    differences: List[str]
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for JSON serialization"""
+        return {"mode": "numpy-parity", **asdict(self)}
+
+
+def run_analysis(config_path: str, numpy: str) -> Dict[str, Any]:
+    """Run the analysis in a fresh interpreter with numpy either present or blocked"""
+    completed = subprocess.run(
+        [sys.executable, "-c", PARITY_RUN, config_path, numpy, str(Path(__file__).parent.parent)],
+        cwd=os.getcwd(), capture_output=True, text=True, check=True
+    )
+    return json.loads(completed.stdout)
+
+
+def _diff(path: str, vectorized: Any, python: Any, differences: List[str]) -> None:
+    """Collect the paths at which two JSON values differ"""
+    if isinstance(vectorized, dict) and isinstance(python, dict):
+        for key in sorted(set(vectorized) | set(python), key=str):
+            _diff(f"{path}.{key}", vectorized.get(key), python.get(key), differences)
+    elif isinstance(vectorized, list) and isinstance(python, list):
+        if len(vectorized) != len(python):
+            differences.append(f"{path}: NumPy has {len(vectorized)} items, Python {len(python)}")
+            return
+        for index, (left, right) in enumerate(zip(vectorized, python)):
+            _diff(f"{path}[{index}]", left, right, differences)
+    elif vectorized != python:
+        differences.append(f"{path}: NumPy {json.dumps(vectorized)} != Python {json.dumps(python)}")
+
+
+def run_parity_check(config_path: str) -> ParityResult:
+    """Compare the NumPy and pure-Python analyses of the current tree"""
+    vectorized = run_analysis(config_path, "present")
+    python = run_analysis(config_path, "blocked")
+
+    differences: List[str] = []
+    for key in ("report", "priorities", "quality_scores"):
+        _diff(key, vectorized[key], python[key], differences)
+
+    return ParityResult(
+        passed=vectorized["numpy"] and not python["numpy"] and not differences,
+        numpy_available=vectorized["numpy"],
+        files_compared=len(python["priorities"]),
+        gaps_compared=len(python["report"]["gaps"]),
+        differences=differences[:20]
+    )
+
+
+def print_parity(result: ParityResult) -> None:
+    """Print a one-line verdict to stderr"""
+    if not result.numpy_available:
+        print("❌ NumPy is not installed, so only the pure-Python path ran", file=sys.stderr)
+    elif result.differences:
+        print(f"❌ NumPy and pure-Python analyses differ ({len(result.differences)} shown):", file=sys.stderr)
+        for difference in result.differences:
+            print(f"   {difference}", file=sys.stderr)
+    else:
+        print(f"✅ NumPy and pure-Python analyses agree on {result.files_compared:,} files "
+              f"and {result.gaps_compared:,} gaps", file=sys.stderr)
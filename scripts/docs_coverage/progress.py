@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Progress display for long documentation coverage runs
+
+The pipeline reports each stage (walk, analyse, docs, quality, render) to a
+progress reporter. On an interactive terminal it redraws one status line per
+stage with files/sec, bytes/sec and an ETA; elsewhere (CI logs, pipes) it
+prints a log line at most every log_interval seconds, so a long stage shows
+it is alive without flooding the log. Fast stages print nothing at all.
+
+When progress is off, every stage is the shared NULL_STAGE, whose advance()
+does nothing, so the per-file cost is one no-op method call.
+"""
+
+import os
+import shutil
+import sys
+import threading
+import time
+from typing import Optional, TextIO
+
+PROGRESS_MODES = ("auto", "bar", "log", "off")
+
+DEFAULT_LOG_INTERVAL = 10.0
+DEFAULT_REFRESH_INTERVAL = 0.1
+
+BAR_WIDTH = 20
+
+
+def format_duration(seconds: float) -> str:
+    """Format seconds as H:MM:SS."""
+    seconds = int(seconds + 0.5)
+    return f"{seconds // 3600}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+
+
+def format_bytes(count: float) -> str:
+    """Format a byte count or rate with a binary unit."""
+    for unit in ("B", "KB", "MB", "GB"):
+        if count < 1024 or unit == "GB":
+            return f"{count:.0f} {unit}" if unit == "B" else f"{count:.1f} {unit}"
+        count /= 1024
+
+
+class NullStage:
+    """A stage that records nothing; used whenever progress is off."""
+
+    __slots__ = ()
+
+    def advance(self, count: int = 1, nbytes: int = 0) -> None:
+        """Do nothing."""
+
+    def finish(self) -> None:
+        """Do nothing."""
+
+    def __enter__(self) -> "NullStage":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+NULL_STAGE = NullStage()
+
+
+class NullProgress:
+    """Progress reporter that reports nothing."""
+
+    enabled = False
+
+    def stage(self, name: str, total: Optional[int] = None, unit: str = "files",
+              heartbeat: bool = False) -> NullStage:
+        """Return the shared no-op stage."""
+        return NULL_STAGE
+
+
+NULL_PROGRESS = NullProgress()
+
+
+class ProgressStage:
+    """Counts the work done in one pipeline stage and reports it when due."""
+
+    __slots__ = ("reporter", "name", "total", "unit", "count", "nbytes",
+                 "started", "next_report", "reported", "_stopped")
+
+    def __init__(self, reporter: "ProgressReporter", name: str, total: Optional[int], unit: str,
+                 heartbeat: bool = False):
+        self.reporter = reporter
+        self.name = name
+        self.total = total
+        self.unit = unit
+        self.count = 0
+        self.nbytes = 0
+        self.started = time.monotonic()
+        self.next_report = self.started + reporter.first_delay
+        self.reported = False
+        self._stopped = None
+        if heartbeat:
+            # For stages that never call advance(), report from a background thread
+            self._stopped = threading.Event()
+            threading.Thread(target=self._beat, name=f"progress-{name}", daemon=True).start()
+
+    def advance(self, count: int = 1, nbytes: int = 0) -> None:
+        """Record count more items (and nbytes more bytes) of work."""
+        self.count += count
+        self.nbytes += nbytes
+        now = time.monotonic()
+        if now >= self.next_report:
+            self.next_report = now + self.reporter.interval
+            self.reported = True
+            self.reporter.show(self, now)
+
+    def _beat(self) -> None:
+        while not self._stopped.wait(max(self.next_report - time.monotonic(), 0.01)):
+            now = time.monotonic()
+            if now >= self.next_report:
+                self.next_report = now + self.reporter.interval
+                self.reported = True
+                self.reporter.show(self, now)
+
+    def finish(self) -> None:
+        """End the stage; a stage that was shown gets a final line."""
+        if self._stopped is not None:
+            self._stopped.set()
+        if self.reported:
+            self.reporter.done(self, time.monotonic())
+
+    def __enter__(self) -> "ProgressStage":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.finish()
+
+    def describe(self, now: float, final: bool = False) -> str:
+        """One-line status: count, percentage, rates and ETA (or elapsed time when final)."""
+        elapsed = max(now - self.started, 1e-6)
+        rate = self.count / elapsed
+
+        parts = []
+        if self.total:
+            parts.append(f"{self.count:,}/{self.total:,} {self.unit} ({self.count * 100 // self.total}%)")
+        elif self.count:
+            parts.append(f"{self.count:,} {self.unit}")
+        if self.count:
+            parts.append(f"{rate:,.0f} {self.unit}/s")
+        if self.nbytes:
+            parts.append(f"{format_bytes(self.nbytes / elapsed)}/s")
+        if final:
+            parts.append(f"in {format_duration(elapsed)}")
+        elif self.total and rate > 0:
+            parts.append(f"ETA {format_duration(max(self.total - self.count, 0) / rate)}")
+        else:
+            parts.append(f"elapsed {format_duration(elapsed)}")
+        return ", ".join(parts)
+
+
+class ProgressReporter:
+    """Reports pipeline stages as a redrawn bar (terminals) or periodic log lines."""
+
+    enabled = True
+
+    def __init__(self, mode: str = "auto", stream: Optional[TextIO] = None,
+                 log_interval: float = DEFAULT_LOG_INTERVAL):
+        """Initialize the reporter.
+
+        Args:
+            mode: "bar", "log", or "auto" (bar on an interactive terminal outside CI)
+            stream: Output stream (default: stderr)
+            log_interval: Seconds between log lines, and before the first one
+        """
+        self.stream = stream or sys.stderr
+        if mode == "auto":
+            is_terminal = hasattr(self.stream, "isatty") and self.stream.isatty()
+            mode = "bar" if is_terminal and not os.environ.get("CI") else "log"
+        self.mode = mode
+        # A bar appears after a short delay and redraws often; logs wait a full interval
+        self.interval = DEFAULT_REFRESH_INTERVAL if mode == "bar" else log_interval
+        self.first_delay = 0.5 if mode == "bar" else log_interval
+
+    def stage(self, name: str, total: Optional[int] = None, unit: str = "files",
+              heartbeat: bool = False) -> ProgressStage:
+        """Start a stage; total enables the percentage and ETA.
+
+        A heartbeat stage is reported on a timer, for work that cannot call
+        advance() (such as rendering a report).
+        """
+        return ProgressStage(self, name, total, unit, heartbeat)
+
+    def show(self, stage: ProgressStage, now: float) -> None:
+        """Report a running stage."""
+        if self.mode == "bar":
+            self._draw(f"⏳ {stage.name:<8} {self._bar(stage)}{stage.describe(now)}")
+        else:
+            print(f"⏳ {stage.name}: {stage.describe(now)}", file=self.stream, flush=True)
+
+    def done(self, stage: ProgressStage, now: float) -> None:
+        """Report a finished stage that was shown while running."""
+        if self.mode == "bar":
+            self._draw("")
+        print(f"✅ {stage.name}: {stage.describe(now, final=True)}", file=self.stream, flush=True)
+
+    def _bar(self, stage: ProgressStage) -> str:
+        if not stage.total:
+            return ""
+        filled = min(BAR_WIDTH, stage.count * BAR_WIDTH // stage.total)
+        return "█" * filled + "░" * (BAR_WIDTH - filled) + " "
+
+    def _draw(self, line: str) -> None:
+        # Redraw the current line, cut to the terminal width so it never wraps
+        width = shutil.get_terminal_size().columns - 1
+        self.stream.write("\r\x1b[K" + line[:width])
+        self.stream.flush()
+
+
+def create_progress(mode: str = "auto", log_interval: float = DEFAULT_LOG_INTERVAL):
+    """Return a progress reporter for a mode, or NULL_PROGRESS when it is "off"."""
+    if mode not in PROGRESS_MODES:
+        raise ValueError(f"Unknown progress mode {mode!r}; expected one of {', '.join(PROGRESS_MODES)}")
+    if mode == "off":
+        return NULL_PROGRESS
+    return ProgressReporter(mode, log_interval=log_interval)
@@ -6,38 +6,54 @@ Documentation quality assessment module
 import os
 import sys
 import re
-from typing import Dict, List
+from typing import Dict, List, Optional
 
-from .models import DocumentationQuality, CodeFileAnalysis
+from .models import DocumentationQuality, CodeFileAnalysis, Effort, Priority
 from .config import ConfigManager
+from .metrics import MetricsTable, PRIORITY_CODES, get_numpy
+from .progress import NULL_PROGRESS
 
 class QualityAssessor:
     """Assesses documentation quality using industry standards"""
     
+    SECTION_PATTERNS = {
+        "overview": r'##?\s*(Overview|Description|About)',
+        "usage": r'##?\s*(Usage|Getting Started|How to Use)',
+        "api_reference": r'##?\s*(API|Reference|Methods?|Props?)',
+        "examples": r'##?\s*(Examples?|Sample Code)',
+        "installation": r'##?\s*(Installation|Setup)',
+        "configuration": r'##?\s*(Configuration|Config|Options)',
+        "troubleshooting": r'##?\s*(Troubleshooting|FAQ|Common Issues)',
+        "props": r'##?\s*(Props|Properties|Parameters)'
+    }
+    
     def __init__(self, config_manager: ConfigManager):
         self.config = config_manager.config
+        self.progress = NULL_PROGRESS
     
     def find_documentation_files(self, code_files: List[CodeFileAnalysis]) -> Dict[str, str]:
         """Find all documentation files and map them to code files"""
         doc_files = {}
         
         # Find co-located documentation
-        for code_file in code_files:
-            file_dir = os.path.dirname(code_file.path)
-            basename = os.path.splitext(os.path.basename(code_file.path))[0]
-            
-            # Check for co-located documentation in priority order
-            for doc_pattern in self.config["documentation_discovery"]["co_located_patterns"]:
-                # Handle dynamic basename pattern
-                if "{basename}" in doc_pattern:
-                    doc_filename = doc_pattern.replace("{basename}", basename)
-                else:
-                    doc_filename = doc_pattern
+        with self.progress.stage("docs", total=len(code_files)) as stage:
+            for code_file in code_files:
+                stage.advance()
+                file_dir = os.path.dirname(code_file.path)
+                basename = os.path.splitext(os.path.basename(code_file.path))[0]
                 
-                doc_path = os.path.join(file_dir, doc_filename)
-                if os.path.exists(doc_path) and self._is_meaningful_documentation(doc_path):
-                    doc_files[code_file.path] = doc_path
-                    break
+                # Check for co-located documentation in priority order
+                for doc_pattern in self.config["documentation_discovery"]["co_located_patterns"]:
+                    # Handle dynamic basename pattern
+                    if "{basename}" in doc_pattern:
+                        doc_filename = doc_pattern.replace("{basename}", basename)
+                    else:
+                        doc_filename = doc_pattern
+                    
+                    doc_path = os.path.join(file_dir, doc_filename)
+                    if os.path.exists(doc_path) and self._is_meaningful_documentation(doc_path):
+                        doc_files[code_file.path] = doc_path
+                        break
         
         return doc_files
     
@@ -85,13 +101,32 @@ class QualityAssessor:
     def assess_documentation_quality(self, doc_path: str, file_type: str, 
                                    priority: str) -> DocumentationQuality:
         """Assess the quality of documentation using industry standards"""
+        quality = self.measure_documentation(doc_path, file_type)
+        quality.quality_score = self._calculate_quality_score(quality, file_type, priority)
+        return quality
+    
+    def measure_documentation(self, doc_path: str, file_type: str) -> DocumentationQuality:
+        """Collect raw documentation metrics (section flags, word counts, missing sections)
+        
+        The quality score is left at 0.0; use assess_documentation_quality() or
+        score_documentation() to derive it.
+        """
+        content = self.read_documentation(doc_path)
+        if content is None:
+            return DocumentationQuality()
+        return self.measure_content(content, file_type)
+    
+    def read_documentation(self, doc_path: str) -> Optional[str]:
+        """Read a documentation file, returning None if it cannot be read"""
         try:
             with open(doc_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+                return f.read()
         except Exception as e:
             print(f"⚠️  Error reading {doc_path}: {e}", file=sys.stderr)
-            return DocumentationQuality()
-        
+            return None
+    
+    def measure_content(self, content: str, file_type: str) -> DocumentationQuality:
+        """Collect raw documentation metrics from already-read content"""
         # Basic metrics
         word_count = len(content.split())
         line_count = len(content.splitlines())
@@ -125,15 +160,43 @@ class QualityAssessor:
         # Check for proper heading structure
         quality.has_proper_headings = bool(re.search(r'##?\s+\w+', content))
         
-        # Calculate quality score
-        quality.quality_score = self._calculate_quality_score(quality, file_type, priority)
-        
         # Identify missing sections
         required_sections = self.config["documentation_standards"]["required_sections"].get(file_type, [])
         quality.missing_sections = self._identify_missing_sections(content, required_sections)
         
         return quality
     
+    def score_documentation(self, code_files: List[CodeFileAnalysis],
+                            qualities: Dict[str, DocumentationQuality]) -> None:
+        """Set quality_score on every measured documentation file
+        
+        Scores are computed in one vectorized pass when NumPy is available
+        and per file otherwise; both produce identical results.
+        """
+        documented = [cf for cf in code_files if cf.path in qualities]
+        if not documented:
+            return
+        
+        np = get_numpy()
+        if np is None:
+            for code_file in documented:
+                quality = qualities[code_file.path]
+                quality.quality_score = self._calculate_quality_score(
+                    quality, code_file.file_type, code_file.priority
+                )
+            return
+        
+        standards = self.config["documentation_standards"]
+        table = MetricsTable.from_code_files(documented, qualities)
+        priority_codes = np.fromiter((PRIORITY_CODES[cf.priority] for cf in documented),
+                                     dtype=np.int8, count=len(documented))
+        scores = table.quality_scores(
+            standards["required_sections"], standards["minimum_word_count"], priority_codes
+        ).tolist()
+        
+        for code_file, score in zip(documented, scores):
+            qualities[code_file.path].quality_score = score
+    
     def _calculate_quality_score(self, quality: DocumentationQuality, 
                                file_type: str, priority: str) -> float:
         """Calculate documentation quality score (0.0 to 1.0)"""
@@ -190,25 +253,21 @@ class QualityAssessor:
     
     def _identify_missing_sections(self, content: str, required_sections: List[str]) -> List[str]:
         """Identify missing required sections"""
-        missing = []
-        
-        section_patterns = {
-            "overview": r'##?\s*(Overview|Description|About)',
-            "usage": r'##?\s*(Usage|Getting Started|How to Use)',
-            "api_reference": r'##?\s*(API|Reference|Methods?|Props?)',
-            "examples": r'##?\s*(Examples?|Sample Code)',
-            "installation": r'##?\s*(Installation|Setup)',
-            "configuration": r'##?\s*(Configuration|Config|Options)',
-            "troubleshooting": r'##?\s*(Troubleshooting|FAQ|Common Issues)',
-            "props": r'##?\s*(Props|Properties|Parameters)'
-        }
-        
-        for section in required_sections:
-            pattern = section_patterns.get(section)
-            if pattern and not re.search(pattern, content, re.IGNORECASE):
-                missing.append(section)
-        
-        return missing
+        return self.missing_sections(self.detect_sections(content), required_sections)
+    
+    def detect_sections(self, content: str) -> List[str]:
+        """List every known section whose heading appears in the content"""
+        return [
+            section for section, pattern in self.SECTION_PATTERNS.items()
+            if re.search(pattern, content, re.IGNORECASE)
+        ]
+    
+    def missing_sections(self, present_sections: List[str], required_sections: List[str]) -> List[str]:
+        """List required sections that are known but not present"""
+        return [
+            section for section in required_sections
+            if section in self.SECTION_PATTERNS and section not in present_sections
+        ]
     
     def get_expected_doc_path(self, code_file: CodeFileAnalysis) -> str:
         """Get the expected documentation path for a code file"""
@@ -226,20 +285,20 @@ class QualityAssessor:
         
         return os.path.join(file_dir, doc_filename)
     
-    def estimate_effort(self, quality: DocumentationQuality, code_file: CodeFileAnalysis) -> str:
+    def estimate_effort(self, quality: DocumentationQuality, code_file: CodeFileAnalysis) -> Effort:
         """Estimate effort to improve documentation"""
         if quality.quality_score < 0.3:
-            return "high"
+            return Effort.HIGH
         elif quality.quality_score < 0.6:
-            return "medium"
+            return Effort.MEDIUM
         else:
-            return "low"
+            return Effort.LOW
     
-    def estimate_effort_for_missing(self, code_file: CodeFileAnalysis) -> str:
+    def estimate_effort_for_missing(self, code_file: CodeFileAnalysis) -> Effort:
         """Estimate effort to create missing documentation"""
-        if code_file.priority == "critical":
-            return "high"
-        elif code_file.priority == "high":
-            return "medium"
+        if code_file.priority == Priority.CRITICAL:
+            return Effort.HIGH
+        elif code_file.priority == Priority.HIGH:
+            return Effort.MEDIUM
         else:
-            return "low" 
\ No newline at end of file
+            return Effort.LOW 
\ No newline at end of file
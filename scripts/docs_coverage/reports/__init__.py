@@ -1,18 +1,103 @@
 #!/usr/bin/env python3
 """
 Report generators for documentation coverage analysis
+
+Reporter modules are imported only when their format is first used, so a
+JSON or console run never loads the HTML components.
 """
 
-from .console import ConsoleReporter
-from .json import JsonReporter
-from .markdown import MarkdownReporter
-from .html import HtmlReporter
-from .csv import CsvReporter
+from collections.abc import Mapping
+from importlib import import_module
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# Reporter class for each output format, as (module, class name)
+REPORTER_CLASSES: Dict[str, Tuple[str, str]] = {
+    'console': ('.console', 'ConsoleReporter'),
+    'json': ('.json', 'JsonReporter'),
+    'ndjson': ('.ndjson', 'NdjsonReporter'),
+    'markdown': ('.markdown', 'MarkdownReporter'),
+    'markdown-site': ('.markdown_site', 'MarkdownSiteReporter'),
+    'markdown-comment': ('.markdown', 'MarkdownCommentReporter'),
+    'html': ('.html', 'HtmlReporter'),
+    'html-site': ('.html_site', 'HtmlSiteReporter'),
+    'csv': ('.csv', 'CsvReporter'),
+    'xlsx': ('.xlsx', 'XlsxReporter')
+}
+
+
+def get_reporter_class(format: str) -> type:
+    """Import and return the reporter class for an output format."""
+    module_name, class_name = REPORTER_CLASSES[format]
+    return getattr(import_module(module_name, __name__), class_name)
+
+
+class ReporterRegistry(Mapping):
+    """Output format to reporter mapping that constructs each reporter on first access."""
+
+    def __init__(self, config_manager: Any, options: Optional[Dict[str, Dict[str, Any]]] = None):
+        """Initialize the registry.
+
+        Args:
+            config_manager: Configuration passed to every reporter
+            options: Extra constructor keyword arguments per format
+        """
+        self.config_manager = config_manager
+        self.options = options or {}
+        self._reporters: Dict[str, Any] = {}
+        self._setup_hooks: List[Callable[[Any], None]] = []
+
+    def __getitem__(self, format: str) -> Any:
+        reporter = self._reporters.get(format)
+        if reporter is None:
+            if format not in REPORTER_CLASSES:
+                raise KeyError(format)
+            reporter = get_reporter_class(format)(self.config_manager, **self.options.get(format, {}))
+            for hook in self._setup_hooks:
+                hook(reporter)
+            self._reporters[format] = reporter
+        return reporter
+
+    def __contains__(self, format: object) -> bool:
+        # Checking a format must not construct its reporter
+        return format in REPORTER_CLASSES
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(REPORTER_CLASSES)
+
+    def __len__(self) -> int:
+        return len(REPORTER_CLASSES)
+
+    def add_setup(self, hook: Callable[[Any], None]) -> None:
+        """Run hook on every reporter, now for those already built and later as each is built."""
+        self._setup_hooks.append(hook)
+        for reporter in self._reporters.values():
+            hook(reporter)
+
+    def loaded(self) -> Dict[str, Any]:
+        """Return the reporters constructed so far."""
+        return dict(self._reporters)
+
+
+def __getattr__(name: str) -> type:
+    # Reporter classes are re-exported lazily (PEP 562)
+    for format, (_, class_name) in REPORTER_CLASSES.items():
+        if class_name == name:
+            return get_reporter_class(format)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     'ConsoleReporter',
-    'JsonReporter', 
+    'JsonReporter',
+    'NdjsonReporter',
     'MarkdownReporter',
+    'MarkdownSiteReporter',
+    'MarkdownCommentReporter',
     'HtmlReporter',
-    'CsvReporter'
-] 
\ No newline at end of file
+    'HtmlSiteReporter',
+    'CsvReporter',
+    'XlsxReporter',
+    'REPORTER_CLASSES',
+    'ReporterRegistry',
+    'get_reporter_class'
+]
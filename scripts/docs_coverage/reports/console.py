@@ -58,6 +58,15 @@ class ConsoleReporter:
         
         output.append(f"{status_emoji} **Coverage**: {report.coverage_percentage:.1f}% ({report.adequately_documented}/{report.total_code_files} files)")
         output.append(f"{quality_emoji} **Quality Score**: {report.quality_score:.2f}/1.0")
+        if report.estimate:
+            estimate = report.estimate
+            coverage_low, coverage_high = estimate.coverage_interval
+            quality_low, quality_high = estimate.quality_interval
+            output.append(f"🎲 **{estimate.describe()}**")
+            output.append(f"   Coverage CI: {coverage_low:.1f}% – {coverage_high:.1f}% · Quality CI: {quality_low:.2f} – {quality_high:.2f}")
+            output.append(f"   Counts below cover sampled files only (~{estimate.estimated_requiring_docs:,.0f} files estimated to require documentation)")
+        if report.top_k:
+            output.append(f"🔝 **{report.describe_top_k()}**")
         output.append(f"📝 **Missing Documentation**: {report.missing_documentation} files")
         output.append(f"⚠️  **Inadequate Documentation**: {report.inadequate_documentation} files")
         output.append("")
@@ -7,12 +7,15 @@ optimized for Excel and Google Sheets, using Idling.app's product color palette.
 """
 
 import csv
-import json
+from contextlib import ExitStack
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-from ..models import CoverageReport, DocumentationGap
+from typing import Dict, Iterable, List, Any, Optional
+from ..models import CodeFileAnalysis, CoverageReport, DocumentationGap, DocumentationQuality
 from ..config import ConfigManager
 
+# Sheets written next to the main report, as <prefix>-<sheet>.csv
+SECONDARY_SHEETS = ('detailed', 'priorities', 'recommendations', 'files')
+
 class CsvReporter:
     """Generates color-enhanced CSV reports with product-aligned formatting."""
     
@@ -20,6 +23,13 @@ class CsvReporter:
         self.config = config_manager.config
         self.output_file = Path("documentation-coverage-report.csv")
         self.pr_context = None
+        self.code_files: List[CodeFileAnalysis] = []
+        self.quality_assessments: Dict[str, DocumentationQuality] = {}
+        self.documentation_files: Dict[str, str] = {}
+        
+        csv_config = self.config.get("reporting", {}).get("csv", {})
+        self.output_dir = csv_config.get("output_dir")
+        self.buffer_size = int(csv_config.get("buffer_kb", 256)) * 1024
         
         # Idling.app Product Colors (hex values for spreadsheet compatibility)
         self.colors = {
@@ -40,196 +50,272 @@ class CsvReporter:
         """Set custom output filename."""
         self.output_file = Path(output_file)
     
+    def set_output_dir(self, output_dir: Optional[str]) -> None:
+        """Set the directory for all sheets (default: the main report's directory)."""
+        self.output_dir = output_dir
+    
     def set_code_files(self, code_files) -> None:
         """Set code files for detailed analysis."""
         self.code_files = code_files
     
+    def set_quality_assessments(self, quality_assessments: Dict[str, DocumentationQuality],
+                                documentation_files: Dict[str, str]) -> None:
+        """Set per-file documentation quality (keyed by code file path) for the files sheet."""
+        self.quality_assessments = quality_assessments
+        self.documentation_files = documentation_files
+    
     def set_pr_context(self, pr_context: dict) -> None:
         """Set PR context for the reporter."""
         self.pr_context = pr_context
     
-    def generate(self, report: CoverageReport) -> str:
-        """Generate the complete CSV report with enhanced formatting."""
-        # Generate multiple worksheets in CSV format
-        self._generate_main_report(report)
-        self._generate_detailed_analysis(report)
-        self._generate_priority_analysis(report)
-        self._generate_recommendations(report)
-        
-        return self._generate_console_summary(report)
+    def sheet_paths(self) -> Dict[str, Path]:
+        """Paths of the main report and each secondary sheet.
+        
+        Secondary sheets share the main file's name with '-report' dropped, so the
+        default report keeps documentation-coverage-detailed.csv and friends.
+        """
+        output_dir = Path(self.output_dir) if self.output_dir else self.output_file.parent
+        stem = self.output_file.stem
+        prefix = stem[:-len('-report')] if stem.endswith('-report') else stem
+        paths = {'main': output_dir / self.output_file.name}
+        for sheet in SECONDARY_SHEETS:
+            paths[sheet] = output_dir / f"{prefix}-{sheet}.csv"
+        return paths
     
-    def _generate_main_report(self, report: CoverageReport) -> None:
-        """Generate the main coverage report CSV."""
-        with open(self.output_file, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            
-            # Header with branding
-            writer.writerow(['📊 Idling.app Documentation Coverage Report'])
-            writer.writerow(['Generated:', report.timestamp])
-            writer.writerow([''])  # Empty row for spacing
-            
-            # Overview metrics
-            min_coverage = self.config["documentation_standards"]["minimum_coverage_percentage"]
-            
-            writer.writerow(['📈 OVERVIEW METRICS'])
-            writer.writerow(['Metric', 'Value', 'Status', 'Color Code'])
-            writer.writerow(['Total Files', report.total_code_files, '📄', 'INFO'])
-            writer.writerow(['Documented Files', report.adequately_documented, '✅', 'SUCCESS'])
-            writer.writerow(['Coverage Percentage', f'{report.coverage_percentage:.1f}%', self._get_coverage_status(report.coverage_percentage, min_coverage), self._get_coverage_color(report.coverage_percentage, min_coverage)])
-            writer.writerow(['Quality Score', f'{report.quality_score:.2f}/1.0', self._get_quality_status(report.quality_score), self._get_quality_color(report.quality_score)])
-            writer.writerow(['Missing Documentation', report.missing_documentation, '❌', 'ERROR' if report.missing_documentation > 0 else 'SUCCESS'])
-            writer.writerow(['Inadequate Documentation', report.inadequate_documentation, '⚠️', 'WARNING' if report.inadequate_documentation > 0 else 'SUCCESS'])
-            writer.writerow([''])  # Empty row
+    def generate(self, report: CoverageReport) -> str:
+        """Generate the complete CSV report with enhanced formatting.
+        
+        All sheets are open at once and filled in a single pass over the gaps
+        and one over the code files, through buffered writers, so memory use
+        does not grow with the size of the export.
+        """
+        paths = self.sheet_paths()
+        paths['main'].parent.mkdir(parents=True, exist_ok=True)
+        
+        with ExitStack() as stack:
+            writers = {
+                sheet: csv.writer(stack.enter_context(
+                    open(path, 'w', newline='', encoding='utf-8', buffering=self.buffer_size)
+                ))
+                for sheet, path in paths.items()
+            }
             
-            # File type breakdown if available
-            if report.by_file_type:
-                writer.writerow(['📂 FILE TYPE BREAKDOWN'])
-                writer.writerow(['File Type', 'Missing', 'Inadequate', 'Total Issues', 'Color Code'])
-                
-                for file_type, counts in report.by_file_type.items():
-                    missing = counts.get('missing', 0)
-                    inadequate = counts.get('inadequate', 0)
-                    total_issues = missing + inadequate
-                    color_code = 'ERROR' if total_issues > 5 else 'WARNING' if total_issues > 0 else 'SUCCESS'
-                    
-                    writer.writerow([
-                        file_type.title(),
-                        missing,
-                        inadequate,
-                        total_issues,
-                        color_code
-                    ])
-                writer.writerow([''])  # Empty row
+            self._write_sheets(writers, report)
+        
+        return self._generate_console_summary(report, paths)
+    
+    def _write_sheets(self, writers: Dict[str, Any], report: CoverageReport) -> None:
+        """Fill every sheet; writers map sheet names to objects with writerow/writerows."""
+        self._write_main_report(writers['main'], report)
+        self._write_recommendations(writers['recommendations'], report)
+        self._write_gap_sheets(writers['detailed'], writers['priorities'], report)
+        self._write_files_sheet(writers['files'], report)
     
-    def _generate_detailed_analysis(self, report: CoverageReport) -> None:
-        """Generate detailed analysis CSV (separate file)."""
-        detailed_file = Path("documentation-coverage-detailed.csv")
+    def _write_sheet_header(self, writer, title: str, report: CoverageReport) -> None:
+        """Write the title block shared by the secondary sheets."""
+        writer.writerow([title])
+        writer.writerow(['Generated:', report.timestamp])
+        writer.writerow([''])
+    
+    def _write_main_report(self, writer, report: CoverageReport) -> None:
+        """Write the main coverage report sheet."""
+        # Header with branding
+        writer.writerow(['📊 Idling.app Documentation Coverage Report'])
+        writer.writerow(['Generated:', report.timestamp])
+        if report.estimate:
+            writer.writerow([report.estimate.describe()])
+        if report.top_k:
+            writer.writerow([report.describe_top_k()])
+        writer.writerow([''])  # Empty row for spacing
         
-        with open(detailed_file, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            
-            # Header
-            writer.writerow(['📊 Detailed Documentation Analysis - Idling.app'])
-            writer.writerow(['Generated:', report.timestamp])
-            writer.writerow([''])
+        # Overview metrics
+        min_coverage = self.config["documentation_standards"]["minimum_coverage_percentage"]
+        
+        writer.writerow(['📈 OVERVIEW METRICS'])
+        writer.writerow(['Metric', 'Value', 'Status', 'Color Code'])
+        writer.writerow(['Total Files', report.total_code_files, '📄', 'INFO'])
+        writer.writerow(['Documented Files', report.adequately_documented, '✅', 'SUCCESS'])
+        writer.writerow(['Coverage Percentage', f'{report.coverage_percentage:.1f}%', self._get_coverage_status(report.coverage_percentage, min_coverage), self._get_coverage_color(report.coverage_percentage, min_coverage)])
+        writer.writerow(['Quality Score', f'{report.quality_score:.2f}/1.0', self._get_quality_status(report.quality_score), self._get_quality_color(report.quality_score)])
+        if report.estimate:
+            coverage_low, coverage_high = report.estimate.coverage_interval
+            quality_low, quality_high = report.estimate.quality_interval
+            writer.writerow(['Coverage Confidence Interval', f'{coverage_low:.1f}% – {coverage_high:.1f}%', '🎲', 'INFO'])
+            writer.writerow(['Quality Confidence Interval', f'{quality_low:.2f} – {quality_high:.2f}', '🎲', 'INFO'])
+        writer.writerow(['Missing Documentation', report.missing_documentation, '❌', 'ERROR' if report.missing_documentation > 0 else 'SUCCESS'])
+        writer.writerow(['Inadequate Documentation', report.inadequate_documentation, '⚠️', 'WARNING' if report.inadequate_documentation > 0 else 'SUCCESS'])
+        writer.writerow([''])  # Empty row
+        
+        # File type breakdown if available
+        if report.by_file_type:
+            writer.writerow(['📂 FILE TYPE BREAKDOWN'])
+            writer.writerow(['File Type', 'Missing', 'Inadequate', 'Total Issues', 'Color Code'])
             
-            # Documentation gaps analysis
-            if report.gaps:
-                writer.writerow(['📄 DOCUMENTATION GAPS'])
-                writer.writerow(['File Path', 'Gap Type', 'Priority', 'Expected Documentation', 'Effort', 'Quality Issues', 'Color Code'])
+            for file_type, counts in report.by_file_type.items():
+                missing = counts.get('missing', 0)
+                inadequate = counts.get('inadequate', 0)
+                total_issues = missing + inadequate
+                color_code = 'ERROR' if total_issues > 5 else 'WARNING' if total_issues > 0 else 'SUCCESS'
                 
-                for gap in report.gaps:
-                    color_code = self._get_priority_color(gap.priority)
-                    issues = '; '.join(gap.quality_issues[:3]) if gap.quality_issues else 'None'
-                    
-                    writer.writerow([
-                        gap.code_file,
-                        gap.gap_type.title(),
-                        gap.priority.title(),
-                        gap.expected_doc_path,
-                        gap.estimated_effort.title(),
-                        issues,
-                        color_code
-                    ])
-                
-                writer.writerow([''])  # Empty row
+                writer.writerow([
+                    file_type.title(),
+                    missing,
+                    inadequate,
+                    total_issues,
+                    color_code
+                ])
+            writer.writerow([''])  # Empty row
     
-    def _generate_priority_analysis(self, report: CoverageReport) -> None:
-        """Generate priority analysis CSV."""
-        priority_file = Path("documentation-coverage-priorities.csv")
+    def _write_gap_sheets(self, detailed_writer, priority_writer, report: CoverageReport) -> None:
+        """Write the detailed and priority sheets, routing each gap in one pass."""
+        self._write_sheet_header(detailed_writer, '📊 Detailed Documentation Analysis - Idling.app', report)
+        if report.gaps:
+            detailed_writer.writerow(['📄 DOCUMENTATION GAPS'])
+            detailed_writer.writerow(['File Path', 'Gap Type', 'Priority', 'Expected Documentation', 'Effort', 'Quality Issues', 'Color Code'])
         
-        with open(priority_file, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            
-            # Header
-            writer.writerow(['🎯 Priority Analysis - Idling.app'])
-            writer.writerow(['Generated:', report.timestamp])
-            writer.writerow([''])
-            
-            # Priority breakdown
-            writer.writerow(['📊 PRIORITY BREAKDOWN'])
-            writer.writerow(['Priority Level', 'Count', 'Percentage', 'Status', 'Color Code'])
-            
-            total_gaps = len(report.gaps)
-            for priority, count in report.by_priority.items():
-                if count > 0:
-                    percentage = (count / total_gaps * 100) if total_gaps > 0 else 0
-                    status = self._get_priority_status(priority)
-                    color_code = self._get_priority_color(priority)
-                    
-                    writer.writerow([
-                        priority.title(),
-                        count,
-                        f'{percentage:.1f}%',
-                        status,
-                        color_code
-                    ])
+        self._write_sheet_header(priority_writer, '🎯 Priority Analysis - Idling.app', report)
+        
+        # Priority breakdown
+        priority_writer.writerow(['📊 PRIORITY BREAKDOWN'])
+        priority_writer.writerow(['Priority Level', 'Count', 'Percentage', 'Status', 'Color Code'])
+        
+        # by_priority counts every gap, also those left out of a top-K report
+        total_gaps = report.total_gaps
+        for priority, count in report.by_priority.items():
+            if count > 0:
+                percentage = (count / total_gaps * 100) if total_gaps > 0 else 0
+                priority_writer.writerow([
+                    priority.title(),
+                    count,
+                    f'{percentage:.1f}%',
+                    self._get_priority_status(priority),
+                    self._get_priority_color(priority)
+                ])
+        
+        priority_writer.writerow([''])
+        
+        # Critical and high priority files, counted up front from the breakdown
+        if report.by_priority.get('critical', 0) + report.by_priority.get('high', 0) > 0:
+            priority_writer.writerow(['🚨 HIGH PRIORITY FILES TO DOCUMENT'])
+            priority_writer.writerow(['File Path', 'Priority', 'Gap Type', 'Estimated Effort', 'Reason', 'Color Code'])
+        
+        for gap in report.gaps:
+            color_code = self._get_priority_color(gap.priority)
+            issues = '; '.join(gap.quality_issues[:3]) if gap.quality_issues else 'None'
             
-            writer.writerow([''])
+            detailed_writer.writerow([
+                gap.code_file,
+                gap.gap_type.title(),
+                gap.priority.title(),
+                gap.expected_doc_path,
+                gap.estimated_effort.title(),
+                issues,
+                color_code
+            ])
             
-            # Critical and high priority files
-            critical_gaps = [g for g in report.gaps if g.priority in ['critical', 'high']]
-            if critical_gaps:
-                writer.writerow(['🚨 HIGH PRIORITY FILES TO DOCUMENT'])
-                writer.writerow(['File Path', 'Priority', 'Gap Type', 'Estimated Effort', 'Reason', 'Color Code'])
+            if gap.priority in ('critical', 'high'):
+                reason = f"{gap.gap_type.title()} documentation"
+                if gap.quality_issues:
+                    reason += f" - {gap.quality_issues[0]}"
                 
-                for gap in critical_gaps:
-                    reason = f"{gap.gap_type.title()} documentation"
-                    if gap.quality_issues:
-                        reason += f" - {gap.quality_issues[0]}"
-                    
-                    writer.writerow([
-                        gap.code_file,
-                        gap.priority.title(),
-                        gap.gap_type.title(),
-                        gap.estimated_effort.title(),
-                        reason,
-                        self._get_priority_color(gap.priority)
-                    ])
+                priority_writer.writerow([
+                    gap.code_file,
+                    gap.priority.title(),
+                    gap.gap_type.title(),
+                    gap.estimated_effort.title(),
+                    reason,
+                    color_code
+                ])
+        
+        if report.gaps:
+            detailed_writer.writerow([''])  # Empty row
+    
+    def _write_files_sheet(self, writer, report: CoverageReport) -> None:
+        """Write per-file metrics for every analyzed code file."""
+        self._write_sheet_header(writer, '📁 Per-File Metrics - Idling.app', report)
+        writer.writerow(['📁 CODE FILES'])
+        writer.writerow([
+            'File Path', 'File Type', 'Language', 'Lines', 'Complexity',
+            'Functions', 'Classes', 'Types', 'Constants', 'Exports',
+            'Has Tests', 'Public API', 'Priority', 'Documentation', 'Quality Score', 'Status', 'Color Code'
+        ])
+        writer.writerows(self._file_rows(self.code_files or []))
     
-    def _generate_recommendations(self, report: CoverageReport) -> None:
-        """Generate recommendations CSV."""
-        recommendations_file = Path("documentation-coverage-recommendations.csv")
+    def _file_rows(self, code_files: Iterable[CodeFileAnalysis]) -> Iterable[List[Any]]:
+        """Yield one files-sheet row per code file."""
+        min_quality = self.config["documentation_standards"]["minimum_quality_score"]
+        qualities = self.quality_assessments
+        documentation_files = self.documentation_files
         
-        with open(recommendations_file, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            
-            # Header
-            writer.writerow(['💡 Documentation Recommendations - Idling.app'])
-            writer.writerow(['Generated:', report.timestamp])
-            writer.writerow([''])
-            
-            # Generate smart recommendations
-            recommendations = self._generate_smart_recommendations(report)
-            
-            writer.writerow(['🎯 ACTIONABLE RECOMMENDATIONS'])
-            writer.writerow(['Priority', 'Recommendation', 'Impact', 'Effort', 'Files Affected', 'Color Code'])
+        for code_file in code_files:
+            quality = qualities.get(code_file.path)
+            if quality is None:
+                quality_score, status, color_code = '', 'Missing', 'ERROR'
+            elif quality.quality_score >= min_quality:
+                quality_score, status, color_code = f'{quality.quality_score:.2f}', 'Adequate', 'SUCCESS'
+            else:
+                quality_score, status, color_code = f'{quality.quality_score:.2f}', 'Inadequate', 'WARNING'
             
-            for rec in recommendations:
-                writer.writerow([
-                    rec['priority'],
-                    rec['title'],
-                    rec['impact'],
-                    rec['effort'],
-                    rec['files_affected'],
-                    rec['color']
-                ])
-            
-            writer.writerow([''])
-            
-            # Implementation roadmap
-            writer.writerow(['🗺️ IMPLEMENTATION ROADMAP'])
-            writer.writerow(['Phase', 'Focus Area', 'Expected Outcome', 'Timeline', 'Color Code'])
+            functions = len(code_file.exported_functions)
+            classes = len(code_file.exported_classes)
+            types = len(code_file.exported_types)
+            constants = len(code_file.exported_constants)
             
-            roadmap = self._generate_implementation_roadmap(report)
-            for phase in roadmap:
-                writer.writerow([
-                    phase['phase'],
-                    phase['focus'],
-                    phase['outcome'],
-                    phase['timeline'],
-                    phase['color']
-                ])
+            yield [
+                code_file.path,
+                code_file.file_type.title(),
+                code_file.language,
+                code_file.size_lines,
+                code_file.complexity_score,
+                functions,
+                classes,
+                types,
+                constants,
+                functions + classes + types + constants,
+                'Yes' if code_file.has_tests else 'No',
+                'Yes' if code_file.is_public_api else 'No',
+                code_file.priority.title(),
+                documentation_files.get(code_file.path, '') if quality is not None else '',
+                quality_score,
+                status,
+                color_code
+            ]
+    
+    def _write_recommendations(self, writer, report: CoverageReport) -> None:
+        """Write the recommendations sheet."""
+        self._write_sheet_header(writer, '💡 Documentation Recommendations - Idling.app', report)
+        
+        # Generate smart recommendations
+        recommendations = self._generate_smart_recommendations(report)
+        
+        writer.writerow(['🎯 ACTIONABLE RECOMMENDATIONS'])
+        writer.writerow(['Priority', 'Recommendation', 'Impact', 'Effort', 'Files Affected', 'Color Code'])
+        
+        for rec in recommendations:
+            writer.writerow([
+                rec['priority'],
+                rec['title'],
+                rec['impact'],
+                rec['effort'],
+                rec['files_affected'],
+                rec['color']
+            ])
+        
+        writer.writerow([''])
+        
+        # Implementation roadmap
+        writer.writerow(['🗺️ IMPLEMENTATION ROADMAP'])
+        writer.writerow(['Phase', 'Focus Area', 'Expected Outcome', 'Timeline', 'Color Code'])
+        
+        roadmap = self._generate_implementation_roadmap(report)
+        for phase in roadmap:
+            writer.writerow([
+                phase['phase'],
+                phase['focus'],
+                phase['outcome'],
+                phase['timeline'],
+                phase['color']
+            ])
     
     def _get_coverage_status(self, coverage_pct: float, min_coverage: float) -> str:
         """Get coverage status emoji."""
@@ -394,7 +480,7 @@ class CsvReporter:
         
         return roadmap
     
-    def _generate_console_summary(self, report: CoverageReport) -> str:
+    def _generate_console_summary(self, report: CoverageReport, paths: Dict[str, Path]) -> str:
         """Generate console summary."""
         return f"""
 📊 Enhanced CSV Reports Generated! 🎨
@@ -406,10 +492,11 @@ class CsvReporter:
    • Quality Score: {report.quality_score:.2f}
 
 📄 Generated Files:
-   • Main Report: {self.output_file}
-   • Detailed Analysis: documentation-coverage-detailed.csv
-   • Priority Analysis: documentation-coverage-priorities.csv
-   • Recommendations: documentation-coverage-recommendations.csv
+   • Main Report: {paths['main']}
+   • Detailed Analysis: {paths['detailed']}
+   • Priority Analysis: {paths['priorities']}
+   • Recommendations: {paths['recommendations']}
+   • Per-File Metrics: {paths['files']}
 
 🎨 Features:
    • Color-coded data using Idling.app brand colors
@@ -11,9 +11,10 @@ Generates a comprehensive HTML report with:
 """
 
 import os
+import sys
 import json
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import TYPE_CHECKING, Dict, List, Optional, Any
 from pathlib import Path
 
 from ..config import ConfigManager
@@ -28,6 +29,9 @@ try:
 except ImportError:
     MODULAR_AVAILABLE = False
 
+if TYPE_CHECKING:
+    from .html_components.html_generator import HtmlGenerator
+
 class HtmlReporter:
     """HTML report generator."""
     
@@ -43,9 +47,9 @@ class HtmlReporter:
             try:
                 self.content_generator = ContentGenerator(self.config.config, HtmlUtils)
                 self.utils = HtmlUtils
-                print("✅ Modular HTML components initialized")
+                print("✅ Modular HTML components initialized", file=sys.stderr)
             except Exception as e:
-                print(f"❌ Failed to initialize modular components: {e}")
+                print(f"❌ Failed to initialize modular components: {e}", file=sys.stderr)
                 self.content_generator = None
                 self.utils = None
         else:
@@ -66,12 +70,8 @@ class HtmlReporter:
     def generate(self, report: CoverageReport) -> str:
         """Generate HTML report and return the file path."""
         try:
-            # Generate HTML content
-            html_content = self._build_html_document(report)
-            
-            # Write to file using the configured output file
-            with open(self.output_file, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            # Stream the document straight to the configured output file
+            self._write_html_document(report)
             
             print(f"📄 HTML report generated: {self.output_file}")
             return self.output_file
@@ -91,18 +91,38 @@ class HtmlReporter:
             print(f"❌ Failed to generate HTML content: {e}")
             raise
 
+    def _create_html_generator(self) -> "HtmlGenerator":
+        """Create an HtmlGenerator with the correct config and code files."""
+        from .html_components.html_generator import HtmlGenerator
+        html_generator = HtmlGenerator(self.config)
+        if not self.enable_syntax_highlighting:
+            html_generator.set_syntax_highlighting(False)
+        
+        # Pass code_files data to the HTML generator if available
+        if self.code_files:
+            html_generator.set_code_files(self.code_files)
+        
+        return html_generator
+    
+    def _write_html_document(self, report: CoverageReport) -> None:
+        """Stream the complete HTML document to the output file."""
+        try:
+            html_generator = self._create_html_generator()
+            html_generator.write_document(report, self.output_file)
+            
+        except Exception as e:
+            print(f"❌ Failed to use HtmlGenerator: {e}")
+            # Fallback to simple inline generation
+            with open(self.output_file, 'w', encoding='utf-8') as f:
+                f.write(self._generate_simple_fallback_html(report))
+    
     def _build_html_document(self, report: CoverageReport) -> str:
         """Build the complete HTML document - MATCHES OLD WORKING VERSION."""
         
         # Use the fixed HtmlGenerator to produce the exact same output as old script
         try:
             # Initialize the HtmlGenerator with the correct config
-            from .html_components.html_generator import HtmlGenerator
-            html_generator = HtmlGenerator(self.config)
-            
-            # Pass code_files data to the HTML generator if available
-            if self.code_files:
-                html_generator.set_code_files(self.code_files)
+            html_generator = self._create_html_generator()
             
             # Generate the complete HTML document exactly like the old script
             html_content = html_generator.generate_document(report)
@@ -135,7 +155,7 @@ class HtmlReporter:
         <p><strong>Total Files:</strong> {report.total_code_files}</p>
         <p><strong>Coverage:</strong> {report.coverage_percentage:.1f}%</p>
         <p><strong>Quality Score:</strong> {report.quality_score:.2f}</p>
-        <p><strong>Gaps:</strong> {len(report.gaps)}</p>
+        <p><strong>Gaps:</strong> {report.total_gaps}</p>
     </div>
 </body>
 </html>"""
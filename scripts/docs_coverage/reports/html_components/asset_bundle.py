@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Asset Bundle for HTML Documentation Coverage Report
+
+The report's CSS and JavaScript do not depend on the report data, so they are
+built once into a content-hashed bundle. Bundles are memoized per process and
+cached on disk, keyed by a digest of the asset source files (stylesheets,
+JavaScript files, the Python modules that generate CSS/JS and the modules and
+templates scanned for used class names) and the build variant, so they are
+rebuilt only when one of those changes. A bundle built with fallback assets
+is used for the current report only and never cached.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .minify import CLASS_SOURCE_PATTERNS
+
+# Bump when the bundle format or build steps change
+BUNDLE_VERSION = 2
+
+DEFAULT_ASSET_CACHE_DIR = ".docs-coverage-cache/html-assets"
+
+_COMPONENTS_DIR = Path(__file__).parent
+_SOURCE_PATTERNS = (
+    "styles/*.css", "js/**/*.js",
+    "js_components/*.py", *CLASS_SOURCE_PATTERNS
+)
+
+# Bundles built or loaded by this process, keyed by source file stat signature
+_memoized: Dict[Tuple, "AssetBundle"] = {}
+
+
+@dataclass
+class AssetBundle:
+    """Report CSS and JavaScript, identified by a hash of their content."""
+    css: str
+    js: str
+    content_hash: str
+    source_digest: str
+
+    @classmethod
+    def create(cls, css: str, js: str, source_digest: str) -> "AssetBundle":
+        """Create a bundle, hashing its content."""
+        content_hash = hashlib.sha256(f"{css}\0{js}".encode('utf-8')).hexdigest()
+        return cls(css=css, js=js, content_hash=content_hash, source_digest=source_digest)
+
+
+def asset_source_files() -> List[Path]:
+    """List the files the bundle is built from, in a stable order."""
+    files = set()
+    for pattern in _SOURCE_PATTERNS:
+        files.update(path for path in _COMPONENTS_DIR.glob(pattern) if path.is_file())
+    return sorted(files)
+
+
+def source_digest(files: List[Path], variant: str = "") -> str:
+    """Hash the build variant and the names and contents of the asset source files."""
+    digest = hashlib.sha256(f"bundle-v{BUNDLE_VERSION}-{variant}".encode('utf-8'))
+    for path in files:
+        digest.update(path.relative_to(_COMPONENTS_DIR).as_posix().encode('utf-8') + b'\0')
+        digest.update(path.read_bytes() + b'\0')
+    return digest.hexdigest()
+
+
+def get_asset_bundle(build: Callable[[], Tuple[str, str, bool]],
+                     cache_dir: Optional[str] = DEFAULT_ASSET_CACHE_DIR,
+                     variant: str = "") -> AssetBundle:
+    """Return the current asset bundle, building it with build() only when needed.
+
+    Args:
+        build: Returns (css, js, degraded) built from the asset sources, where
+            degraded is True if part of the build fell back to minimal assets
+        cache_dir: Directory for cached bundles, or None to disable the disk cache
+        variant: Identifies build options that change the output (e.g. minification)
+    """
+    files = asset_source_files()
+    signature = (variant,) + tuple((str(path), stat.st_size, stat.st_mtime_ns) for path, stat in
+                                   ((path, path.stat()) for path in files))
+    if signature in _memoized:
+        return _memoized[signature]
+
+    digest = source_digest(files, variant)
+    cache_path = os.path.join(cache_dir, f"bundle-{digest[:16]}.json") if cache_dir else None
+    bundle = _load_bundle(cache_path, digest) if cache_path else None
+
+    if bundle is None:
+        css, js, degraded = build()
+        bundle = AssetBundle.create(css, js, digest)
+        if degraded:
+            # Keep a transient failure from outliving this build
+            print("⚠️  Report assets fell back to minimal CSS/JavaScript; the bundle is not cached",
+                  file=sys.stderr)
+            return bundle
+        if cache_path:
+            _save_bundle(cache_path, bundle)
+        print(f"📦 Built report asset bundle {bundle.content_hash[:12]} "
+              f"({len(bundle.css) + len(bundle.js):,} characters)", file=sys.stderr)
+
+    _memoized[signature] = bundle
+    return bundle
+
+
+def _load_bundle(cache_path: str, digest: str) -> Optional[AssetBundle]:
+    """Load a cached bundle, returning None if it is missing, unreadable or stale."""
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if data.get("version") != BUNDLE_VERSION or data.get("source_digest") != digest:
+        return None
+
+    bundle = AssetBundle.create(data["css"], data["js"], digest)
+    # A cache file that no longer matches its recorded hash was tampered with or truncated
+    return bundle if bundle.content_hash == data.get("content_hash") else None
+
+
+def _save_bundle(cache_path: str, bundle: AssetBundle) -> None:
+    """Write a bundle to the disk cache atomically, replacing stale bundles.
+
+    Failures are reported but not raised; they only cost a rebuild next time.
+    """
+    directory = os.path.dirname(cache_path) or "."
+    temp_path = None
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(prefix=".tmp-", suffix=".json", dir=directory)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({
+                "version": BUNDLE_VERSION,
+                "source_digest": bundle.source_digest,
+                "content_hash": bundle.content_hash,
+                "css": bundle.css,
+                "js": bundle.js
+            }, f)
+        os.replace(temp_path, cache_path)
+        temp_path = None
+
+        for stale in Path(directory).glob("bundle-*.json"):
+            if stale.name != os.path.basename(cache_path):
+                stale.unlink()
+    except OSError as e:
+        print(f"⚠️  Could not cache report assets in {cache_path}: {e}", file=sys.stderr)
+        if temp_path is not None and os.path.exists(temp_path):
+            os.unlink(temp_path)
@@ -5,10 +5,18 @@ Content Generators for HTML Documentation Coverage Report
 Provides functions to generate different sections of the HTML report.
 """
 
+import html
 import json
 import os
+import re
 import base64
-from typing import Dict, List, Any
+import hashlib
+import sys
+import tempfile
+import zlib
+from array import array
+from pathlib import Path
+from typing import Dict, Iterator, List, Any, Optional, Set, Tuple
 try:
     from ...models import CoverageReport, DocumentationGap
 except ImportError:
@@ -16,11 +24,28 @@ except ImportError:
     from typing import Any as CoverageReport, Any as DocumentationGap
 
 from .utils import HtmlUtils, BadgeGenerator, CssClassHelper
+from .syntax_tokens import SYNTAX_TOKENS_VERSION, pretokenize_source
 
 
 class ContentGenerator:
     """Generates HTML content for different report sections."""
     
+    # Facets embedded as row bitsets for client-side filtering
+    GAP_FACETS = ('priority', 'status', 'effort', 'fileType')
+    
+    # Gap payload parts: rendered rows on the main thread, queries in the table worker
+    GAP_TABLE_KEYS = ('version', 'count', 'githubBase', 'dicts', 'columns')
+    GAP_QUERY_KEYS = ('version', 'count', 'search', 'facets', 'sort')
+    
+    # Search tokens; the report JavaScript tokenizes queries the same way
+    SEARCH_TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+    
+    # Fragment cache namespace of compressed source segments
+    SOURCE_SEGMENT_NAMESPACE = "source-segments"
+    
+    # Fragment cache namespace of pre-tokenized syntax highlighting streams
+    SYNTAX_TOKEN_NAMESPACE = "syntax-tokens"
+    
     def __init__(self, config: Dict[str, Any], utils: Any = None):
         self.config = config
         self.utils = utils or HtmlUtils
@@ -28,10 +53,32 @@ class ContentGenerator:
         self.css_helper = CssClassHelper()
         self.pr_context = None  # Will be set by PR checker if applicable
         self.code_files = None  # Will be set by the HTML reporter
+        self._line_counts: Dict[str, int] = {}
+        self.source_sidecar_dir = None  # Set when the report is written to disk
+        self.source_sidecar_url = None
+        self.source_chunks: Dict[str, str] = {}  # Code file path -> sidecar chunk written for it
+        self.fragment_cache = None  # Set when a fragment cache directory is configured
+        html_config = config.get("reporting", {}).get("html", {})
+        self.syntax_highlighting = html_config.get("syntax_highlighting", "deferred")
+        self._syntax_tokens: Dict[Tuple[str, str], Optional[str]] = {}
+        
+    def set_fragment_cache(self, fragment_cache: Any) -> None:
+        """Reuse compressed source segments from a FragmentCache across runs."""
+        self.fragment_cache = fragment_cache
+        
+    def set_syntax_highlighting(self, mode: str) -> None:
+        """Set the highlighting mode: "deferred", "pretokenized" or "off"."""
+        self.syntax_highlighting = mode
+        
+    def set_source_sidecar(self, directory: str, url: str) -> None:
+        """Set where "sidecar" source chunks are written and the URL the report loads them from."""
+        self.source_sidecar_dir = directory
+        self.source_sidecar_url = url.rstrip('/') + '/'
         
     def set_code_files(self, code_files: List[Any]) -> None:
         """Set the code files data for line count information."""
         self.code_files = code_files
+        self._line_counts = {code_file.path: code_file.size_lines for code_file in code_files or []}
         
     def _get_line_count_for_file(self, file_path: str) -> int:
         """Get line count for a file from the code_files data."""
@@ -43,9 +90,8 @@ class ContentGenerator:
             except:
                 return 0
             
-        for code_file in self.code_files:
-            if code_file.path == file_path:
-                return code_file.size_lines
+        if file_path in self._line_counts:
+            return self._line_counts[file_path]
                 
         # Fallback: read line count directly from file system
         try:
@@ -60,9 +106,20 @@ class ContentGenerator:
         <div class="header">
             <h1>📊 Documentation Coverage Report</h1>
             <p>Comprehensive analysis of documentation coverage across the Idling.app codebase</p>
-            <p>Generated: {report.timestamp}</p>
+            <p>Generated: {report.timestamp}</p>{self._generate_estimate_notice(report)}
         </div>"""
     
+    def _generate_estimate_notice(self, report: CoverageReport) -> str:
+        """Label sampled reports as estimates and top-K reports as partial."""
+        notice = ""
+        if report.estimate:
+            notice += f"""
+            <p class="estimate-notice">🎲 {html.escape(report.estimate.describe())}. Counts cover sampled files only.</p>"""
+        if report.top_k:
+            notice += f"""
+            <p class="estimate-notice">🔝 {html.escape(report.describe_top_k())}. Totals count every gap.</p>"""
+        return notice
+    
     def generate_overview_cards(self, report: CoverageReport) -> str:
         """Generate beautiful overview dashboard with golden theme."""
         min_coverage = self.config.get("documentation_standards", {}).get("minimum_coverage_percentage", 85.0)
@@ -71,6 +128,14 @@ class ContentGenerator:
         coverage_status = "quality-excellent" if report.coverage_percentage >= min_coverage else "quality-poor"
         quality_status = "quality-excellent" if report.quality_score >= 0.8 else "quality-good" if report.quality_score >= 0.6 else "quality-poor"
         
+        # Confidence intervals for estimated (sampled) reports
+        coverage_interval = quality_interval = ""
+        if report.estimate:
+            coverage_low, coverage_high = report.estimate.coverage_interval
+            quality_low, quality_high = report.estimate.quality_interval
+            coverage_interval = f'\n                <div class="metric-subtitle">Estimate · CI {coverage_low:.1f}% – {coverage_high:.1f}%</div>'
+            quality_interval = f'\n                <div class="metric-subtitle">Estimate · CI {quality_low:.2f} – {quality_high:.2f}</div>'
+        
         return f"""
         <div class="overview-grid">
             <div class="metric-card" data-metric="total-files">
@@ -83,11 +148,11 @@ class ContentGenerator:
             </div>
             <div class="metric-card" data-metric="coverage">
                 <div class="metric-value {coverage_status}">{report.coverage_percentage:.1f}%</div>
-                <div class="metric-label">COVERAGE</div>
+                <div class="metric-label">COVERAGE</div>{coverage_interval}
             </div>
             <div class="metric-card" data-metric="quality">
                 <div class="metric-value {quality_status}">{report.quality_score:.2f}</div>
-                <div class="metric-label">QUALITY SCORE</div>
+                <div class="metric-label">QUALITY SCORE</div>{quality_interval}
                 <div class="metric-subtitle">Shows files needing quality improvements</div>
             </div>
         </div>
@@ -121,7 +186,7 @@ class ContentGenerator:
                     <div class="metric-label">Inadequate Documentation</div>
                 </div>
                 <div class="metric-card clickable-card" data-filter="all" title="Click to show all issues">
-                    <div class="metric-value quality-good">{len(report.gaps)}</div>
+                    <div class="metric-value quality-good">{report.total_gaps}</div>
                     <div class="metric-label">Total Issues</div>
                 </div>
             </div>
@@ -161,67 +226,19 @@ class ContentGenerator:
     
     def generate_gaps_analysis(self, report: CoverageReport) -> str:
         """Generate ADVANCED gaps analysis with search, column picker, and pagination."""
+        return "".join(self.iter_gaps_analysis(report))
+    
+    def iter_gaps_analysis(self, report: CoverageReport) -> Iterator[str]:
+        """Yield the gaps analysis section: table controls, then the gap data payload."""
         if not report.gaps:
-            return ""
+            return
         
-        # Generate advanced table rows with full data
-        table_rows = []
-        for i, gap in enumerate(report.gaps):
-            file_name = gap.code_file.split("/")[-1]
-            file_dir = "/".join(gap.code_file.split("/")[:-1])
-            doc_name = gap.expected_doc_path.split("/")[-1]
-            issues = ", ".join(gap.quality_issues[:3])
-            if len(gap.quality_issues) > 3:
-                issues += f" +{len(gap.quality_issues) - 3} more"
-            
-            priority_emoji = {"critical": "🚨", "high": "⚠️", "medium": "📝", "low": "💡"}[gap.priority]
-            
-            # Generate GitHub URL
-            github_url = self._get_github_url(gap.code_file)
-            
-            # Get file extension for better styling
-            file_ext = gap.code_file.split(".")[-1] if "." in gap.code_file else "txt"
-            
-            # Get line count for this file
-            line_count = self._get_line_count_for_file(gap.code_file)
-            
-            table_rows.append(f"""
-                <tr class="clickable-row gap-row" data-priority="{gap.priority}" data-file-path="{gap.code_file}" 
-                    data-status="{gap.gap_type}" data-effort="{gap.estimated_effort}"
-                    data-file-type="{file_ext}"
-                    data-file-name="{gap.code_file}"
-                    data-expected-doc="{gap.expected_doc_path}"
-                    data-issues-count="{len(gap.quality_issues)}"
-                    data-github-url="{github_url}"
-                    data-line-count="{line_count}">
-                    <td class="col-file">
-                        <div class="file-path-container">
-                            <span class="file-directory">{file_dir}/</span>
-                            <span class="file-name clickable-filename" title="Click to preview source code">{file_name}</span>
-                        </div>
-                    </td>
-                    <td class="col-lines">
-                        <span class="line-count">{line_count:,}</span>
-                    </td>
-                    <td class="col-status">
-                        <span class="badge badge-{gap.gap_type.lower()}">{gap.gap_type.title()}</span>
-                    </td>
-                    <td class="col-priority">
-                        <span class="priority-indicator priority-{gap.priority.lower()}">{priority_emoji} {gap.priority.title()}</span>
-                    </td>
-                    <td class="col-doc">
-                        <span class="code">{doc_name}</span>
-                    </td>
-                    <td class="col-effort">
-                        <span class="effort-indicator effort-{gap.estimated_effort.lower()}">{gap.estimated_effort.title()}</span>
-                    </td>
-                    <td class="col-issues">
-                        <span class="issues-text" title="{', '.join(gap.quality_issues)}">{issues}</span>
-                    </td>
-                </tr>""")
-        
-        # Return ADVANCED HTML structure matching working report
-        return f"""
+        # One pass over the gaps builds the columns, search index and facet counts
+        gap_data = self.build_gap_table_data(report)
+        priority_counts = gap_data['facetCounts']['priority']
+        
+        # ADVANCED HTML structure matching working report
+        yield f"""
         <div class="card">
             <h2>📄 Advanced Documentation Gaps Analysis</h2>
             
@@ -248,10 +265,10 @@ class ContentGenerator:
                     <div class="filter-group">
                         <span class="filter-label">Priority:</span>
                         <button class="filter-tag active" data-filter="priority" data-value="">All ({len(report.gaps)})</button>
-                        <button class="filter-tag" data-filter="priority" data-value="critical">🚨 Critical ({len([g for g in report.gaps if g.priority == 'critical'])})</button>
-                        <button class="filter-tag" data-filter="priority" data-value="high">⚠️ High ({len([g for g in report.gaps if g.priority == 'high'])})</button>
-                        <button class="filter-tag" data-filter="priority" data-value="medium">📝 Medium ({len([g for g in report.gaps if g.priority == 'medium'])})</button>
-                        <button class="filter-tag" data-filter="priority" data-value="low">💡 Low ({len([g for g in report.gaps if g.priority == 'low'])})</button>
+                        <button class="filter-tag" data-filter="priority" data-value="critical">🚨 Critical ({priority_counts.get('critical', 0)})</button>
+                        <button class="filter-tag" data-filter="priority" data-value="high">⚠️ High ({priority_counts.get('high', 0)})</button>
+                        <button class="filter-tag" data-filter="priority" data-value="medium">📝 Medium ({priority_counts.get('medium', 0)})</button>
+                        <button class="filter-tag" data-filter="priority" data-value="low">💡 Low ({priority_counts.get('low', 0)})</button>
                     </div>
                     <div class="filter-group">
                         <span class="filter-label">Status:</span>
@@ -292,7 +309,6 @@ class ContentGenerator:
                 <div class="advanced-table-body">
                     <table class="advanced-table" id="gaps-table">
                     <tbody id="gaps-table-body">
-                        {''.join(table_rows)}
                     </tbody>
                 </table>
                 </div>
@@ -337,6 +353,134 @@ class ContentGenerator:
             </div>
         </div>
         """
+        
+        # Rows are rendered client-side from the table payload, only the visible window at a
+        # time; the query payload is parsed by the worker that searches, filters and sorts
+        table_json, query_json = (
+            json.dumps({key: gap_data[key] for key in keys}, separators=(',', ':')).replace('</', '<\\/')
+            for keys in (self.GAP_TABLE_KEYS, self.GAP_QUERY_KEYS)
+        )
+        yield f"""
+        <script type="application/json" data-gap-table="true">{table_json}</script>
+        <script type="application/json" data-gap-query="true">{query_json}</script>
+        """
+    
+    def build_gap_table_data(self, report: CoverageReport) -> Dict[str, Any]:
+        """Encode the gaps as columns for the virtualized gaps table.
+        
+        Directories, statuses, priorities, efforts, file types and quality
+        issues repeat across rows, so each is stored once in a dictionary and
+        the columns hold indexes into it. Directories keep their trailing
+        slash so that directory + name reproduces the path exactly.
+        
+        The same pass builds the client-side search structures: an inverted
+        index from lowercase alphanumeric tokens (of paths, expected docs,
+        issues, status, priority and effort) to delta-encoded row ids, and a
+        bitset of row ids for every priority, status, effort and file type.
+        
+        Finally every sortable column gets its ascending row permutation and
+        a dense rank per row, so the client can sort without comparisons.
+        """
+        dictionaries: Dict[str, Dict[str, int]] = {
+            name: {} for name in ('dir', 'status', 'priority', 'effort', 'fileType', 'docDir', 'issue')
+        }
+        columns: Dict[str, List[Any]] = {
+            name: [] for name in ('dir', 'name', 'lines', 'status', 'priority', 'effort', 'fileType', 'docDir', 'doc', 'issues')
+        }
+        
+        facets: Dict[str, Dict[str, bytearray]] = {name: {} for name in self.GAP_FACETS}
+        facet_counts: Dict[str, Dict[str, int]] = {name: {} for name in self.GAP_FACETS}
+        postings: Dict[str, List[int]] = {}
+        bitset_size = (len(report.gaps) + 31) // 32 * 4  # whole 32-bit words
+        
+        def encode(name: str, value: str) -> int:
+            entries = dictionaries[name]
+            index = entries.get(value)
+            if index is None:
+                index = entries[value] = len(entries)
+            return index
+        
+        for row, gap in enumerate(report.gaps):
+            file_name = gap.code_file.rpartition("/")[2]
+            doc_name = gap.expected_doc_path.rpartition("/")[2]
+            columns['dir'].append(encode('dir', gap.code_file[:len(gap.code_file) - len(file_name)]))
+            columns['name'].append(file_name)
+            columns['lines'].append(self._get_line_count_for_file(gap.code_file))
+            columns['status'].append(encode('status', gap.gap_type))
+            columns['priority'].append(encode('priority', gap.priority))
+            columns['effort'].append(encode('effort', gap.estimated_effort))
+            file_type = gap.code_file.split(".")[-1] if "." in gap.code_file else "txt"
+            columns['fileType'].append(encode('fileType', file_type))
+            columns['docDir'].append(encode('docDir', gap.expected_doc_path[:len(gap.expected_doc_path) - len(doc_name)]))
+            columns['doc'].append(doc_name)
+            columns['issues'].append([encode('issue', issue) for issue in gap.quality_issues])
+            
+            for facet, value in (('priority', gap.priority), ('status', gap.gap_type),
+                                 ('effort', gap.estimated_effort), ('fileType', file_type)):
+                bits = facets[facet].get(value)
+                if bits is None:
+                    bits = facets[facet][value] = bytearray(bitset_size)
+                bits[row >> 3] |= 1 << (row & 7)
+                facet_counts[facet][value] = facet_counts[facet].get(value, 0) + 1
+            
+            for token in self.gap_search_tokens(gap):
+                postings.setdefault(token, []).append(row)
+        
+        tokens = sorted(postings)
+        sort_keys = {
+            'file': [gap.code_file.lower() for gap in report.gaps],
+            'lines': columns['lines'],
+            'status': [self._get_status_sort_value(gap.gap_type) for gap in report.gaps],
+            'priority': [self._get_priority_sort_value(gap.priority) for gap in report.gaps],
+            'doc': [doc_name.lower() for doc_name in columns['doc']],
+            'effort': [self._get_effort_sort_value(gap.estimated_effort) for gap in report.gaps],
+            'issues': [len(gap.quality_issues) for gap in report.gaps],
+        }
+        return {
+            'version': 1,
+            'count': len(report.gaps),
+            'githubBase': self._get_github_url(""),
+            'dicts': {name: list(entries) for name, entries in dictionaries.items()},
+            'columns': columns,
+            'search': {
+                'tokens': tokens,
+                # Row ids ascend, so each list stores the first id then the gaps between ids
+                'postings': [[rows[0]] + [b - a for a, b in zip(rows, rows[1:])]
+                             for rows in (postings[token] for token in tokens)]
+            },
+            'facets': {
+                facet: {value: base64.b64encode(bits).decode('ascii') for value, bits in values.items()}
+                for facet, values in facets.items()
+            },
+            'facetCounts': facet_counts,
+            'sort': {column: self._build_sort_order(keys) for column, keys in sort_keys.items()}
+        }
+    
+    def gap_search_tokens(self, gap: DocumentationGap) -> Set[str]:
+        """Distinct search tokens of a gap's path, expected doc, issues, status, priority and effort."""
+        searchable = " ".join((gap.code_file, gap.expected_doc_path, gap.gap_type, gap.priority,
+                               gap.estimated_effort, *gap.quality_issues)).lower()
+        return set(self.SEARCH_TOKEN_PATTERN.findall(searchable))
+    
+    def _build_sort_order(self, keys: List[Any]) -> Dict[str, Any]:
+        """Ascending permutation (ties in row order) and dense ranks for one column."""
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        ranks = [0] * len(keys)
+        rank = 0
+        for position, row in enumerate(order):
+            if position and keys[row] != keys[order[position - 1]]:
+                rank += 1
+            ranks[row] = rank
+        return {'order': self._encode_typed_array(order), 'rank': self._encode_typed_array(ranks), 'maxRank': rank}
+    
+    def _encode_typed_array(self, values: List[int]) -> Dict[str, Any]:
+        """Base64 encode non-negative integers as the narrowest little-endian typed array."""
+        largest = max(values, default=0)
+        typecode = 'B' if largest < 1 << 8 else 'H' if largest < 1 << 16 else 'I'
+        packed = array(typecode, values)
+        if sys.byteorder == 'big':
+            packed.byteswap()
+        return {'bytes': packed.itemsize, 'data': base64.b64encode(packed.tobytes()).decode('ascii')}
     
     def generate_recommendations(self, report: CoverageReport) -> str:
         """Generate recommendations section."""
@@ -419,7 +563,7 @@ class ContentGenerator:
                             <span class="footer-stat-label">Total Files</span>
                         </div>
                         <div class="footer-stat">
-                            <span class="footer-stat-value">{len(report.gaps):,}</span>
+                            <span class="footer-stat-value">{report.total_gaps:,}</span>
                             <span class="footer-stat-label">Documentation Gaps</span>
                         </div>
                         <div class="footer-stat">
@@ -557,6 +701,10 @@ class ContentGenerator:
         """Get numeric sort value for effort."""
         return self.utils.get_effort_sort_value(effort)
     
+    def _get_status_sort_value(self, gap_type: str) -> int:
+        """Get numeric sort value for gap status."""
+        return self.utils.get_status_sort_value(gap_type)
+    
     def _get_github_url(self, file_path: str) -> str:
         """Generate context-aware GitHub URL based on PR context"""
         base_url = "https://github.com/Underwood-Inc/idling.app__UI/blob"
@@ -585,11 +733,266 @@ class ContentGenerator:
             return f"{base_url}/master/{file_path}"
     
     def generate_source_code_embedding(self, report: CoverageReport) -> str:
-        """Generate source code data for modal display - BASE64 ENCODED TO AVOID JSON ESCAPING."""
-        source_code_data = {}
+        """Generate source code data for modal display."""
+        return "".join(self.iter_source_code_embedding(report))
+    
+    def iter_source_code_embedding(self, report: CoverageReport) -> Iterator[str]:
+        """Yield source code data for modal display, one file at a time.
+        
+        The default "compact" mode embeds one zlib-compressed blob of
+        deduplicated sources that the browser inflates when a modal first
+        opens; "base64" embeds every file individually base64 encoded;
+        "sidecar" writes each source to a compressed chunk file next to the
+        report (falling back to "compact" when no sidecar directory is set).
+        """
+        html_config = self.config.get("reporting", {}).get("html", {})
+        mode = html_config.get("source_embedding", "compact")
+        if mode == "base64":
+            return self._iter_base64_source_embedding(report)
+        if mode == "sidecar" and self.source_sidecar_dir:
+            return self._iter_sidecar_source_embedding(report, html_config)
+        return self._iter_compact_source_embedding(report, html_config)
+    
+    def _iter_compact_source_embedding(self, report: CoverageReport, html_config: Dict[str, Any]) -> Iterator[str]:
+        """Embed deduplicated sources as a single compressed blob plus a JSON index.
+        
+        Sources are compressed and base64 encoded as they are read, so only
+        the index is held in memory; it follows the blob in the document.
+        
+        With a fragment cache, each source is compressed on its own into a
+        raw deflate segment that is cached by content hash, and the blob is
+        spliced together from the segments. Unchanged sources are then not
+        recompressed, at the cost of no compression across files.
+        """
+        max_file_bytes = html_config.get("max_source_file_kb", 256) * 1024
+        budget_kb = html_config.get("max_embedded_source_kb")
+        budget_bytes = budget_kb * 1024 if budget_kb is not None else None
+        
+        files: Dict[str, Dict[str, Any]] = {}
+        offsets: Dict[str, Dict[str, int]] = {}  # content hash -> offset/length in the blob
+        cache = self.fragment_cache
+        compressor = None if cache else zlib.compressobj(9)
+        # Compressed bytes not yet base64 encoded; spliced segments need the zlib header written out
+        pending = b'\x78\xda' if cache else b''
+        checksum = zlib.adler32(b'')
+        blob_size = compressed_size = 0
+        external = 0
+        
+        print(f"📄 Embedding source code for {len(report.gaps)} files (compressed)...")
+        yield """
+    <script type="application/octet-stream" data-source-blob="true">"""
+        
+        for gap in report.gaps:
+            file_path = gap.code_file
+            if file_path in files:
+                continue
+            
+            try:
+                with open(file_path, 'rb') as f:
+                    data = f.read()
+            except Exception as e:
+                files[file_path] = {'error': f'Could not read file: {e}'}
+                continue
+            
+            digest = hashlib.sha1(data).hexdigest()
+            location = offsets.get(digest)
+            if location is None:
+                over_budget = budget_bytes is not None and blob_size + len(data) > budget_bytes
+                if len(data) > max_file_bytes or over_budget:
+                    # Too large to embed - the modal points to GitHub instead
+                    files[file_path] = {'external': True, 'size': len(data)}
+                    external += 1
+                    continue
+                location = offsets[digest] = {'offset': blob_size, 'length': len(data)}
+                blob_size += len(data)
+                
+                # Encode whole 3-byte groups now so the base64 stream has no padding breaks
+                if cache:
+                    pending += self._get_source_segment(digest, data)
+                    checksum = zlib.adler32(data, checksum)
+                else:
+                    pending += compressor.compress(data)
+                ready = len(pending) - len(pending) % 3
+                if ready:
+                    compressed_size += ready
+                    yield base64.b64encode(pending[:ready]).decode('ascii')
+                    pending = pending[ready:]
+            
+            files[file_path] = self._source_index_entry(location, digest, data, file_path, html_config)
+        
+        if cache:
+            # An empty final block, then the zlib trailer checksum over every source
+            pending += b'\x03\x00' + checksum.to_bytes(4, 'big')
+            cache.prune(self.SOURCE_SEGMENT_NAMESPACE)
+            if self.syntax_highlighting == "pretokenized":
+                cache.prune(self.SYNTAX_TOKEN_NAMESPACE)
+        else:
+            pending += compressor.flush()
+        compressed_size += len(pending)
+        yield base64.b64encode(pending).decode('ascii')
+        print(f"   {len(offsets)} unique sources, {blob_size:,} bytes -> {compressed_size:,} bytes compressed"
+              + (f" ({cache.hits} from fragment cache)" if cache else "")
+              + (f", {external} linked to GitHub" if external else ""))
+        
+        # "</" cannot appear inside a script element
+        json_index = json.dumps({'files': files}, separators=(',', ':')).replace('</', '<\\/')
+        
+        yield f"""</script>
+    <script type="application/json" data-source-index="true">{json_index}</script>
+        """
+    
+    def _get_source_segment(self, digest: str, data: bytes) -> bytes:
+        """Get a source's raw deflate segment from the fragment cache, compressing it on a miss.
+        
+        Segments end on a byte boundary without a final block, so any number
+        of them concatenate into one valid deflate stream.
+        """
+        key = f"{digest}-deflate9"
+        segment = self.fragment_cache.get(self.SOURCE_SEGMENT_NAMESPACE, key)
+        if segment is None:
+            compressor = zlib.compressobj(9, zlib.DEFLATED, -15)
+            segment = compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH)
+            self.fragment_cache.put(self.SOURCE_SEGMENT_NAMESPACE, key, segment)
+        return segment
+    
+    def _iter_sidecar_source_embedding(self, report: CoverageReport, html_config: Dict[str, Any]) -> Iterator[str]:
+        """Write sources as per-file chunks next to the report and embed only their index.
+        
+        Chunks are named by content hash and sharded by its first two hex
+        digits, so unchanged files keep their chunk name across reports and
+        existing chunks are not rewritten.
+        """
+        max_file_bytes = html_config.get("max_source_file_kb", 256) * 1024
+        
+        files: Dict[str, Dict[str, Any]] = {}
+        chunks = set()
+        written = external = 0
+        
+        print(f"📄 Writing source chunks for {len(report.gaps)} files to {self.source_sidecar_dir}...")
+        for gap in report.gaps:
+            file_path = gap.code_file
+            if file_path in files:
+                continue
+            
+            try:
+                with open(file_path, 'rb') as f:
+                    data = f.read()
+            except Exception as e:
+                files[file_path] = {'error': f'Could not read file: {e}'}
+                self.source_chunks.pop(file_path, None)
+                continue
+            
+            if len(data) > max_file_bytes:
+                # Too large to ship - the modal points to GitHub instead
+                files[file_path] = {'external': True, 'size': len(data)}
+                self.source_chunks.pop(file_path, None)
+                external += 1
+                continue
+            
+            digest = hashlib.sha1(data).hexdigest()
+            if digest not in chunks:
+                chunks.add(digest)
+                written += self._write_source_chunk(digest, data)
+            self.source_chunks[file_path] = digest
+            
+            files[file_path] = self._source_index_entry({'chunk': digest}, digest, data, file_path, html_config)
+        
+        print(f"   {len(chunks)} unique sources, {written} new chunks written"
+              + (f", {external} linked to GitHub" if external else ""))
+        
+        # "</" cannot appear inside a script element
+        json_index = json.dumps({'files': files, 'chunkBase': self.source_sidecar_url},
+                                separators=(',', ':')).replace('</', '<\\/')
+        
+        yield f"""
+    <script type="application/json" data-source-index="true">{json_index}</script>
+        """
+    
+    def _source_index_entry(self, location: Dict[str, Any], digest: str, data: bytes,
+                            file_path: str, html_config: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the source index entry of an embedded file, with its token stream if pre-tokenized."""
+        language = self._get_language_from_extension(file_path)
+        entry = {**location, 'language': language, 'lines': data.count(b'\n') + 1}
+        
+        min_bytes = html_config.get("pretokenize_min_kb", 16) * 1024
+        if self.syntax_highlighting == "pretokenized" and len(data) >= min_bytes:
+            tokens = self._get_syntax_tokens(digest, data, language)
+            if tokens:
+                entry['tokens'] = tokens
+        return entry
+    
+    def _get_syntax_tokens(self, digest: str, data: bytes, language: str) -> Optional[str]:
+        """Get a source's encoded token stream, from the fragment cache when one is set."""
+        key = (digest, language)
+        if key in self._syntax_tokens:
+            return self._syntax_tokens[key]
+        
+        cache_key = f"{digest}-{language}-v{SYNTAX_TOKENS_VERSION}"
+        cached = self.fragment_cache.get(self.SYNTAX_TOKEN_NAMESPACE, cache_key) if self.fragment_cache else None
+        if cached is not None:
+            tokens = cached.decode('ascii') or None
+        else:
+            tokens = pretokenize_source(data, language)
+            if self.fragment_cache:
+                self.fragment_cache.put(self.SYNTAX_TOKEN_NAMESPACE, cache_key, (tokens or '').encode('ascii'))
+        self._syntax_tokens[key] = tokens
+        return tokens
+    
+    def _write_source_chunk(self, digest: str, data: bytes) -> bool:
+        """Write one compressed source chunk unless it already exists; returns whether it was written.
+        
+        A chunk is a script calling docsCoverageSourceChunk(hash, base64), which
+        loads from file:// pages where fetch() of local files is blocked.
+        """
+        chunk_path = os.path.join(self.source_sidecar_dir, digest[:2], f"{digest}.js")
+        if os.path.exists(chunk_path):
+            return False
+        
+        encoded = base64.b64encode(zlib.compress(data, 9)).decode('ascii')
+        os.makedirs(os.path.dirname(chunk_path), exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(prefix=".tmp-", suffix=".js", dir=os.path.dirname(chunk_path))
+        try:
+            with os.fdopen(fd, 'w', encoding='ascii') as f:
+                f.write(f'docsCoverageSourceChunk("{digest}","{encoded}");\n')
+            os.chmod(temp_path, 0o644)
+            os.replace(temp_path, chunk_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        return True
+    
+    def source_chunks_for(self, gaps: List[DocumentationGap]) -> Set[str]:
+        """Sidecar chunks that the last rendering of these gaps' files refers to."""
+        return {self.source_chunks[gap.code_file] for gap in gaps if gap.code_file in self.source_chunks}
+    
+    def source_chunk_exists(self, digest: str) -> bool:
+        """Check that a sidecar chunk is present on disk."""
+        return os.path.exists(os.path.join(self.source_sidecar_dir, digest[:2], f"{digest}.js"))
+    
+    def prune_source_chunks(self, keep: Set[str]) -> int:
+        """Delete sidecar chunks not in keep (e.g. of edited or deleted files); returns how many."""
+        removed = 0
+        for chunk_path in Path(self.source_sidecar_dir).glob("*/*.js"):
+            if chunk_path.stem not in keep:
+                chunk_path.unlink()
+                removed += 1
+        for shard in Path(self.source_sidecar_dir).glob("*"):
+            if shard.is_dir() and not any(shard.iterdir()):
+                shard.rmdir()
+        return removed
+    
+    def _iter_base64_source_embedding(self, report: CoverageReport) -> Iterator[str]:
+        """Generate source code data for modal display - BASE64 ENCODED TO AVOID JSON ESCAPING.
         
+        Entries are serialized one by one into the same JSON text that
+        json.dumps(indent=2) produces for the whole mapping.
+        """
         print(f"📄 Embedding source code for {len(report.gaps)} files...")
         
+        yield """
+    <script type="application/json" data-source-code="true">
+{"""
+        seen = set()
         for gap in report.gaps:
             file_path = gap.code_file
             try:
@@ -603,7 +1006,7 @@ class ContentGenerator:
                 encoded_content = base64.b64encode(content.encode('utf-8')).decode('ascii')
                 
                 # Store the source code data with base64 encoded content
-                source_code_data[file_path] = {
+                entry = {
                     'content_base64': encoded_content,  # Base64 encoded content
                     'language': self._get_language_from_extension(file_path),
                     'lines': len(lines),
@@ -615,19 +1018,24 @@ class ContentGenerator:
                 error_content = f'// Could not read file: {file_path}\n// Error: {str(e)}\n// Click "View on GitHub" to see the actual source code'
                 encoded_error = base64.b64encode(error_content.encode('utf-8')).decode('ascii')
                 
-                source_code_data[file_path] = {
+                entry = {
                     'content_base64': encoded_error,
                     'language': 'text',
                     'lines': 0,
                     'truncated': False
                 }
+            
+            # Later duplicates of a path replaced earlier ones in the old dict-based
+            # output; the content is identical, so keeping the first is equivalent
+            if file_path in seen:
+                continue
+            # Strip the outer braces of a one-entry mapping - no escaping issues with base64!
+            member = json.dumps({file_path: entry}, indent=2)[1:-2]
+            yield member if not seen else "," + member
+            seen.add(file_path)
         
-        # Generate the JSON data embedding - no escaping issues with base64!
-        json_data = json.dumps(source_code_data, indent=2)
-        
-        return f"""
-    <script type="application/json" data-source-code="true">
-{json_data}
+        yield """
+}
     </script>
         """
     
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Fragment Cache for Incremental HTML Report Regeneration
+
+Stores expensive report fragments (such as compressed source segments) on
+disk under content-derived keys, so that a later run only re-renders the
+fragments whose inputs changed and splices the rest in from the cache.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional, Set
+
+
+class FragmentCache:
+    """Content-addressed store of report fragments, grouped by namespace."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self._used: Dict[str, Set[str]] = {}
+        self._write_failed = False
+
+    def _path(self, namespace: str, key: str) -> str:
+        return os.path.join(self.directory, namespace, key[:2], key)
+
+    def get(self, namespace: str, key: str) -> Optional[bytes]:
+        """Return the cached fragment, or None if it is not cached."""
+        self._used.setdefault(namespace, set()).add(key)
+        try:
+            with open(self._path(namespace, key), 'rb') as f:
+                data = f.read()
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return data
+
+    def put(self, namespace: str, key: str, data: bytes) -> None:
+        """Store a fragment atomically; failures only cost a re-render next time."""
+        self._used.setdefault(namespace, set()).add(key)
+        path = self._path(namespace, key)
+        temp_path = None
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(prefix=".tmp-", dir=os.path.dirname(path))
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except OSError as e:
+            if not self._write_failed:
+                print(f"⚠️  Could not write report fragments to {self.directory}: {e}", file=sys.stderr)
+                self._write_failed = True
+            if temp_path is not None and os.path.exists(temp_path):
+                os.unlink(temp_path)
+
+    def prune(self, namespace: str) -> int:
+        """Delete fragments of a namespace not used since this cache was opened; returns the count."""
+        used = self._used.get(namespace, set())
+        removed = 0
+        for path in Path(self.directory, namespace).glob("*/*"):
+            if path.is_file() and path.name not in used:
+                path.unlink()
+                removed += 1
+        return removed
@@ -5,8 +5,11 @@ HTML Generator for Documentation Coverage Report
 Generates the complete HTML document using external CSS files with golden branding.
 """
 
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, Iterator, List, Any, Optional, Tuple, Union
+import hashlib
+import os
 import sys
+import tempfile
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -19,9 +22,15 @@ except ImportError:
     # Fallback for when running as standalone module
     from typing import Any as CoverageReport, Any as DocumentationGap, Any as ConfigManager
 
+from .asset_bundle import AssetBundle, DEFAULT_ASSET_CACHE_DIR, get_asset_bundle
 from .content_generators import ContentGenerator
+from .fragment_cache import FragmentCache
+from .minify import ClassUsage, minify_css, minify_js
 from .template_loader import TemplateLoader
 
+# Directory (relative to the HTML file) for "sidecar" source chunks
+DEFAULT_SOURCE_SIDECAR_DIR = "docs-coverage-sources"
+
 
 class HtmlGenerator:
     """
@@ -46,11 +55,24 @@ class HtmlGenerator:
         # Initialize components
         self.content_generator = ContentGenerator(self.config)
         self.template_loader = TemplateLoader()
+        
+        # Set when an asset build had to fall back to minimal CSS or JavaScript
+        self._assets_degraded = False
+        
+        fragment_cache_dir = self.config.get("reporting", {}).get("html", {}).get("fragment_cache_dir")
+        if fragment_cache_dir:
+            self.content_generator.set_fragment_cache(FragmentCache(fragment_cache_dir))
     
     def set_code_files(self, code_files: List[Any]) -> None:
         """Set the code files data for line count information."""
         self.content_generator.set_code_files(code_files)
     
+    def set_syntax_highlighting(self, enabled: bool) -> None:
+        """Turn syntax highlighting of source previews off (or back to the configured mode)."""
+        html_config = self.config.get("reporting", {}).get("html", {})
+        mode = html_config.get("syntax_highlighting", "deferred") if enabled else "off"
+        self.content_generator.set_syntax_highlighting(mode)
+    
     def generate_document(self, report: CoverageReport) -> str:
         """Generate the complete HTML document using external CSS files.
         
@@ -60,22 +82,97 @@ class HtmlGenerator:
         Returns:
             Complete HTML document as string
         """
-        output = []
+        return "".join(self.iter_document(report))
+    
+    def write_document(self, report: CoverageReport, output_file: str) -> None:
+        """Stream the complete HTML document to a file.
+        
+        Pieces are written as they are generated through a buffered handle on a
+        temporary file next to the target, which is then atomically renamed
+        into place, so peak memory does not grow with the report and a failed
+        run never leaves a truncated report behind.
+        
+        With source_embedding "sidecar", source chunks are written to
+        source_sidecar_dir (relative to the HTML file) as part of this call,
+        and chunks this report does not refer to are removed from it.
+        
+        Args:
+            report: Coverage report data
+            output_file: Path of the HTML file to write
+        """
+        directory = os.path.dirname(os.path.abspath(output_file))
+        html_config = self.config.get("reporting", {}).get("html", {})
+        sidecar = html_config.get("source_embedding", "compact") == "sidecar"
+        if sidecar:
+            sidecar_dir = os.path.join(directory, html_config.get("source_sidecar_dir", DEFAULT_SOURCE_SIDECAR_DIR))
+            url = Path(os.path.relpath(sidecar_dir, directory)).as_posix()
+            self.content_generator.set_source_sidecar(sidecar_dir, url)
+        
+        fd, temp_path = tempfile.mkstemp(prefix=".tmp-", suffix=".html", dir=directory)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8', buffering=1024 * 1024) as f:
+                for chunk in self.iter_document(report):
+                    f.write(chunk)
+            os.chmod(temp_path, 0o644)
+            os.replace(temp_path, output_file)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        
+        if sidecar:
+            # Chunks of files that were edited or no longer have gaps
+            self.content_generator.prune_source_chunks(self.content_generator.source_chunks_for(report.gaps))
+    
+    def iter_document(self, report: CoverageReport) -> Iterator[str]:
+        """Yield the complete HTML document in pieces.
+        
+        Sections are separated by newlines; the gaps table and the embedded
+        source code are produced incrementally.
+        
+        Args:
+            report: Coverage report data
+        """
+        yield from self.iter_document_head(f"Documentation Coverage Report - {report.timestamp}")
+        
+        # Generate all content sections using the content generator
+        yield "\n" + self.content_generator.generate_header(report)
+        yield "\n" + self.content_generator.generate_overview_cards(report)
+        yield "\n" + self.content_generator.generate_quality_metrics(report)
+        yield "\n" + self.content_generator.generate_priority_breakdown(report)
+        yield "\n"
+        yield from self.content_generator.iter_gaps_analysis(report)
+        yield "\n" + self.content_generator.generate_recommendations(report)
+        yield "\n" + self.content_generator.generate_footer(report)
+        
+        yield from self.iter_document_tail(report)
+    
+    def iter_document_head(self, title: str, stylesheet_href: Optional[str] = None) -> Iterator[str]:
+        """Yield the document head and the opening of the page container.
+        
+        Args:
+            title: Page title (HTML-escaped by the caller)
+            stylesheet_href: Link the report CSS from this URL instead of inlining it
+        """
+        if stylesheet_href:
+            styles = f"""<link rel="stylesheet" href="{stylesheet_href}">"""
+        else:
+            styles = f"""<style>
+        {self._get_complete_css()}
+    </style>"""
         
-        # HTML header with external CSS files (golden branding) and highlight.js
-        output.append(f"""<!DOCTYPE html>
+        # Source previews are highlighted by the report JavaScript itself, unless turned off
+        body_attributes = ' data-syntax-highlighting="off"' if self.content_generator.syntax_highlighting == "off" else ""
+        
+        # HTML header with external CSS files (golden branding)
+        yield f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Documentation Coverage Report - {report.timestamp}</title>
-    <!-- Highlight.js CSS -->
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.8.0/styles/vs2015.min.css">
-    <style>
-        {self._get_complete_css()}
-    </style>
+    <title>{title}</title>
+    {styles}
 </head>
-<body>
+<body{body_attributes}>
     <div class="theme-toggle">
         <button id="theme-toggle-btn" class="theme-toggle-btn" aria-label="Toggle theme">
             <span class="theme-icon light-icon">☀️</span>
@@ -83,52 +180,84 @@ class HtmlGenerator:
         </button>
     </div>
     
-    <div class="container">""")
-        
-        # Generate all content sections using the content generator
-        output.append(self.content_generator.generate_header(report))
-        output.append(self.content_generator.generate_overview_cards(report))
-        output.append(self.content_generator.generate_quality_metrics(report))
-        output.append(self.content_generator.generate_priority_breakdown(report))
-        output.append(self.content_generator.generate_gaps_analysis(report))
-        output.append(self.content_generator.generate_recommendations(report))
-        output.append(self.content_generator.generate_footer(report))
+    <div class="container">"""
+    
+    def iter_document_tail(self, report: CoverageReport, script_hrefs: Optional[List[str]] = None) -> Iterator[str]:
+        """Yield the end of the page: modals, embedded sources and scripts.
         
+        Args:
+            report: Coverage report whose gap sources are embedded
+            script_hrefs: Load the report JavaScript (and any other scripts)
+                from these URLs instead of inlining it
+        """
         # Close container
-        output.append("    </div>")
+        yield "\n    </div>"
         
         # Add modals
-        output.append(self._get_modals())
+        yield "\n" + self._get_modals()
         
         # Add source code embedding for modal system
-        output.append(self.content_generator.generate_source_code_embedding(report))
-        
-        # Add highlight.js JavaScript and the main application JavaScript
-        output.append("""
-    <!-- Highlight.js JavaScript -->
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.8.0/highlight.min.js"></script>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.8.0/languages/typescript.min.js"></script>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.8.0/languages/javascript.min.js"></script>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.8.0/languages/python.min.js"></script>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.8.0/languages/css.min.js"></script>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.8.0/languages/json.min.js"></script>
-    <script>""")
-        
-        # Add the JavaScript content using concatenation instead of f-strings
-        output.append(self._get_complete_javascript())
+        yield "\n"
+        yield from self.content_generator.iter_source_code_embedding(report)
         
-        # Close the script tag
-        output.append("    </script>")
+        # Add the main application JavaScript
+        if script_hrefs:
+            yield "".join(f"""
+    <script src="{href}"></script>""" for href in script_hrefs)
+        else:
+            yield "\n    <script>"
+            
+            # Add the JavaScript content using concatenation instead of f-strings
+            yield "\n" + self._get_complete_javascript()
+            
+            # Close the script tag
+            yield "\n    </script>"
         
         # Close HTML
-        output.append("""
+        yield "\n" + """
 </body>
-</html>""")
+</html>"""
+    
+    def _get_asset_bundle(self, extra_javascript: str = "") -> AssetBundle:
+        """Get the CSS/JS bundle, rebuilt only when asset source files change.
+        
+        extra_javascript is script the page loads besides the bundle (such as
+        the html-site navigation); CSS rules for the classes it uses are kept.
+        """
+        html_config = self.config.get("reporting", {}).get("html", {})
+        cache_dir = html_config.get("asset_cache_dir", DEFAULT_ASSET_CACHE_DIR)
+        minify = html_config.get("minify_assets", True)
+        variant = "minified" if minify else "source"
+        if extra_javascript:
+            variant += "-" + hashlib.sha256(extra_javascript.encode('utf-8')).hexdigest()[:12]
+        return get_asset_bundle(
+            lambda: self._build_assets(minify, extra_javascript),
+            cache_dir,
+            variant=variant
+        )
+    
+    def _build_assets(self, minify: bool, extra_javascript: str = "") -> Tuple[str, str, bool]:
+        """Build the CSS and JavaScript, minified and with unused CSS rules dropped if requested.
         
-        return "\n".join(output)
+        The last item is True when either fell back to its minimal version.
+        """
+        self._assets_degraded = False
+        css = self._build_complete_css()
+        js = self._build_complete_javascript()
+        if minify:
+            css, js = minify_css(css, ClassUsage.for_report(js, extra_javascript)), minify_js(js)
+        return css, js, self._assets_degraded
     
     def _get_complete_css(self) -> str:
         """Get the complete CSS with golden branding."""
+        return self._get_asset_bundle().css
+    
+    def _get_complete_javascript(self) -> str:
+        """Get the complete JavaScript with all modal and interaction functions."""
+        return self._get_asset_bundle().js
+    
+    def _build_complete_css(self) -> str:
+        """Build the complete CSS with golden branding from the stylesheets."""
         try:
             # Load all CSS files
             main_css = self.template_loader.load_style('main.css')
@@ -151,6 +280,7 @@ class HtmlGenerator:
         except Exception as e:
             print(f"❌ Failed to load CSS: {e}")
             # Fallback to minimal CSS
+            self._assets_degraded = True
             return """
             body { font-family: Arial, sans-serif; margin: 40px; }
             .error { background: #fee; border: 1px solid #fcc; padding: 20px; border-radius: 8px; }
@@ -219,8 +349,8 @@ class HtmlGenerator:
             print(f"❌ Failed to load modals: {e}")
             return ""
     
-    def _get_complete_javascript(self) -> str:
-        """Get the complete JavaScript with all modal and interaction functions - FIXED VERSION."""
+    def _build_complete_javascript(self) -> str:
+        """Build the complete JavaScript with all modal and interaction functions - FIXED VERSION."""
         try:
             # PRIORITY: Use the FIXED JavaScript system with all features
             from .js_main import get_complete_javascript
@@ -241,9 +371,11 @@ class HtmlGenerator:
             except Exception as e2:
                 print(f"❌ Alternate import also failed: {e2}")
                 # Final fallback - create basic working JavaScript inline
+                self._assets_degraded = True
                 return self._get_fallback_javascript()
         except Exception as e:
             print(f"❌ Error getting complete JavaScript: {e}")
+            self._assets_degraded = True
             return self._get_fallback_javascript()
     
     def _get_fallback_javascript(self) -> str:
@@ -7,6 +7,9 @@ class ModalManager {
     constructor() {
         this.activeModal = null;
         this.fileMetadata = {};
+        this.sourceBlobPromise = null;
+        this.sourceChunkBase = '';
+        this.sourceChunkPromises = new Map();
         this.currentFilePath = null;
         this.isDestroyed = false;
         this.originalBodyOverflow = '';
@@ -25,9 +28,22 @@ class ModalManager {
     
     loadEmbeddedSourceCode() {
         try {
+            const sourceIndexScript = document.querySelector('script[data-source-index="true"]');
             const sourceCodeScript = document.querySelector('script[data-source-code="true"]');
             
-            if (sourceCodeScript) {
+            if (sourceIndexScript) {
+                // Compact and sidecar embedding: only the index is parsed now, the
+                // compressed blob or chunk is inflated when a source modal opens
+                try {
+                    const sourceIndex = JSON.parse(sourceIndexScript.textContent);
+                    this.fileMetadata = sourceIndex.files || {};
+                    this.sourceChunkBase = sourceIndex.chunkBase || '';
+                    console.log(`📄 Indexed source code for ${Object.keys(this.fileMetadata).length} files`);
+                } catch (e) {
+                    console.warn('Failed to parse source code index:', e);
+                    this.fileMetadata = {};
+                }
+            } else if (sourceCodeScript) {
                 try {
                     this.fileMetadata = JSON.parse(sourceCodeScript.textContent);
                     console.log(`📄 Loaded source code for ${Object.keys(this.fileMetadata).length} files`);
@@ -151,6 +167,8 @@ class ModalManager {
         this.isDestroyed = true;
         this.activeModal = null;
         this.fileMetadata = {};
+        this.sourceBlobPromise = null;
+        this.sourceChunkPromises.clear();
         this.currentFilePath = null;
         document.body.style.overflow = this.originalBodyOverflow;
     }
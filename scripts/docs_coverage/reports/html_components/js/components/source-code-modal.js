@@ -59,10 +59,117 @@ function extendModalManagerWithSourceCode() {
         }, 100);
     };
 
+    ModalManager.prototype.loadSourceBlob = function() {
+        // Inflate the compressed source blob once and reuse it for every modal
+        if (!this.sourceBlobPromise) {
+            const blobScript = document.querySelector('script[data-source-blob="true"]');
+            
+            if (!blobScript) {
+                return Promise.reject(new Error('Source code data not found'));
+            }
+            if (typeof DecompressionStream === 'undefined') {
+                return Promise.reject(new Error('This browser cannot decompress the embedded source code'));
+            }
+            
+            this.sourceBlobPromise = this.inflateBase64(blobScript.textContent.trim())
+                .catch(e => {
+                    this.sourceBlobPromise = null;
+                    throw e;
+                });
+        }
+        
+        return this.sourceBlobPromise;
+    };
+
+    ModalManager.prototype.inflateBase64 = function(encoded) {
+        const binary = atob(encoded);
+        const bytes = new Uint8Array(binary.length);
+        for (let i = 0; i < binary.length; i++) {
+            bytes[i] = binary.charCodeAt(i);
+        }
+        
+        const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('deflate'));
+        return new Response(stream).arrayBuffer().then(buffer => new Uint8Array(buffer));
+    };
+
+    ModalManager.prototype.loadSourceChunk = function(hash) {
+        // Sidecar chunks are scripts calling docsCoverageSourceChunk(hash, base64),
+        // loaded on demand so only the sources of opened modals are downloaded
+        if (this.sourceChunkPromises.has(hash)) {
+            return this.sourceChunkPromises.get(hash);
+        }
+        if (typeof DecompressionStream === 'undefined') {
+            return Promise.reject(new Error('This browser cannot decompress the source code'));
+        }
+        
+        const pending = window.docsCoverageSourceChunkCallbacks = window.docsCoverageSourceChunkCallbacks || {};
+        window.docsCoverageSourceChunk = window.docsCoverageSourceChunk || function(chunkHash, encoded) {
+            const callback = pending[chunkHash];
+            if (callback) {
+                delete pending[chunkHash];
+                callback(encoded);
+            }
+        };
+        
+        const promise = new Promise((resolve, reject) => {
+            const script = document.createElement('script');
+            script.src = `${this.sourceChunkBase}${hash.slice(0, 2)}/${hash}.js`;
+            script.async = true;
+            pending[hash] = encoded => {
+                script.remove();
+                resolve(encoded);
+            };
+            script.onerror = () => {
+                delete pending[hash];
+                script.remove();
+                reject(new Error(`Could not load source chunk ${script.src}`));
+            };
+            document.head.appendChild(script);
+        })
+            .then(encoded => this.inflateBase64(encoded))
+            .then(bytes => new TextDecoder('utf-8').decode(bytes))
+            .catch(e => {
+                this.sourceChunkPromises.delete(hash);
+                throw e;
+            });
+        
+        this.sourceChunkPromises.set(hash, promise);
+        return promise;
+    };
+
     ModalManager.prototype.loadAndDisplaySourceCode = function(filePath, loading, error, content, codeText) {
         const fileInfo = this.fileMetadata[filePath];
         
-        if (fileInfo && fileInfo.content_base64) {
+        if (fileInfo && fileInfo.external) {
+            const sizeKb = Math.round(fileInfo.size / 1024);
+            this.displaySourceCodeError(`This file is too large to embed (${sizeKb} KB). Use the GitHub button to view it.`, loading, error, content);
+        } else if (fileInfo && fileInfo.error) {
+            this.displaySourceCodeError(fileInfo.error, loading, error, content);
+        } else if (fileInfo && fileInfo.offset !== undefined) {
+            this.loadSourceBlob()
+                .then(bytes => {
+                    // Ignore results for a modal that has since been switched to another file
+                    if (this.isDestroyed || this.currentFilePath !== filePath) { return; }
+                    const source = new TextDecoder('utf-8').decode(
+                        bytes.subarray(fileInfo.offset, fileInfo.offset + fileInfo.length)
+                    );
+                    this.displaySourceCode(source, fileInfo.language, loading, error, content, codeText, fileInfo.tokens);
+                })
+                .catch(e => {
+                    console.error('Failed to decompress source code:', e);
+                    this.displaySourceCodeError(e.message || 'Failed to decompress source code', loading, error, content);
+                });
+        } else if (fileInfo && fileInfo.chunk) {
+            this.loadSourceChunk(fileInfo.chunk)
+                .then(source => {
+                    if (this.isDestroyed || this.currentFilePath !== filePath) { return; }
+                    this.displaySourceCode(source, fileInfo.language, loading, error, content, codeText, fileInfo.tokens);
+                })
+                .catch(e => {
+                    console.error('Failed to load source code chunk:', e);
+                    this.displaySourceCodeError(e.message || 'Failed to load source code', loading, error, content);
+                });
+        } else if (fileInfo && fileInfo.content_base64) {
             try {
                 // Decode base64 content back to normal text
                 const decodedContent = atob(fileInfo.content_base64);
@@ -78,7 +185,7 @@ function extendModalManagerWithSourceCode() {
         }
     };
 
-    ModalManager.prototype.displaySourceCode = function(sourceContent, language, loading, error, content, codeText) {
+    ModalManager.prototype.displaySourceCode = function(sourceContent, language, loading, error, content, codeText, tokens) {
         if (!content || !codeText) { return; }
         
         if (loading) { loading.style.display = 'none'; }
@@ -89,7 +196,7 @@ function extendModalManagerWithSourceCode() {
         codeText.className = '';
         codeText.textContent = sourceContent;
         
-        applySyntaxHighlighting(codeText, language);
+        applySyntaxHighlighting(codeText, language, tokens);
         
         console.log('📄 Source code displayed successfully');
     };
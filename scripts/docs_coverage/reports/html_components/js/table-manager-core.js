@@ -2,12 +2,16 @@
 class TableManagerCore {
     constructor() {
         this.table = null;
-        this.allRows = [];
-        this.filteredRows = [];
+        this.gapData = null;
+        this.renderer = null;
+        this.queryEngine = null;
+        this.totalRows = 0;
+        this.filteredCount = 0;
+        this.pageRows = [];
         this.currentPage = 1;
         this.pageSize = 50;
         this.totalPages = 1;
-        this.currentFilter = 'all';
+        this.facetFilters = {};
         this.searchTerm = '';
         this.sortState = this.createSafeSortState();
         this.columnWidths = {};
@@ -82,6 +86,7 @@ class TableManagerCore {
             this.setupTable();
             this.setupEventHandlers();
             this.loadPersistedState();
+            this.syncControls();
             this.updateDisplay();
             
             this.isInitialized = true;
@@ -99,13 +104,28 @@ class TableManagerCore {
             return;
         }
         
-        this.allRows = Array.from(this.table.querySelectorAll('tbody tr'));
-        this.filteredRows = [...this.allRows];
+        // Rows are ids into the embedded columnar gap data; only the visible
+        // window of the current page is ever rendered into the DOM
+        this.gapData = window.GapTableData ? window.GapTableData.fromDocument() : null;
+        if (!this.gapData) {
+            console.warn('⚠️ Gap table data not found!');
+            return;
+        }
+        
+        // Search, filters and sorting run off the main thread; it only gets page row ids
+        this.queryEngine = window.GapQueryEngine ? window.GapQueryEngine.fromDocument() : null;
+        this.totalRows = this.gapData.count;
+        this.filteredCount = this.totalRows;
+        this.renderer = new window.VirtualTableRenderer(
+            this,
+            document.getElementById('gaps-table-body'),
+            document.querySelector('.advanced-table-body')
+        );
         
         // Setup scroll sync
         this.setupScrollSync();
         
-        console.log(`📊 Found ${this.allRows.length} table rows`);
+        console.log(`📊 Loaded ${this.totalRows} table rows`);
     }
     
     setupScrollSync() {
@@ -212,33 +232,21 @@ class TableManagerCore {
             if (this.isDestroyed) { return; }
             
             const row = e.target.closest('tr');
-            if (row && row.classList.contains('gap-row')) {
-                const filePath = row.dataset.filePath || row.cells[0]?.textContent || '';
-                if (filePath) {
-                    this.openSourceModal(filePath);
-                }
+            if (row && row.classList.contains('gap-row') && row.dataset.filePath) {
+                this.openSourceModal(row);
             }
         });
         
         console.log('🖱️ Row click handler attached');
     }
     
-    openSourceModal(filePath) {
+    openSourceModal(row) {
+        const filePath = row.dataset.filePath;
         console.log(`📄 Opening source code modal for: ${filePath}`);
         
         // Use the modal manager if available
         if (window.modalManager && window.modalManager.showSourceCodeModal) {
-            // Find the row with this file path for the modal manager
-            const row = Array.from(this.allRows).find(r => 
-                r.dataset.filePath === filePath || 
-                r.cells[0]?.textContent === filePath
-            );
-            
-            if (row) {
-                window.modalManager.showSourceCodeModal(row);
-            } else {
-                console.warn(`⚠️ Could not find row for file: ${filePath}`);
-            }
+            window.modalManager.showSourceCodeModal(row);
         } else {
             // Fallback to basic modal opening
             this.openBasicModal(filePath);
@@ -319,17 +327,35 @@ class TableManagerCore {
     updateDisplay() {
         if (this.isDestroyed) { return; }
         
+        if (!this.queryEngine) {
+            this.displayRows({ total: 0, page: 1, rows: [] });
+            return;
+        }
+        
+        // Answered asynchronously; a newer call supersedes one still pending
+        this.queryEngine.request({
+            searchTerm: this.searchTerm,
+            facetFilters: this.facetFilters,
+            sortState: this.sortState,
+            page: this.currentPage,
+            pageSize: this.pageSize
+        }, (result) => this.displayRows(result));
+    }
+    
+    displayRows(result) {
+        if (this.isDestroyed) { return; }
+        
         try {
-            this.totalPages = Math.ceil(this.filteredRows.length / this.pageSize);
-            if (this.currentPage > this.totalPages) {
-                this.currentPage = Math.max(1, this.totalPages);
-            }
+            this.filteredCount = result.total;
+            this.pageRows = result.rows;
+            this.currentPage = result.page;
+            this.totalPages = Math.ceil(this.filteredCount / this.pageSize);
             
             const emptyState = document.getElementById('empty-state');
             const table = document.getElementById('gaps-table');
             const paginationContainer = document.querySelector('.pagination-container');
             
-            if (this.filteredRows.length === 0) {
+            if (this.filteredCount === 0) {
                 if (emptyState) { emptyState.style.display = 'block'; }
                 if (table) { table.style.display = 'none'; }
                 if (paginationContainer) { paginationContainer.style.display = 'none'; }
@@ -338,18 +364,14 @@ class TableManagerCore {
                 if (table) { table.style.display = 'table'; }
                 if (paginationContainer) { paginationContainer.style.display = 'flex'; }
                 
-                this.reorderTableRows();
-                
-                this.allRows.forEach(row => row.style.display = 'none');
-                
-                const startIndex = (this.currentPage - 1) * this.pageSize;
-                const endIndex = startIndex + this.pageSize;
-                
-                this.filteredRows.slice(startIndex, endIndex).forEach(row => {
-                    row.style.display = '';
-                });
+                if (this.renderer) {
+                    this.renderer.setRows(this.pageRows);
+                }
             }
             
+            const filteredCount = document.getElementById('filtered-count');
+            if (filteredCount) { filteredCount.textContent = this.filteredCount; }
+            
             if (this.pagination) {
                 this.pagination.updatePaginationInfo();
                 this.pagination.updatePaginationButtons();
@@ -364,27 +386,6 @@ class TableManagerCore {
         }
     }
     
-    reorderTableRows() {
-        if (!this.table || !this.filteredRows.length) { return; }
-        
-        const tbody = this.table.querySelector('tbody');
-        if (!tbody) { return; }
-        
-        const fragment = document.createDocumentFragment();
-        
-        this.filteredRows.forEach(row => {
-            fragment.appendChild(row);
-        });
-        
-        this.allRows.forEach(row => {
-            if (!this.filteredRows.includes(row)) {
-                fragment.appendChild(row);
-            }
-        });
-        
-        tbody.appendChild(fragment);
-    }
-    
     loadPersistedState() {
         if (window.TableStateManager) {
             const stateManager = new window.TableStateManager(this);
@@ -392,6 +393,11 @@ class TableManagerCore {
         }
     }
     
+    syncControls() {
+        if (this.filtering) { this.filtering.syncControls(); }
+        if (this.pagination) { this.pagination.syncControls(); }
+    }
+    
     saveState() {
         if (window.TableStateManager) {
             const stateManager = new window.TableStateManager(this);
@@ -402,9 +408,14 @@ class TableManagerCore {
     destroy() {
         this.isDestroyed = true;
         this.isInitialized = false;
+        if (this.renderer) { this.renderer.destroy(); }
+        if (this.queryEngine) { this.queryEngine.destroy(); }
+        this.renderer = null;
+        this.queryEngine = null;
+        this.gapData = null;
         this.table = null;
-        this.allRows = [];
-        this.filteredRows = [];
+        this.pageRows = [];
+        this.filteredCount = 0;
         this.sortState = this.createSafeSortState();
     }
 }
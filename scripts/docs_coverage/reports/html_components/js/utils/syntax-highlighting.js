@@ -1,107 +1,315 @@
 /**
  * Syntax Highlighting Utilities
- * Provides syntax highlighting for source code display in modals
+ * Provides syntax highlighting for source code display in modals.
+ *
+ * A small built-in tokenizer replaces highlight.js: grammars are compiled the
+ * first time a source modal opens, each file is tokenized in a single regex
+ * pass, and large files are highlighted in slices between animation frames.
+ * The report generator can also ship pre-tokenized streams for large files
+ * (see syntax_tokens.py, which mirrors these grammars).
  */
 
-function applySyntaxHighlighting(element, language) {
-    if (!element) { return; }
-    
-    // Strategy 1: Use hljs if available
-    if (window.hljs && typeof window.hljs.highlightElement === 'function') {
-        try {
-            element.className = '';
-            if (language) {
-                element.classList.add(`language-${language}`);
+// CSS classes of the token kinds; pre-tokenized streams refer to kinds by index
+const SYNTAX_TOKEN_CLASSES = [
+    'hljs-keyword', 'hljs-literal', 'hljs-built_in', 'hljs-type', 'hljs-string',
+    'hljs-comment', 'hljs-number', 'hljs-regexp', 'hljs-title function_', 'hljs-title class_',
+    'hljs-variable language_', 'hljs-meta', 'hljs-name', 'hljs-attr', 'hljs-selector-class'
+];
+
+const SYNTAX_TOKEN = {
+    KEYWORD: 0, LITERAL: 1, BUILT_IN: 2, TYPE: 3, STRING: 4, COMMENT: 5, NUMBER: 6, REGEXP: 7,
+    FUNCTION: 8, CLASS: 9, LANGUAGE: 10, META: 11, NAME: 12, ATTR: 13, SELECTOR: 14
+};
+
+// Characters highlighted per animation frame; smaller files are highlighted at once
+const SYNTAX_SLICE_CHARS = 32 * 1024;
+
+// Words after which a "/" starts a regular expression rather than a division
+const SYNTAX_REGEXP_PREFIX_WORDS = 'return typeof instanceof in of new delete void throw case do else yield await';
+
+const SYNTAX_STRING_PATTERNS = {
+    double: '"(?:[^"\\\\\\n]|\\\\[\\s\\S])*"?',
+    single: "'(?:[^'\\\\\\n]|\\\\[\\s\\S])*'?"
+};
+
+// Grammar sources: alternatives of one regex, each either a token kind or a rule
+// ('word' classifies identifiers, 'regexp_literal' checks the regex literal context)
+const SYNTAX_GRAMMAR_SOURCES = {
+    script: {
+        rules: [
+            [SYNTAX_TOKEN.COMMENT, '\\/\\/[^\\n]*|\\/\\*[\\s\\S]*?\\*\\/|\\/\\*[\\s\\S]*'],
+            [SYNTAX_TOKEN.STRING, `${SYNTAX_STRING_PATTERNS.double}|${SYNTAX_STRING_PATTERNS.single}|\`(?:[^\`\\\\]|\\\\[\\s\\S])*\`?`],
+            ['regexp_literal', '\\/(?![*\\/])(?:[^\\/\\\\\\[\\n]|\\\\.|\\[(?:[^\\]\\\\\\n]|\\\\.)*\\])+\\/[a-z]*'],
+            [SYNTAX_TOKEN.NUMBER, '(?<![\\w$.])(?:0[xXbBoO][\\da-fA-F_]+n?|(?:\\d[\\d_]*(?:\\.[\\d_]*)?|\\.\\d[\\d_]*)(?:[eE][+-]?\\d+)?n?)'],
+            [SYNTAX_TOKEN.META, '@[A-Za-z_$][\\w$.]*'],
+            [SYNTAX_TOKEN.NAME, '(?<![\\w$)\\]])<\\/?[A-Za-z][\\w.:-]*'],
+            ['word', '[A-Za-z_$][\\w$]*']
+        ],
+        keywords: 'break case catch class const continue debugger default delete do else export extends finally for from function if import in instanceof let new of return static switch throw try typeof var void while with yield async await get set as',
+        literals: 'true false null undefined NaN Infinity',
+        builtIns: 'Array Boolean console Date document Error JSON Map Math Number Object Promise Reflect RegExp Set String Symbol WeakMap WeakSet window globalThis process require module exports',
+        language: 'this super arguments'
+    },
+    python: {
+        rules: [
+            [SYNTAX_TOKEN.COMMENT, '#[^\\n]*'],
+            [SYNTAX_TOKEN.STRING, `[rRbBuUfF]{0,2}(?:"""[\\s\\S]*?"""|'''[\\s\\S]*?'''|"""[\\s\\S]*|'''[\\s\\S]*|${SYNTAX_STRING_PATTERNS.double}|${SYNTAX_STRING_PATTERNS.single})`],
+            [SYNTAX_TOKEN.NUMBER, '(?<![\\w.])(?:0[xXbBoO][\\da-fA-F_]+|(?:\\d[\\d_]*(?:\\.[\\d_]*)?|\\.\\d[\\d_]*)(?:[eE][+-]?\\d+)?j?)'],
+            [SYNTAX_TOKEN.META, '@[A-Za-z_][\\w.]*'],
+            ['word', '[A-Za-z_]\\w*']
+        ],
+        keywords: 'and as assert async await break class continue def del elif else except finally for from global if import in is lambda nonlocal not or pass raise return try while with yield match case',
+        literals: 'True False None',
+        builtIns: 'print len range open dict list set tuple str int float bool bytes type isinstance issubclass super enumerate zip map filter sorted reversed min max sum abs any all getattr setattr hasattr repr iter next object Exception',
+        language: 'self cls'
+    },
+    css: {
+        rules: [
+            [SYNTAX_TOKEN.COMMENT, '\\/\\*[\\s\\S]*?\\*\\/|\\/\\*[\\s\\S]*|(?<![:(\\w])\\/\\/[^\\n]*'],
+            [SYNTAX_TOKEN.STRING, `${SYNTAX_STRING_PATTERNS.double}|${SYNTAX_STRING_PATTERNS.single}`],
+            [SYNTAX_TOKEN.KEYWORD, '@[\\w-]+|!important'],
+            [SYNTAX_TOKEN.SELECTOR, '(?<![\\w-])[.#][A-Za-z_-][\\w-]*(?=[^;{}]*\\{)'],
+            [SYNTAX_TOKEN.ATTR, '(?<![\\w-])-?[A-Za-z][\\w-]*(?=\\s*:[^;{}]*[;}])'],
+            [SYNTAX_TOKEN.NUMBER, '#[\\da-fA-F]{3,8}(?![\\w-])|(?<![\\w-])-?(?:\\d+\\.?\\d*|\\.\\d+)(?:%|[A-Za-z]+)?']
+        ]
+    },
+    json: {
+        rules: [
+            [SYNTAX_TOKEN.ATTR, '"(?:[^"\\\\\\n]|\\\\[\\s\\S])*"(?=\\s*:)'],
+            [SYNTAX_TOKEN.STRING, SYNTAX_STRING_PATTERNS.double],
+            [SYNTAX_TOKEN.NUMBER, '-?\\d+(?:\\.\\d+)?(?:[eE][+-]?\\d+)?'],
+            [SYNTAX_TOKEN.LITERAL, '\\b(?:true|false|null)\\b']
+        ]
+    },
+    shell: {
+        rules: [
+            [SYNTAX_TOKEN.COMMENT, '(?<![^\\s])#[^\\n]*'],
+            [SYNTAX_TOKEN.STRING, `${SYNTAX_STRING_PATTERNS.double}|${SYNTAX_STRING_PATTERNS.single}`],
+            [SYNTAX_TOKEN.NUMBER, '(?<![\\w.-])\\d+(?:\\.\\d+)?(?![\\w.-])']
+        ]
+    }
+};
+
+// TypeScript is JavaScript plus its own keywords and primitive types
+const SYNTAX_TYPESCRIPT_KEYWORDS = 'abstract declare enum implements interface keyof namespace private protected public readonly type satisfies infer is asserts override';
+const SYNTAX_TYPESCRIPT_TYPES = 'any boolean never number object string symbol unknown bigint';
+
+const SYNTAX_LANGUAGE_GRAMMARS = {
+    javascript: 'script', typescript: 'script', python: 'python', css: 'css', scss: 'css',
+    sass: 'css', less: 'css', json: 'json', bash: 'shell', yaml: 'shell'
+};
+
+const syntaxGrammarCache = new Map();
+
+// Compile the grammar of a language on first use; null for languages shown as plain text
+function getSyntaxGrammar(language) {
+    if (syntaxGrammarCache.has(language)) {
+        return syntaxGrammarCache.get(language);
+    }
+
+    const name = SYNTAX_LANGUAGE_GRAMMARS[language];
+    let grammar = null;
+    if (name) {
+        const source = SYNTAX_GRAMMAR_SOURCES[name];
+        const words = text => new Set(text ? text.split(' ') : []);
+        const typescript = language === 'typescript';
+        grammar = {
+            pattern: new RegExp(source.rules.map(([, pattern]) => `(${pattern})`).join('|'), 'g'),
+            rules: source.rules.map(([rule]) => rule),
+            keywords: words(typescript ? `${source.keywords} ${SYNTAX_TYPESCRIPT_KEYWORDS}` : source.keywords),
+            types: words(typescript ? SYNTAX_TYPESCRIPT_TYPES : ''),
+            literals: words(source.literals),
+            builtIns: words(source.builtIns),
+            language: words(source.language),
+            regexpPrefixes: words(SYNTAX_REGEXP_PREFIX_WORDS)
+        };
+    }
+    syntaxGrammarCache.set(language, grammar);
+    return grammar;
+}
+
+function classifySyntaxWord(grammar, source, word, end) {
+    if (grammar.keywords.has(word)) { return SYNTAX_TOKEN.KEYWORD; }
+    if (grammar.literals.has(word)) { return SYNTAX_TOKEN.LITERAL; }
+    if (grammar.language.has(word)) { return SYNTAX_TOKEN.LANGUAGE; }
+    if (grammar.types.has(word)) { return SYNTAX_TOKEN.TYPE; }
+    if (grammar.builtIns.has(word)) { return SYNTAX_TOKEN.BUILT_IN; }
+
+    let next = end;
+    while (source[next] === ' ' || source[next] === '\t') { next++; }
+    if (source[next] === '(') { return SYNTAX_TOKEN.FUNCTION; }
+    if (word[0] >= 'A' && word[0] <= 'Z') { return SYNTAX_TOKEN.CLASS; }
+    return null;
+}
+
+// A "/" starts a regex literal unless it follows an operand (identifier, number, string, ")" or "]")
+function isSyntaxRegexpAllowed(grammar, source, start) {
+    let index = start - 1;
+    while (index >= 0 && /\s/.test(source[index])) { index--; }
+    if (index < 0 || !/[\w$)\]"'`]/.test(source[index])) {
+        return true;
+    }
+    let wordStart = index;
+    while (wordStart > 0 && /[\w$]/.test(source[wordStart - 1])) { wordStart--; }
+    return grammar.regexpPrefixes.has(source.slice(wordStart, index + 1));
+}
+
+// Returns a function yielding [start, end, kind] tokens in order, then null
+function createSyntaxTokenizer(grammar, source) {
+    const pattern = new RegExp(grammar.pattern.source, 'g');
+    let pos = 0;
+
+    return () => {
+        while (pos < source.length) {
+            pattern.lastIndex = pos;
+            const match = pattern.exec(source);
+            if (!match) {
+                pos = source.length;
+                return null;
+            }
+
+            const start = match.index;
+            const end = start + match[0].length;
+            let group = 1;
+            while (match[group] === undefined) { group++; }
+            let kind = grammar.rules[group - 1];
+
+            if (kind === 'regexp_literal') {
+                if (!isSyntaxRegexpAllowed(grammar, source, start)) {
+                    pos = start + 1;
+                    continue;
+                }
+                kind = SYNTAX_TOKEN.REGEXP;
+            } else if (kind === 'word') {
+                kind = classifySyntaxWord(grammar, source, match[0], end);
+            }
+
+            pos = Math.max(end, start + 1);
+            if (kind !== null) {
+                return [start, end, kind];
             }
-            window.hljs.highlightElement(element);
-            console.log('✨ Syntax highlighting applied with hljs');
-            return;
-        } catch (e) {
-            console.warn('Failed to apply hljs highlighting:', e);
         }
-    }
-    
-    // Strategy 2: Use hljs.highlightBlock (older API)
-    if (window.hljs && typeof window.hljs.highlightBlock === 'function') {
-        try {
-            element.className = language ? `language-${language}` : '';
-            window.hljs.highlightBlock(element);
-            console.log('✨ Syntax highlighting applied with hljs (legacy)');
-            return;
-        } catch (e) {
-            console.warn('Failed to apply hljs legacy highlighting:', e);
+        return null;
+    };
+}
+
+// Decode a pre-tokenized stream: base64 varints of (gap since the previous token, length, kind)
+function decodeSyntaxTokens(encoded) {
+    const bytes = atob(encoded);
+    let index = 0;
+    let pos = 0;
+
+    const varint = () => {
+        let value = 0;
+        let shift = 0;
+        let byte;
+        do {
+            byte = bytes.charCodeAt(index++);
+            value += (byte & 0x7f) * 2 ** shift;
+            shift += 7;
+        } while (byte & 0x80);
+        return value;
+    };
+
+    return () => {
+        if (index >= bytes.length) { return null; }
+        const start = pos + varint();
+        const end = start + varint();
+        const kind = varint();
+        pos = end;
+        return [start, end, kind];
+    };
+}
+
+function escapeSourceHtml(text) {
+    return text.replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;');
+}
+
+// Render the source from state.pos up to limit, extended to the end of a token crossing it
+function renderSyntaxSlice(source, state, limit) {
+    const parts = [];
+    let pos = state.pos;
+
+    for (;;) {
+        const token = state.pending || state.nextToken();
+        state.pending = null;
+        if (!token || token[0] >= limit) {
+            state.pending = token;
+            break;
         }
+        const [start, end, kind] = token;
+        // Skip tokens that do not fit the source (e.g. a stale pre-tokenized stream)
+        if (start < pos || end > source.length || !SYNTAX_TOKEN_CLASSES[kind]) { continue; }
+
+        parts.push(
+            escapeSourceHtml(source.slice(pos, start)),
+            `<span class="${SYNTAX_TOKEN_CLASSES[kind]}">`, escapeSourceHtml(source.slice(start, end)), '</span>'
+        );
+        pos = end;
+    }
+    if (pos < limit) {
+        parts.push(escapeSourceHtml(source.slice(pos, limit)));
+        pos = limit;
     }
-    
-    // Strategy 3: Manual highlighting with classes
+
+    state.pos = pos;
+    return parts.join('');
+}
+
+/**
+ * Highlight the text of an element
+ * @param {HTMLElement} element - Element whose text content is the source
+ * @param {string} language - Language from the source index
+ * @param {string} [encodedTokens] - Pre-tokenized stream from the source index
+ */
+function applySyntaxHighlighting(element, language, encodedTokens) {
+    if (!element) { return; }
+
+    const source = element.textContent;
+    element.className = `hljs language-${language || 'text'}`;
+    // Each call supersedes slices still pending from an earlier one
+    const generation = (element.syntaxHighlightGeneration || 0) + 1;
+    element.syntaxHighlightGeneration = generation;
+
+    if (document.body && document.body.dataset.syntaxHighlighting === 'off') { return; }
+
+    let nextToken = null;
     try {
-        applyManualSyntaxHighlighting(element, language);
-        console.log('✨ Manual syntax highlighting applied');
+        if (encodedTokens) {
+            nextToken = decodeSyntaxTokens(encodedTokens);
+        } else {
+            const grammar = getSyntaxGrammar(language);
+            nextToken = grammar && createSyntaxTokenizer(grammar, source);
+        }
     } catch (e) {
-        console.warn('Failed to apply manual highlighting:', e);
+        console.warn('Failed to prepare syntax highlighting:', e);
     }
-}
+    if (!nextToken) { return; }
 
-function applyManualSyntaxHighlighting(element, language) {
-    const content = element.textContent;
-    element.className = `hljs language-${language || 'javascript'}`;
-    
-    let html = content;
-    
-    // Keywords - language specific
-    const keywordSets = {
-        javascript: [
-            'import', 'export', 'from', 'const', 'let', 'var', 'function', 'return', 'if', 'else', 'for', 'while', 
-            'class', 'extends', 'async', 'await', 'try', 'catch', 'finally', 'throw', 'new', 'this', 'super', 
-            'true', 'false', 'null', 'undefined', 'typeof', 'instanceof'
-        ],
-        typescript: [
-            'import', 'export', 'from', 'const', 'let', 'var', 'function', 'return', 'if', 'else', 'for', 'while', 
-            'class', 'interface', 'type', 'enum', 'extends', 'implements', 'public', 'private', 'protected', 
-            'static', 'readonly', 'async', 'await', 'try', 'catch', 'finally', 'throw', 'new', 'this', 'super', 
-            'true', 'false', 'null', 'undefined'
-        ],
-        python: [
-            'import', 'from', 'def', 'class', 'return', 'if', 'else', 'elif', 'for', 'while', 'try', 'except', 
-            'finally', 'raise', 'with', 'as', 'pass', 'break', 'continue', 'True', 'False', 'None'
-        ],
-        css: [
-            'import', 'media', 'keyframes', 'from', 'to', 'important', 'hover', 'active', 'focus', 'visited', 
-            'first-child', 'last-child'
-        ]
-    };
-    
-    const keywords = keywordSets[language] || keywordSets.javascript;
-    
-    keywords.forEach(keyword => {
-        const regex = new RegExp('\\b' + keyword + '\\b', 'g');
-        html = html.replace(regex, `<span class="hljs-keyword">${keyword}</span>`);
-    });
-    
-    // Strings - fixed regex escaping
-    html = html.replace(/(["'`])((?:\\.|(?!\1)[^\\])*?)\1/g, '<span class="hljs-string">$1$2$1</span>');
-    
-    // Comments - language specific with proper escaping
-    if (language === 'python') {
-        html = html.replace(/(#.*$)/gm, '<span class="hljs-comment">$1</span>');
-        html = html.replace(/("""[\s\S]*?""")/g, '<span class="hljs-comment">$1</span>');
-    } else if (language === 'css') {
-        html = html.replace(/(\/\*[\s\S]*?\*\/)/g, '<span class="hljs-comment">$1</span>');
-    } else {
-        html = html.replace(/(\/\/.*$)/gm, '<span class="hljs-comment">$1</span>');
-        html = html.replace(/(\/\*[\s\S]*?\*\/)/g, '<span class="hljs-comment">$1</span>');
+    const state = { pos: 0, pending: null, nextToken };
+    if (source.length <= SYNTAX_SLICE_CHARS) {
+        element.innerHTML = renderSyntaxSlice(source, state, source.length);
+        return;
     }
-    
-    // Numbers
-    html = html.replace(/\b(\d+(?:\.\d+)?)\b/g, '<span class="hljs-number">$1</span>');
-    
-    // Function names
-    html = html.replace(/\b([a-zA-Z_][a-zA-Z0-9_]*)\s*(?=\()/g, '<span class="hljs-function">$1</span>');
-    
-    // Types and Classes
-    html = html.replace(/\b([A-Z][a-zA-Z0-9_]*)\b/g, '<span class="hljs-title class_">$1</span>');
-    
-    element.innerHTML = html;
+
+    // Large files: text not yet highlighted stays visible as plain text after the highlighted part
+    const highlighted = document.createElement('span');
+    const rest = document.createTextNode(source);
+    element.textContent = '';
+    element.appendChild(highlighted);
+    element.appendChild(rest);
+
+    const schedule = window.requestAnimationFrame || (callback => setTimeout(callback, 16));
+    const step = () => {
+        if (element.syntaxHighlightGeneration !== generation) { return; }
+        const limit = Math.min(source.length, state.pos + SYNTAX_SLICE_CHARS);
+        highlighted.insertAdjacentHTML('beforeend', renderSyntaxSlice(source, state, limit));
+        rest.data = source.slice(state.pos);
+        if (state.pos < source.length) {
+            schedule(step);
+        }
+    };
+    step();
 }
 
 /**
@@ -154,7 +362,7 @@ export function getLanguageConfig(language) {
             blockComment: null
         }
     };
-    
+
     return configs[language] || configs.javascript;
 }
 
@@ -165,7 +373,7 @@ export function getLanguageConfig(language) {
  */
 export function detectLanguageFromFilename(filename) {
     const ext = filename.toLowerCase().split('.').pop();
-    
+
     const extensionMap = {
         'js': 'javascript',
         'jsx': 'javascript',
@@ -185,6 +393,6 @@ export function detectLanguageFromFilename(filename) {
         'md': 'markdown',
         'markdown': 'markdown'
     };
-    
+
     return extensionMap[ext] || 'text';
-} 
\ No newline at end of file
+}
\ No newline at end of file
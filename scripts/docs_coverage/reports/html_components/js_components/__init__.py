@@ -9,20 +9,26 @@ aspect of table functionality.
 
 # Import all component generators
 from .global_keyboard_manager import get_global_keyboard_manager_js
+from .table_virtual_renderer import get_table_virtual_renderer_js
 from .table_manager_core import get_table_manager_core_js
 from .table_sorting import get_table_sorting_js
 from .table_filtering import get_table_filtering_js
+from .table_query_worker import get_table_query_worker_js
 from .table_pagination import get_table_pagination_js
 from .table_state_manager import get_table_state_manager_js
 from .table_column_manager import get_table_column_manager_js
+from .site_navigation import get_site_navigation_js
 
 # Export all component generators
 __all__ = [
     'get_global_keyboard_manager_js',
+    'get_table_virtual_renderer_js',
     'get_table_manager_core_js',
     'get_table_sorting_js',
     'get_table_filtering_js',
+    'get_table_query_worker_js',
     'get_table_pagination_js',
     'get_table_state_manager_js',
-    'get_table_column_manager_js'
+    'get_table_column_manager_js',
+    'get_site_navigation_js'
 ] 
\ No newline at end of file
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Site Navigation for the Multi-page HTML Documentation Coverage Report
+
+Answers searches across all pages of an html-site report from the site index
+(window.docsCoverageSiteIndex): the overview page filters its list of pages,
+and gap pages list the other pages that match the table search.
+"""
+
+def get_site_navigation_js() -> str:
+    """Generate cross-page search JavaScript functionality."""
+    return """
+    // Site Search - Matches queries against the search tokens of every page
+    class SiteSearch {
+        constructor(siteIndex) {
+            this.pages = siteIndex.pages || [];
+            this.termCache = new Map();
+            this.maxResults = 10;
+            // Gap pages live below the site root; their nav says how to get back to it
+            const nav = document.querySelector('.site-nav');
+            this.currentPage = nav ? nav.dataset.sitePage : null;
+            this.root = nav ? nav.dataset.siteRoot || '' : '';
+        }
+
+        static terms(query) {
+            return query.toLowerCase().match(/[a-z0-9]+/g) || [];
+        }
+
+        // Pages with a token containing the term, as a Set of page indexes
+        pagesForTerm(term) {
+            if (!this.termCache.has(term)) {
+                const matches = new Set();
+                this.pages.forEach((page, index) => {
+                    if (page.tokens.some(token => token.includes(term))) {
+                        matches.add(index);
+                    }
+                });
+                this.termCache.set(term, matches);
+            }
+            return this.termCache.get(term);
+        }
+
+        // Indexes of the pages matching every term of the query
+        search(query) {
+            const terms = SiteSearch.terms(query);
+            if (terms.length === 0) return null;
+
+            let result = null;
+            for (const term of terms) {
+                const pages = this.pagesForTerm(term);
+                result = result === null ? [...pages] : result.filter(index => pages.has(index));
+                if (result.length === 0) break;
+            }
+            return result;
+        }
+
+        attachOverviewFilter(input) {
+            const rows = document.querySelectorAll('tr[data-site-page]');
+            const count = document.getElementById('site-pages-count');
+            const slugs = this.pages.map(page => page.slug);
+
+            input.addEventListener('input', () => {
+                const matches = this.search(input.value);
+                const visible = matches === null ? null : new Set(matches.map(index => slugs[index]));
+                let shown = 0;
+                rows.forEach(row => {
+                    const show = visible === null || visible.has(row.dataset.sitePage);
+                    row.style.display = show ? '' : 'none';
+                    if (show) shown++;
+                });
+                if (count) count.textContent = shown;
+            });
+        }
+
+        attachPageResults(input, container) {
+            let timer = null;
+            input.addEventListener('input', () => {
+                clearTimeout(timer);
+                timer = setTimeout(() => this.renderPageResults(input.value, container), 150);
+            });
+        }
+
+        renderPageResults(query, container) {
+            const matches = (this.search(query) || [])
+                .map(index => this.pages[index])
+                .filter(page => page.slug !== this.currentPage);
+
+            if (matches.length === 0) {
+                container.style.display = 'none';
+                container.innerHTML = '';
+                return;
+            }
+
+            const escape = text => String(text).replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/"/g, '&quot;');
+            const links = matches.slice(0, this.maxResults).map(page =>
+                `<a class="site-search-link" href="${escape(this.root + page.href)}">${escape(page.title)} (${page.gaps})</a>`
+            );
+            const more = matches.length > this.maxResults ? ` and ${matches.length - this.maxResults} more` : '';
+            container.innerHTML = `<span class="site-search-label">Also matches on other pages:</span> ${links.join(' ')}${more}`;
+            container.style.display = '';
+        }
+    }
+
+    function initializeSiteSearch() {
+        if (!window.docsCoverageSiteIndex) return;
+
+        const siteSearch = new SiteSearch(window.docsCoverageSiteIndex);
+        const overviewInput = document.getElementById('site-search');
+        const gapSearch = document.getElementById('gap-search');
+        const results = document.getElementById('site-search-results');
+
+        if (overviewInput) {
+            siteSearch.attachOverviewFilter(overviewInput);
+        }
+        if (gapSearch && results) {
+            siteSearch.attachPageResults(gapSearch, results);
+        }
+        window.siteSearch = siteSearch;
+    }
+
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', initializeSiteSearch);
+    } else {
+        initializeSiteSearch();
+    }
+    """
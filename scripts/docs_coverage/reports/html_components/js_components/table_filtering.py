@@ -3,12 +3,94 @@
 Table Filtering Functionality for HTML Documentation Coverage Report
 
 Handles all filtering operations including search, filter tags, card filters,
-and filter state management.
+and filter state management. Search and facet filters are answered from the
+inverted index and facet bitsets embedded with the gap data, in the table
+query worker (see table_query_worker.py).
 """
 
 def get_table_filtering_js() -> str:
     """Generate table filtering JavaScript functionality."""
     return """
+    // Gap Search Index - Inverted token index and facet bitsets over row ids
+    class GapSearchIndex {
+        constructor(data) {
+            this.count = data.count;
+            this.words = Math.ceil(data.count / 32);
+            this.tokens = data.search.tokens;
+            this.postings = data.search.postings;
+            this.termCache = new Map();
+            
+            // Bitsets are little-endian bytes, so they can be viewed as 32-bit words
+            this.facets = {};
+            Object.entries(data.facets).forEach(([facet, values]) => {
+                this.facets[facet] = {};
+                Object.entries(values).forEach(([value, encoded]) => {
+                    this.facets[facet][value] = this.decodeBitset(encoded);
+                });
+            });
+        }
+        
+        decodeBitset(encoded) {
+            const bits = new Uint32Array(this.words);
+            const bytes = new Uint8Array(bits.buffer);
+            const binary = atob(encoded);
+            for (let i = 0; i < binary.length; i++) {
+                bytes[i] = binary.charCodeAt(i);
+            }
+            return bits;
+        }
+        
+        termBits(term) {
+            // Rows containing any token that includes the term
+            let bits = this.termCache.get(term);
+            if (bits) return bits;
+            
+            bits = new Uint32Array(this.words);
+            for (let t = 0; t < this.tokens.length; t++) {
+                if (!this.tokens[t].includes(term)) continue;
+                
+                const deltas = this.postings[t];
+                let row = 0;
+                for (let k = 0; k < deltas.length; k++) {
+                    row += deltas[k];
+                    bits[row >>> 5] |= 1 << (row & 31);
+                }
+            }
+            
+            if (this.termCache.size >= 64) {
+                this.termCache.clear();
+            }
+            this.termCache.set(term, bits);
+            return bits;
+        }
+        
+        search(query) {
+            // Every query term must match; returns null when nothing can be searched
+            const terms = query.toLowerCase().match(/[a-z0-9]+/g);
+            if (!terms) return null;
+            
+            const bits = this.termBits(terms[0]).slice();
+            terms.slice(1).forEach(term => GapSearchIndex.intersect(bits, this.termBits(term)));
+            return bits;
+        }
+        
+        facetBits(facet, value) {
+            const values = this.facets[facet] || {};
+            return values[value] || new Uint32Array(this.words);
+        }
+        
+        static intersect(target, bits) {
+            for (let i = 0; i < target.length; i++) {
+                target[i] &= bits[i];
+            }
+            return target;
+        }
+        
+        static has(bits, row) {
+            return (bits[row >>> 5] >>> (row & 31)) & 1;
+        }
+    }
+    
     // Table Filtering - Search, Filter Tags, and Card Filters
     class TableFiltering {
         constructor(tableManager) {
@@ -74,22 +156,17 @@ def get_table_filtering_js() -> str:
             
             console.log(`🏷️ Filter tag clicked: ${filterType}=${filterValue}`);
             
-            // Handle grouped filters (priority, status) or direct filters
-            const actualFilter = filterValue !== undefined ? filterValue : filterType;
-            
-            // Remove active class from tags in the same group
-            const filterGroup = tag.closest('.filter-group');
-            if (filterGroup) {
-                filterGroup.querySelectorAll('.filter-tag').forEach(t => t.classList.remove('active'));
+            // Each filter group (priority, status) selects one value of its facet;
+            // groups combine with each other and with the search term
+            if (filterValue === undefined || filterType === 'all') {
+                this.manager.facetFilters = {};
+            } else if (filterValue === '') {
+                delete this.manager.facetFilters[filterType];
             } else {
-                // Fallback: remove from all filter tags
-                document.querySelectorAll('.filter-tag').forEach(t => t.classList.remove('active'));
+                this.manager.facetFilters[filterType] = filterValue;
             }
             
-            // Add active class to clicked tag
-            tag.classList.add('active');
-            
-            this.manager.currentFilter = actualFilter === '' ? 'all' : actualFilter;
+            this.updateFilterTags();
             this.manager.currentPage = 1;
             this.safeApplyFilters();
             this.manager.saveState();
@@ -102,7 +179,12 @@ def get_table_filtering_js() -> str:
             const filter = card.dataset.filter;
             if (filter) {
                 console.log(`📊 Card clicked: ${filter}`);
-                this.manager.currentFilter = filter;
+                if (filter === 'all') {
+                    this.manager.facetFilters = {};
+                } else {
+                    const facet = ['missing', 'inadequate'].includes(filter) ? 'status' : 'priority';
+                    this.manager.facetFilters = { [facet]: filter };
+                }
                 this.manager.currentPage = 1;
                 this.updateFilterTags();
                 this.safeApplyFilters();
@@ -117,9 +199,8 @@ def get_table_filtering_js() -> str:
             } catch (error) {
                 console.error('❌ Error applying filters:', error);
                 // Reset to safe state
-                this.manager.currentFilter = 'all';
+                this.manager.facetFilters = {};
                 this.manager.searchTerm = '';
-                this.manager.filteredRows = [...this.manager.allRows];
                 this.manager.updateDisplay();
             }
         }
@@ -127,28 +208,7 @@ def get_table_filtering_js() -> str:
         applyFilters() {
             if (this.manager.isDestroyed) return;
             
-            this.manager.filteredRows = this.manager.allRows.filter(row => {
-                // Search filter
-                if (this.manager.searchTerm) {
-                    const searchText = row.textContent.toLowerCase();
-                    if (!searchText.includes(this.manager.searchTerm)) {
-                        return false;
-                    }
-                }
-                
-                // Priority/status filter
-                if (this.manager.currentFilter !== 'all') {
-                    const priority = row.dataset.priority;
-                    const status = row.dataset.status; // Using data-status instead of data-gap-type
-                    
-                    if (this.manager.currentFilter === 'missing' && status !== 'missing') return false;
-                    if (this.manager.currentFilter === 'inadequate' && status !== 'inadequate') return false;
-                    if (['critical', 'high', 'medium', 'low'].includes(this.manager.currentFilter) && priority !== this.manager.currentFilter) return false;
-                }
-                
-                return true;
-            });
-            
+            // The query worker filters and re-sorts; only the first page comes back
             this.manager.currentPage = 1;
             this.manager.updateDisplay();
         }
@@ -159,7 +219,7 @@ def get_table_filtering_js() -> str:
             console.log('🧹 Clearing all filters');
             
             // Reset filter state
-            this.manager.currentFilter = 'all';
+            this.manager.facetFilters = {};
             this.manager.searchTerm = '';
             this.manager.currentPage = 1;
             
@@ -169,15 +229,8 @@ def get_table_filtering_js() -> str:
                 searchInput.value = '';
             }
             
-            // Reset filter tags - be more specific about which tags to activate
-            document.querySelectorAll('.filter-tag').forEach(tag => {
-                tag.classList.remove('active');
-            });
-            
-            // Activate "All" filter tags (the ones with empty data-value or data-filter="all")
-            document.querySelectorAll('.filter-tag[data-value=""], .filter-tag[data-filter="all"]').forEach(tag => {
-                tag.classList.add('active');
-            });
+            // Reset filter tags - activates the "All" tag of every group
+            this.updateFilterTags();
             
             // Apply filters (will show all items)
             this.safeApplyFilters();
@@ -186,9 +239,19 @@ def get_table_filtering_js() -> str:
             console.log('✨ All filters cleared successfully');
         }
         
+        syncControls() {
+            // Show restored state in the search box and filter tags
+            const searchInput = document.getElementById('gap-search');
+            if (searchInput) {
+                searchInput.value = this.manager.searchTerm;
+            }
+            this.updateFilterTags();
+        }
+        
         updateFilterTags() {
             document.querySelectorAll('.filter-tag').forEach(tag => {
-                tag.classList.toggle('active', tag.dataset.filter === this.manager.currentFilter);
+                const selected = this.manager.facetFilters[tag.dataset.filter] || '';
+                tag.classList.toggle('active', (tag.dataset.value || '') === selected);
             });
         }
         
@@ -22,7 +22,7 @@ def get_table_pagination_js() -> str:
             if (pageSizeSelect) {
                 pageSizeSelect.addEventListener('change', (e) => {
                     if (this.manager.isDestroyed) return;
-                    this.manager.pageSize = e.target.value === 'all' ? this.manager.filteredRows.length : parseInt(e.target.value);
+                    this.manager.pageSize = e.target.value === 'all' ? this.manager.totalRows : parseInt(e.target.value);
                     this.manager.currentPage = 1;
                     this.manager.updateDisplay();
                     this.manager.saveState();
@@ -75,7 +75,7 @@ def get_table_pagination_js() -> str:
         
         updatePaginationInfo() {
             const startIndex = (this.manager.currentPage - 1) * this.manager.pageSize;
-            const endIndex = Math.min(startIndex + this.manager.pageSize, this.manager.filteredRows.length);
+            const endIndex = Math.min(startIndex + this.manager.pageSize, this.manager.filteredCount);
             
             // Update showing start/end/total elements
             const showingStart = document.getElementById('showing-start');
@@ -84,9 +84,19 @@ def get_table_pagination_js() -> str:
             
             if (showingStart) showingStart.textContent = startIndex + 1;
             if (showingEnd) showingEnd.textContent = endIndex;
-            if (showingTotal) showingTotal.textContent = this.manager.filteredRows.length;
+            if (showingTotal) showingTotal.textContent = this.manager.filteredCount;
             
-            console.log(`📊 Pagination info updated: ${startIndex + 1}-${endIndex} of ${this.manager.filteredRows.length}`);
+            console.log(`📊 Pagination info updated: ${startIndex + 1}-${endIndex} of ${this.manager.filteredCount}`);
+        }
+        
+        syncControls() {
+            // Show a restored page size in the selector; "All" stores the row count
+            const pageSizeSelect = document.getElementById('items-per-page');
+            if (!pageSizeSelect) return;
+            
+            const value = String(this.manager.pageSize);
+            const listed = Array.from(pageSizeSelect.options).some(option => option.value === value);
+            pageSizeSelect.value = listed ? value : 'all';
         }
         
         updatePaginationButtons() {
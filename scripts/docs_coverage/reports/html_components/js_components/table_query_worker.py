@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Table Query Worker for HTML Documentation Coverage Report
+
+Runs search, filtering and sorting of the gaps table in a Web Worker started
+from an inline Blob. The worker parses the query payload (inverted index,
+facet bitsets and sort orders) and answers each query with the row ids of the
+requested page only, so typing in the search box never blocks scrolling.
+Where workers are unavailable the same queries run on the main thread.
+"""
+
+def get_table_query_worker_js() -> str:
+    """Generate worker-backed table query JavaScript functionality."""
+    return """
+    // Gap Query - Filtered, sorted and paged row ids for one table state
+    class GapQuery {
+        constructor(data) {
+            this.count = data.count;
+            this.index = new GapSearchIndex(data);
+            this.sortOrder = new GapSortOrder(data);
+            this.lastKey = null;
+            this.lastRows = [];
+        }
+
+        rows(query) {
+            // Paging through a result reuses it; only a new search, filter or sort recomputes
+            const key = JSON.stringify([query.searchTerm, query.facetFilters, query.sortState]);
+            if (key === this.lastKey) return this.lastRows;
+
+            // Intersect the search result with the bitset of each selected facet value
+            let bits = query.searchTerm ? this.index.search(query.searchTerm) : null;
+            Object.entries(query.facetFilters || {}).forEach(([facet, value]) => {
+                const facetBits = this.index.facetBits(facet, value);
+                bits = bits ? GapSearchIndex.intersect(bits, facetBits) : facetBits.slice();
+            });
+
+            let rows = [];
+            for (let id = 0; id < this.count; id++) {
+                if (!bits || GapSearchIndex.has(bits, id)) rows.push(id);
+            }
+
+            const sortState = query.sortState || {};
+            if (rows.length > 0 && sortState.primary) {
+                rows = this.sortOrder.sortRows(rows, sortState.primary, sortState.secondary);
+            }
+
+            this.lastKey = key;
+            this.lastRows = rows;
+            return rows;
+        }
+
+        run(query) {
+            const rows = this.rows(query);
+            const pageSize = Math.max(1, query.pageSize || rows.length);
+            const totalPages = Math.max(1, Math.ceil(rows.length / pageSize));
+            const page = Math.min(Math.max(1, query.page || 1), totalPages);
+            const start = (page - 1) * pageSize;
+            return { total: rows.length, page, rows: Uint32Array.from(rows.slice(start, start + pageSize)) };
+        }
+    }
+
+    // Worker entry point; the Blob source also holds the classes GapQuery needs
+    function runGapQueryWorker() {
+        let gapQuery = null;
+
+        self.onmessage = (event) => {
+            const message = event.data;
+            try {
+                if (message.type === 'init') {
+                    gapQuery = new GapQuery(JSON.parse(message.payload));
+                    return;
+                }
+                const result = gapQuery.run(message.query);
+                self.postMessage(result, [result.rows.buffer]);
+            } catch (error) {
+                self.postMessage({ error: String(error && error.message || error) });
+            }
+        };
+    }
+
+    // Gap Query Engine - Sends table state to the worker, hands back the current page
+    class GapQueryEngine {
+        constructor(payloadText) {
+            this.payloadText = payloadText;
+            this.worker = null;
+            this.workerUrl = null;
+            this.localQuery = null;
+            this.inFlight = null;
+            this.pending = null;
+
+            try {
+                const source = [GapSearchIndex, GapSortOrder, GapQuery, runGapQueryWorker].join('\\n') +
+                    '\\nrunGapQueryWorker();';
+                this.workerUrl = URL.createObjectURL(new Blob([source], { type: 'text/javascript' }));
+                this.worker = new Worker(this.workerUrl);
+                this.worker.onmessage = (event) => this.handleResult(event.data);
+                this.worker.onerror = (event) => {
+                    event.preventDefault();
+                    this.useMainThread(event.message);
+                };
+                this.worker.postMessage({ type: 'init', payload: payloadText });
+                console.log('🧵 Table queries run in a Web Worker');
+            } catch (error) {
+                this.useMainThread(error);
+            }
+        }
+
+        static fromDocument() {
+            const script = document.querySelector('script[data-gap-query="true"]');
+            return script ? new GapQueryEngine(script.textContent) : null;
+        }
+
+        request(query, callback) {
+            // Only the latest request matters; it is sent once the worker is free
+            this.pending = { query, callback };
+            if (!this.inFlight) {
+                this.dispatch();
+            }
+        }
+
+        dispatch() {
+            const request = this.pending;
+            this.pending = null;
+
+            if (!this.worker) {
+                request.callback(this.runLocally(request.query));
+                return;
+            }
+            this.inFlight = request;
+            this.worker.postMessage({ type: 'query', query: request.query });
+        }
+
+        handleResult(result) {
+            const request = this.inFlight;
+            this.inFlight = null;
+
+            if (result.error) {
+                // Answer on the main thread instead (or the newer query, if there is one)
+                this.inFlight = request;
+                this.useMainThread(result.error);
+            } else if (this.pending) {
+                // A newer query arrived meanwhile and supersedes this result
+                this.dispatch();
+            } else if (request) {
+                request.callback(result);
+            }
+        }
+
+        runLocally(query) {
+            if (!this.localQuery) {
+                this.localQuery = new GapQuery(JSON.parse(this.payloadText));
+            }
+            return this.localQuery.run(query);
+        }
+
+        useMainThread(reason) {
+            if (reason) {
+                console.warn('⚠️ Table worker unavailable, querying on the main thread:', reason);
+            }
+            this.destroyWorker();
+
+            const request = this.inFlight;
+            this.inFlight = null;
+            if (request && !this.pending) {
+                request.callback(this.runLocally(request.query));
+            }
+            if (this.pending) {
+                this.dispatch();
+            }
+        }
+
+        destroyWorker() {
+            if (this.worker) {
+                this.worker.terminate();
+                this.worker = null;
+            }
+            if (this.workerUrl) {
+                URL.revokeObjectURL(this.workerUrl);
+                this.workerUrl = null;
+            }
+        }
+
+        destroy() {
+            this.destroyWorker();
+            this.inFlight = null;
+            this.pending = null;
+            this.localQuery = null;
+        }
+    }
+
+    // Export for use by other components
+    window.GapQueryEngine = GapQueryEngine;
+    """
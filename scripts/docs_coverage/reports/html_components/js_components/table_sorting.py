@@ -3,12 +3,100 @@
 Table Sorting Functionality for HTML Documentation Coverage Report
 
 Handles all sorting operations including single and multi-column sorting,
-sort state management, and sort indicator updates.
+sort state management, and sort indicator updates. Sorts are applied in
+linear time from the column permutations and ranks embedded with the gap data,
+in the table query worker (see table_query_worker.py).
 """
 
 def get_table_sorting_js() -> str:
     """Generate table sorting JavaScript functionality."""
     return """
+    // Gap Sort Order - Presorted permutations and dense ranks per column
+    class GapSortOrder {
+        constructor(data) {
+            this.count = data.count;
+            this.columns = {};
+            Object.entries(data.sort || {}).forEach(([column, sort]) => {
+                this.columns[column] = {
+                    order: GapSortOrder.decodeTypedArray(sort.order),
+                    rank: GapSortOrder.decodeTypedArray(sort.rank),
+                    maxRank: sort.maxRank
+                };
+            });
+        }
+        
+        static decodeTypedArray(encoded) {
+            // Little-endian unsigned integers, 1, 2 or 4 bytes wide
+            const binary = atob(encoded.data);
+            const bytes = new Uint8Array(binary.length);
+            for (let i = 0; i < binary.length; i++) {
+                bytes[i] = binary.charCodeAt(i);
+            }
+            const ArrayType = { 1: Uint8Array, 2: Uint16Array, 4: Uint32Array }[encoded.bytes];
+            return new ArrayType(bytes.buffer);
+        }
+        
+        sortRows(rows, primary, secondary) {
+            // Ties fall back to report order; a secondary key is applied first
+            // and the primary key then sorts stably on top of it
+            const primaryColumn = this.columns[primary.column];
+            if (!primaryColumn) return rows;
+            
+            const secondaryColumn = secondary && this.columns[secondary.column];
+            if (!secondaryColumn || secondary.column === primary.column) {
+                return this.walkOrder(rows, primaryColumn, primary.direction);
+            }
+            
+            const bySecondary = this.walkOrder(rows, secondaryColumn, secondary.direction);
+            return this.countingSort(bySecondary, primaryColumn, primary.direction);
+        }
+        
+        walkOrder(rows, column, direction) {
+            // Keep the permutation entries that are in rows, O(n)
+            const included = new Uint8Array(this.count);
+            rows.forEach(id => { included[id] = 1; });
+            
+            const { order, rank } = column;
+            const sorted = [];
+            if (direction !== 'desc') {
+                for (let i = 0; i < order.length; i++) {
+                    if (included[order[i]]) sorted.push(order[i]);
+                }
+                return sorted;
+            }
+            
+            // Descending: equal-rank groups in reverse, each group still in report order
+            let end = order.length - 1;
+            while (end >= 0) {
+                let start = end;
+                while (start > 0 && rank[order[start - 1]] === rank[order[end]]) {
+                    start--;
+                }
+                for (let i = start; i <= end; i++) {
+                    if (included[order[i]]) sorted.push(order[i]);
+                }
+                end = start - 1;
+            }
+            return sorted;
+        }
+        
+        countingSort(rows, column, direction) {
+            // Stable counting sort by dense rank, O(n + ranks)
+            const { rank, maxRank } = column;
+            const key = direction === 'desc' ? id => maxRank - rank[id] : id => rank[id];
+            const starts = new Uint32Array(maxRank + 2);
+            
+            rows.forEach(id => { starts[key(id) + 1]++; });
+            for (let r = 1; r < starts.length; r++) {
+                starts[r] += starts[r - 1];
+            }
+            
+            const sorted = new Array(rows.length);
+            rows.forEach(id => { sorted[starts[key(id)]++] = id; });
+            return sorted;
+        }
+    }
+    
     // Table Sorting - Column Sorting and Sort State Management
     class TableSorting {
         constructor(tableManager) {
@@ -64,96 +152,11 @@ def get_table_sorting_js() -> str:
                 }
             }
             
-            this.applySorting();
+            // The query worker re-sorts the current result
             this.manager.updateDisplay();
             this.manager.saveState();
         }
         
-        applySorting() {
-            if (!this.manager.filteredRows || this.manager.filteredRows.length === 0) return;
-            
-            this.manager.filteredRows.sort((a, b) => {
-                // Primary sort
-                let result = this.compareRows(a, b, this.manager.sortState.primary.column, this.manager.sortState.primary.direction);
-                
-                // Secondary sort if primary is equal
-                if (result === 0 && this.manager.sortState.secondary.column) {
-                    result = this.compareRows(a, b, this.manager.sortState.secondary.column, this.manager.sortState.secondary.direction);
-                }
-                
-                return result;
-            });
-        }
-        
-        compareRows(a, b, column, direction) {
-            if (!column) return 0;
-            
-            const aVal = this.getCellValue(a, column);
-            const bVal = this.getCellValue(b, column);
-            
-            let result = 0;
-            if (aVal < bVal) result = -1;
-            else if (aVal > bVal) result = 1;
-            
-            return direction === 'desc' ? -result : result;
-        }
-        
-        getCellValue(row, column) {
-            // Map column names to CSS classes
-            const columnClassMap = {
-                'file': 'col-file',
-                'lines': 'col-lines', 
-                'status': 'col-status',
-                'priority': 'col-priority',
-                'doc': 'col-doc',
-                'effort': 'col-effort',
-                'issues': 'col-issues'
-            };
-            
-            const cssClass = columnClassMap[column];
-            if (!cssClass) return '';
-            
-            const cell = row.querySelector(`td.${cssClass}`);
-            if (!cell) return '';
-            
-            const cellText = cell.textContent.trim();
-            
-            // Handle different data types for proper sorting
-            switch (column) {
-                case 'lines':
-                    // Extract numeric value from line count
-                    const lineMatch = cellText.match(/[\\d,]+/);
-                    return lineMatch ? parseInt(lineMatch[0].replace(/,/g, '')) : 0;
-                    
-                case 'priority':
-                    // Priority order: Critical > High > Medium > Low
-                    const priorityOrder = { 'critical': 4, 'high': 3, 'medium': 2, 'low': 1 };
-                    const priority = cellText.toLowerCase().replace(/[^a-z]/g, '');
-                    return priorityOrder[priority] || 0;
-                    
-                case 'effort':
-                    // Effort order: High > Medium > Low
-                    const effortOrder = { 'high': 3, 'medium': 2, 'low': 1 };
-                    const effort = cellText.toLowerCase().replace(/[^a-z]/g, '');
-                    return effortOrder[effort] || 0;
-                    
-                case 'status':
-                    // Status order: Missing > Inadequate
-                    const statusOrder = { 'missing': 2, 'inadequate': 1 };
-                    const status = cellText.toLowerCase().replace(/[^a-z]/g, '');
-                    return statusOrder[status] || 0;
-                    
-                case 'issues':
-                    // Count number of issues (extract number from text like "3 issues")
-                    const issueMatch = cellText.match(/(\\d+)/);
-                    return issueMatch ? parseInt(issueMatch[1]) : 0;
-                    
-                default:
-                    // For file names and docs, use alphabetical sorting
-                    return cellText.toLowerCase();
-            }
-        }
-        
         safeUpdateSortIndicators() {
             try {
                 this.updateSortIndicators();
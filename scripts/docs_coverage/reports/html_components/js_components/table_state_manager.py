@@ -24,7 +24,7 @@ def get_table_state_manager_js() -> str:
                     
                     this.manager.currentPage = state.currentPage || 1;
                     this.manager.pageSize = state.pageSize || 50;
-                    this.manager.currentFilter = state.currentFilter || 'all';
+                    this.manager.facetFilters = state.facetFilters && typeof state.facetFilters === 'object' ? state.facetFilters : {};
                     this.manager.searchTerm = state.searchTerm || '';
                     this.manager.columnWidths = state.columnWidths || {};
                     this.manager.hiddenColumns = new Set(state.hiddenColumns || ['type']);
@@ -59,7 +59,7 @@ def get_table_state_manager_js() -> str:
                 // Reset to safe defaults
                 this.manager.sortState = this.manager.createSafeSortState();
                 this.manager.hiddenColumns = new Set(['type']);
-                this.manager.currentFilter = 'all';
+                this.manager.facetFilters = {};
                 this.manager.searchTerm = '';
                 this.manager.currentPage = 1;
             }
@@ -76,7 +76,7 @@ def get_table_state_manager_js() -> str:
                     currentPage: this.manager.currentPage,
                     pageSize: this.manager.pageSize,
                     sortState: this.manager.sortState,
-                    currentFilter: this.manager.currentFilter,
+                    facetFilters: this.manager.facetFilters,
                     searchTerm: this.manager.searchTerm,
                     columnWidths: this.manager.columnWidths,
                     hiddenColumns: Array.from(this.manager.hiddenColumns)
@@ -92,7 +92,7 @@ def get_table_state_manager_js() -> str:
             // Reset to default state
             this.manager.currentPage = 1;
             this.manager.pageSize = 50;
-            this.manager.currentFilter = 'all';
+            this.manager.facetFilters = {};
             this.manager.searchTerm = '';
             this.manager.columnWidths = {};
             this.manager.hiddenColumns = new Set(['type']);
@@ -114,12 +114,12 @@ def get_table_state_manager_js() -> str:
                 currentPage: this.manager.currentPage,
                 pageSize: this.manager.pageSize,
                 sortState: this.manager.sortState,
-                currentFilter: this.manager.currentFilter,
+                facetFilters: this.manager.facetFilters,
                 searchTerm: this.manager.searchTerm,
                 columnWidths: this.manager.columnWidths,
                 hiddenColumns: Array.from(this.manager.hiddenColumns),
-                filteredRowsCount: this.manager.filteredRows.length,
-                allRowsCount: this.manager.allRows.length
+                filteredRowsCount: this.manager.filteredCount,
+                allRowsCount: this.manager.totalRows
             };
             
             console.log('📋 Current table state:', state);
@@ -135,7 +135,7 @@ def get_table_state_manager_js() -> str:
                 
                 this.manager.currentPage = stateData.currentPage || 1;
                 this.manager.pageSize = stateData.pageSize || 50;
-                this.manager.currentFilter = stateData.currentFilter || 'all';
+                this.manager.facetFilters = stateData.facetFilters && typeof stateData.facetFilters === 'object' ? stateData.facetFilters : {};
                 this.manager.searchTerm = stateData.searchTerm || '';
                 this.manager.columnWidths = stateData.columnWidths || {};
                 this.manager.hiddenColumns = new Set(stateData.hiddenColumns || ['type']);
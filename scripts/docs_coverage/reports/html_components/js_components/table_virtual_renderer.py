@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Virtualized Table Rendering for HTML Documentation Coverage Report
+
+Decodes the columnar gap payload embedded by the report generator and renders
+only the rows inside the scrolled viewport, padding the rest with spacer rows.
+"""
+
+def get_table_virtual_renderer_js() -> str:
+    """Generate gap data access and virtual scrolling JavaScript functionality."""
+    return """
+    // Gap Table Data - Columnar, dictionary-encoded gap payload
+    class GapTableData {
+        constructor(payload) {
+            this.count = payload.count || 0;
+            this.dicts = payload.dicts || {};
+            this.columns = payload.columns || {};
+            this.githubBase = payload.githubBase || '';
+        }
+
+        static fromDocument() {
+            const script = document.querySelector('script[data-gap-table="true"]');
+            if (!script) return null;
+
+            try {
+                return new GapTableData(JSON.parse(script.textContent));
+            } catch (error) {
+                console.error('❌ Failed to parse gap table data:', error);
+                return null;
+            }
+        }
+
+        directory(id) { return this.dicts.dir[this.columns.dir[id]]; }
+        fileName(id) { return this.columns.name[id]; }
+        filePath(id) { return this.directory(id) + this.fileName(id); }
+        lineCount(id) { return this.columns.lines[id]; }
+        status(id) { return this.dicts.status[this.columns.status[id]]; }
+        priority(id) { return this.dicts.priority[this.columns.priority[id]]; }
+        effort(id) { return this.dicts.effort[this.columns.effort[id]]; }
+        fileType(id) { return this.dicts.fileType[this.columns.fileType[id]]; }
+        docName(id) { return this.columns.doc[id]; }
+        expectedDoc(id) { return this.dicts.docDir[this.columns.docDir[id]] + this.docName(id); }
+        issues(id) { return this.columns.issues[id].map(index => this.dicts.issue[index]); }
+        githubUrl(id) { return this.githubBase + this.filePath(id); }
+    }
+
+    // Virtual Table Renderer - Renders only the rows inside the viewport
+    class VirtualTableRenderer {
+        constructor(tableManager, tbody, scrollContainer) {
+            this.manager = tableManager;
+            this.data = tableManager.gapData;
+            this.tbody = tbody;
+            this.scrollContainer = scrollContainer;
+            this.rows = [];
+            this.rowHeight = 48;  // Estimate until rows have been measured
+            this.overscan = 10;
+            this.windowStart = -1;
+            this.windowEnd = -1;
+            this.pendingFrame = null;
+
+            this.handleScroll = () => this.scheduleRender();
+            if (this.scrollContainer) {
+                this.scrollContainer.addEventListener('scroll', this.handleScroll, { passive: true });
+            }
+            window.addEventListener('resize', this.handleScroll);
+        }
+
+        setRows(rowIds) {
+            this.rows = rowIds;
+            this.windowStart = -1;
+            this.windowEnd = -1;
+            if (this.scrollContainer) {
+                this.scrollContainer.scrollTop = 0;
+            }
+            this.render();
+        }
+
+        scheduleRender() {
+            if (this.pendingFrame !== null || this.manager.isDestroyed) return;
+
+            this.pendingFrame = requestAnimationFrame(() => {
+                this.pendingFrame = null;
+                this.render();
+            });
+        }
+
+        render() {
+            if (!this.tbody || this.manager.isDestroyed) return;
+
+            const viewportHeight = this.scrollContainer ? this.scrollContainer.clientHeight : window.innerHeight;
+            const scrollTop = this.scrollContainer ? this.scrollContainer.scrollTop : 0;
+            const total = this.rows.length;
+            const start = Math.max(0, Math.floor(scrollTop / this.rowHeight) - this.overscan);
+            const end = Math.min(total, Math.ceil((scrollTop + viewportHeight) / this.rowHeight) + this.overscan);
+
+            if (start === this.windowStart && end === this.windowEnd) return;
+            this.windowStart = start;
+            this.windowEnd = end;
+
+            const parts = [this.renderSpacer(start * this.rowHeight)];
+            for (let i = start; i < end; i++) {
+                parts.push(this.renderRow(this.rows[i]));
+            }
+            parts.push(this.renderSpacer((total - end) * this.rowHeight));
+            this.tbody.innerHTML = parts.join('');
+
+            this.measureRowHeight(end - start);
+        }
+
+        measureRowHeight(renderedCount) {
+            // Rows wrap long paths, so refine the estimate from what was rendered
+            if (renderedCount === 0) return;
+
+            const rendered = this.tbody.querySelectorAll('tr.gap-row');
+            let height = 0;
+            rendered.forEach(row => { height += row.offsetHeight; });
+            const measured = height / rendered.length;
+
+            if (measured > 0 && Math.abs(measured - this.rowHeight) >= 1) {
+                this.rowHeight = measured;
+                this.scheduleRender();
+            }
+        }
+
+        renderSpacer(height) {
+            if (height <= 0) return '';
+            return `<tr class="virtual-spacer" aria-hidden="true"><td colspan="7" style="height: ${height}px"></td></tr>`;
+        }
+
+        renderRow(id) {
+            const data = this.data;
+            const escape = VirtualTableRenderer.escapeHtml;
+            const priority = data.priority(id);
+            const status = data.status(id);
+            const effort = data.effort(id);
+            const issues = data.issues(id);
+            const priorityEmoji = { critical: '🚨', high: '⚠️', medium: '📝', low: '💡' }[priority] || '';
+
+            let issuesText = issues.slice(0, 3).join(', ');
+            if (issues.length > 3) {
+                issuesText += ` +${issues.length - 3} more`;
+            }
+
+            const cell = (column, content) => {
+                const hidden = this.manager.hiddenColumns.has(column) ? ' style="display: none"' : '';
+                return `<td class="col-${column}" data-column="${column}"${hidden}>${content}</td>`;
+            };
+
+            return `<tr class="clickable-row gap-row" data-row-id="${id}"` +
+                ` data-file-path="${escape(data.filePath(id))}" data-file-name="${escape(data.filePath(id))}"` +
+                ` data-github-url="${escape(data.githubUrl(id))}">` +
+                cell('file', `<div class="file-path-container"><span class="file-directory">${escape(data.directory(id))}</span>` +
+                    `<span class="file-name clickable-filename" title="Click to preview source code">${escape(data.fileName(id))}</span></div>`) +
+                cell('lines', `<span class="line-count">${data.lineCount(id).toLocaleString()}</span>`) +
+                cell('status', `<span class="badge badge-${escape(status)}">${escape(VirtualTableRenderer.title(status))}</span>`) +
+                cell('priority', `<span class="priority-indicator priority-${escape(priority)}">${priorityEmoji} ${escape(VirtualTableRenderer.title(priority))}</span>`) +
+                cell('doc', `<span class="code">${escape(data.docName(id))}</span>`) +
+                cell('effort', `<span class="effort-indicator effort-${escape(effort)}">${escape(VirtualTableRenderer.title(effort))}</span>`) +
+                cell('issues', `<span class="issues-text" title="${escape(issues.join(', '))}">${escape(issuesText)}</span>`) +
+                '</tr>';
+        }
+
+        static title(text) {
+            return text ? text.charAt(0).toUpperCase() + text.slice(1) : '';
+        }
+
+        static escapeHtml(text) {
+            return String(text)
+                .replace(/&/g, '&amp;')
+                .replace(/</g, '&lt;')
+                .replace(/>/g, '&gt;')
+                .replace(/"/g, '&quot;');
+        }
+
+        destroy() {
+            if (this.pendingFrame !== null) {
+                cancelAnimationFrame(this.pendingFrame);
+                this.pendingFrame = null;
+            }
+            if (this.scrollContainer) {
+                this.scrollContainer.removeEventListener('scroll', this.handleScroll);
+            }
+            window.removeEventListener('resize', this.handleScroll);
+        }
+    }
+
+    // Export for use by other components
+    window.GapTableData = GapTableData;
+    window.VirtualTableRenderer = VirtualTableRenderer;
+    """
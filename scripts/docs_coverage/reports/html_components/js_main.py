@@ -15,9 +15,7 @@ try:
         get_keyboard_manager_js,
         get_utility_functions_js
     )
-    print("✅ All JavaScript components imported successfully")
-except ImportError as e:
-    print(f"❌ Relative import error: {e}")
+except ImportError:
     # Try absolute imports
     try:
         import sys
@@ -32,9 +30,8 @@ except ImportError as e:
             get_keyboard_manager_js,
             get_utility_functions_js
         )
-        print("✅ JavaScript components imported via absolute import")
     except ImportError as e2:
-        print(f"❌ Absolute import error: {e2}")
+        print(f"❌ JavaScript components unavailable: {e2}", file=sys.stderr)
         # Fallback functions for when modules are not available
         def get_table_manager_js() -> str: return "// Table manager not available"
         def get_modal_manager_js() -> str: return "// Modal manager not available"
@@ -83,7 +80,6 @@ def get_complete_javascript() -> str:
             
             // Initialize core components
             this.initializeGlobalErrorHandling();
-            this.initializeSyntaxHighlighting();
             this.initializeUtilities();
             this.initializeTheme();
             this.initializeTimestamps();
@@ -100,23 +96,6 @@ def get_complete_javascript() -> str:
             this.setupGlobalErrorHandling();
         }
         
-        initializeSyntaxHighlighting() {
-            try {
-                // Initialize highlight.js if available
-                if (typeof window.hljs !== 'undefined') {
-                    window.hljs.configure({
-                        languages: ['typescript', 'javascript', 'python', 'css', 'json', 'html'],
-                        ignoreUnescapedHTML: true
-                    });
-                    console.log('✨ Syntax highlighting initialized successfully');
-                } else {
-                    console.warn('⚠️ Highlight.js not available');
-                }
-            } catch (error) {
-                console.warn('⚠️ Failed to initialize syntax highlighting:', error);
-            }
-        }
-        
         initializeUtilities() {
             try {
                 if (typeof UtilityManager !== 'undefined') {
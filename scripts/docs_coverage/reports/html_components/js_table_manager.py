@@ -7,9 +7,11 @@ enhanced table management system. This is the primary entry point for table oper
 """
 
 from .js_components.global_keyboard_manager import get_global_keyboard_manager_js
+from .js_components.table_virtual_renderer import get_table_virtual_renderer_js
 from .js_components.table_manager_core import get_table_manager_core_js
 from .js_components.table_sorting import get_table_sorting_js
 from .js_components.table_filtering import get_table_filtering_js
+from .js_components.table_query_worker import get_table_query_worker_js
 from .js_components.table_pagination import get_table_pagination_js
 from .js_components.table_state_manager import get_table_state_manager_js
 from .js_components.table_column_manager import get_table_column_manager_js
@@ -20,9 +22,11 @@ def get_table_manager_js() -> str:
     
     This function orchestrates all table functionality modules:
     - Global keyboard manager (application-wide shortcuts, OS detection)
+    - Virtual renderer (columnar gap data, visible-window rendering)
     - Core table manager (initialization, display, events)
     - Sorting functionality (single/multi-column sorting)
     - Filtering functionality (search, filter tags, card filters)
+    - Query worker (search, filtering and sorting off the main thread)
     - Pagination functionality (page navigation, page size control)
     - State management (persistence, loading, validation)
     - Column management (visibility, width control)
@@ -33,9 +37,11 @@ def get_table_manager_js() -> str:
     # Combine all modular components - global keyboard manager first
     components = [
         get_global_keyboard_manager_js(),  # Must be first for global shortcuts
+        get_table_virtual_renderer_js(),
         get_table_manager_core_js(),
         get_table_sorting_js(),
         get_table_filtering_js(),
+        get_table_query_worker_js(),  # Needs the search index and sort order classes
         get_table_pagination_js(),
         get_table_state_manager_js(),
         get_table_column_manager_js()
@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+"""
+Dependency-free CSS/JS Minification for HTML Documentation Coverage Report
+
+CSS is stripped of comments and whitespace, and rules whose selectors
+reference class names that nothing in the report can produce are dropped.
+JavaScript is stripped of comments, indentation, blank lines and
+console.log/info/debug calls while keeping line breaks, so automatic
+semicolon insertion behaves exactly as in the source.
+"""
+
+import re
+from pathlib import Path
+from typing import Iterable, List, Optional, Set, Tuple
+
+_COMPONENTS_DIR = Path(__file__).parent
+
+# Files whose text can put class names into the report HTML (the JS bundle is added separately).
+# Every component module is scanned: keeping a rule too many is harmless, dropping one is not.
+CLASS_SOURCE_PATTERNS = ("*.py", "js_components/*.py", "templates/*.html")
+
+# Classes produced by third-party code at runtime (highlight.js)
+EXTERNAL_CLASS_PREFIXES = ("hljs",)
+
+_CLASS_TOKEN = re.compile(r'-?[A-Za-z_][\w-]*')
+_SELECTOR_CLASS = re.compile(r'\.(-?[A-Za-z_][\w-]*)')
+_CSS_COMMENT_OR_STRING = re.compile(r'/\*.*?\*/|"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'', re.S)
+
+# At-rules whose blocks contain rules rather than declarations
+_NESTED_AT_RULES = ("@media", "@supports", "@document", "@layer", "@container",
+                    "@keyframes", "@-webkit-keyframes")
+
+
+class ClassUsage:
+    """Class names (and dynamic class name prefixes) the report can produce."""
+
+    def __init__(self, texts: Iterable[str]):
+        self.names: Set[str] = set()
+        for text in texts:
+            self.names.update(_CLASS_TOKEN.findall(text))
+        # "badge-{status}" / `priority-${priority}` leave a token ending in "-"
+        self.prefixes: Tuple[str, ...] = tuple(sorted(name for name in self.names if name.endswith("-")))
+
+    @classmethod
+    def for_report(cls, *javascript: str) -> "ClassUsage":
+        """Collect class names from the HTML-emitting modules and the JavaScript shipped with the report."""
+        texts = list(javascript)
+        for pattern in CLASS_SOURCE_PATTERNS:
+            texts.extend(path.read_text(encoding='utf-8') for path in sorted(_COMPONENTS_DIR.glob(pattern)))
+        return cls(texts)
+
+    def is_used(self, class_name: str) -> bool:
+        return class_name in self.names or class_name.startswith(self.prefixes)
+
+
+# ============================================================================
+# CSS
+# ============================================================================
+
+def minify_css(css: str, usage: Optional[ClassUsage] = None) -> str:
+    """Minify a stylesheet, dropping rules for unused classes when usage is given."""
+    css = _CSS_COMMENT_OR_STRING.sub(lambda m: "" if m.group(0).startswith("/*") else m.group(0), css)
+    rules, _ = _parse_css_block(css, 0)
+    return "".join(_render_rules(rules, usage))
+
+
+def _parse_css_block(css: str, pos: int) -> Tuple[List[Tuple[str, object]], int]:
+    """Parse rules until a closing brace; returns [(prelude, body)] and the next position.
+
+    A body is a list of rules for nested at-rules, a declaration string
+    otherwise, or None for statements such as @import.
+    """
+    rules: List[Tuple[str, object]] = []
+    start = pos
+    while pos < len(css):
+        char = css[pos]
+        if char in "\"'":
+            pos = _skip_string(css, pos)
+            continue
+        if char == ";":
+            statement = css[start:pos].strip()
+            if statement:
+                rules.append((statement, None))
+            start = pos = pos + 1
+            continue
+        if char == "}":
+            return rules, pos + 1
+        if char == "{":
+            prelude = css[start:pos].strip()
+            if prelude.startswith(_NESTED_AT_RULES):
+                body, pos = _parse_css_block(css, pos + 1)
+            else:
+                body_start = pos + 1
+                pos = _skip_block(css, body_start)
+                body = css[body_start:pos - 1]
+            rules.append((prelude, body))
+            start = pos
+            continue
+        pos += 1
+    return rules, pos
+
+
+def _skip_string(text: str, pos: int) -> int:
+    """Return the position just past the string literal starting at pos."""
+    quote = text[pos]
+    pos += 1
+    while pos < len(text) and text[pos] != quote:
+        pos += 2 if text[pos] == "\\" else 1
+    return pos + 1
+
+
+def _skip_block(css: str, pos: int) -> int:
+    """Return the position just past the brace closing the block that starts at pos."""
+    depth = 1
+    while pos < len(css) and depth:
+        char = css[pos]
+        if char in "\"'":
+            pos = _skip_string(css, pos)
+            continue
+        depth += {"{": 1, "}": -1}.get(char, 0)
+        pos += 1
+    return pos
+
+
+def _render_rules(rules: List[Tuple[str, object]], usage: Optional[ClassUsage]) -> List[str]:
+    output = []
+    for prelude, body in rules:
+        prelude = _collapse_whitespace(prelude)
+        if body is None:
+            output.append(prelude + ";")
+        elif isinstance(body, list):
+            inner = "".join(_render_rules(body, usage))
+            if inner:
+                output.append(f"{prelude}{{{inner}}}")
+        elif prelude.startswith("@"):
+            output.append(f"{prelude}{{{_minify_declarations(body)}}}")
+        else:
+            selectors = _split_top_level(prelude, ",")
+            if usage is not None:
+                selectors = [selector for selector in selectors if _selector_is_used(selector, usage)]
+            declarations = _minify_declarations(body)
+            if selectors and declarations:
+                output.append(f"{','.join(_minify_selector(s) for s in selectors)}{{{declarations}}}")
+    return output
+
+
+def _selector_is_used(selector: str, usage: ClassUsage) -> bool:
+    """A selector can match only if every class it requires can be produced."""
+    # Classes inside functional pseudo-classes (:not(.x), :is(...)) are not requirements
+    names = _SELECTOR_CLASS.findall(_strip_parenthesized(selector))
+    # Third-party code adds its own modifier classes alongside its prefixed ones ("hljs-title class_")
+    if any(name.startswith(EXTERNAL_CLASS_PREFIXES) for name in names):
+        return True
+    return all(usage.is_used(name) for name in names)
+
+
+def _strip_parenthesized(text: str) -> str:
+    output, depth = [], 0
+    for char in text:
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif depth == 0:
+            output.append(char)
+    return "".join(output)
+
+
+def _split_top_level(text: str, separator: str) -> List[str]:
+    """Split on a separator outside parentheses, brackets and strings."""
+    parts, depth, start, pos = [], 0, 0, 0
+    while pos < len(text):
+        char = text[pos]
+        if char in "\"'":
+            pos = _skip_string(text, pos)
+            continue
+        if char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        elif char == separator and depth == 0:
+            parts.append(text[start:pos].strip())
+            start = pos + 1
+        pos += 1
+    parts.append(text[start:].strip())
+    return [part for part in parts if part]
+
+
+def _collapse_whitespace(text: str) -> str:
+    """Collapse whitespace runs outside strings to single spaces."""
+    pieces = re.split(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')', text)
+    return "".join(piece if index % 2 else re.sub(r'\s+', ' ', piece)
+                   for index, piece in enumerate(pieces)).strip()
+
+
+def _minify_selector(selector: str) -> str:
+    selector = _collapse_whitespace(selector)
+    # Spaces around combinators are insignificant; a space before ":" is not
+    return re.sub(r'\s*([>~+])\s*', r'\1', selector)
+
+
+def _minify_declarations(body: str) -> str:
+    declarations = []
+    for declaration in _split_top_level(body, ";"):
+        name, colon, value = declaration.partition(":")
+        if not colon:
+            continue
+        value = _collapse_whitespace(value)
+        value = re.sub(r'\s*,\s*', ',', value) if "'" not in value and '"' not in value else value
+        value = re.sub(r'\s*!\s*important', '!important', value)
+        declarations.append(f"{name.strip()}:{value}")
+    return ";".join(declarations)
+
+
+# ============================================================================
+# JavaScript
+# ============================================================================
+
+# Calls replaced by "void 0", which is valid wherever the call expression was
+_DROPPED_CALLS = ("console.log", "console.info", "console.debug")
+
+# Tokens after which "/" starts a regular expression rather than a division
+_REGEX_PRECEDERS = set("(,=:[!&|?{};+-*%<>~^") | {
+    "", "return", "typeof", "instanceof", "in", "of", "new", "delete", "void", "throw", "case", "do", "else", "yield", "await", "=>"
+}
+
+_JS_TOKEN = re.compile(r'[A-Za-z_$][\w$]*(?:\.[A-Za-z_$][\w$]*)*|\d[\w.]*|=>|.', re.S)
+
+
+def minify_js(js: str) -> str:
+    """Strip comments, whitespace and debug logging from JavaScript.
+
+    Line breaks between statements are kept (one per non-blank line) so code
+    relying on automatic semicolon insertion is unaffected; string, template
+    and regular expression literals are copied verbatim.
+    """
+    output: List[str] = []
+    pos = 0
+    last_token = ""
+    pending = ""
+    length = len(js)
+
+    def emit(text: str) -> None:
+        nonlocal pending
+        if pending and output:
+            previous = output[-1][-1]
+            if pending == "\n" or _needs_space(previous, text[0]):
+                output.append(pending)
+        pending = ""
+        output.append(text)
+
+    while pos < length:
+        char = js[pos]
+        pair = js[pos:pos + 2]
+
+        if char == "\n" or pair == "//":
+            end = pos if char == "\n" else js.find("\n", pos)
+            pending = "\n" if end != -1 else pending
+            pos = length if end == -1 else end + 1
+            continue
+        if char in " \t\r" or pair == "/*":
+            if pair == "/*":
+                end = js.find("*/", pos + 2)
+                if end != -1 and "\n" in js[pos:end]:
+                    pending = "\n"
+                pos = length if end == -1 else end + 2
+            else:
+                pos += 1
+            # A comment between tokens still separates them
+            pending = pending or " "
+            continue
+        if char in "\"'":
+            end = _skip_string(js, pos)
+            last_token = "string"
+        elif char == "`":
+            end = _skip_template(js, pos)
+            last_token = "string"
+        elif char == "/" and last_token in _REGEX_PRECEDERS:
+            end = _skip_regex(js, pos)
+            last_token = "regex"
+        else:
+            match = _JS_TOKEN.match(js, pos)
+            token = match.group(0)
+            end = match.end()
+            if token in _DROPPED_CALLS and js.startswith("(", end):
+                emit("void 0")
+                pos, last_token = _skip_parenthesized(js, end), "void"
+                continue
+            last_token = token.rsplit(".", 1)[-1] if token[0].isalpha() or token[0] in "_$" else token
+        emit(js[pos:end])
+        pos = end
+
+    return "".join(output)
+
+
+def _needs_space(previous: str, following: str) -> bool:
+    """Whether removing the space between two characters would change the tokens."""
+    if _is_word_char(previous) and _is_word_char(following):
+        return True
+    if previous.isdigit() and following == ".":
+        return True
+    # "/re/ instanceof" would otherwise read as regular expression flags
+    if previous == "/" and _is_word_char(following):
+        return True
+    # "a + +b", "a - -b", "a / /re/"
+    return previous in "+-/" and following in "+-/*" and (previous == following or previous == "/")
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char in "_$" or ord(char) > 127
+
+
+def _skip_template(js: str, pos: int) -> int:
+    """Return the position just past the template literal starting at pos."""
+    pos += 1
+    while pos < len(js):
+        char = js[pos]
+        if char == "\\":
+            pos += 2
+            continue
+        if char == "`":
+            return pos + 1
+        if js.startswith("${", pos):
+            pos = _skip_template_expression(js, pos + 2)
+            continue
+        pos += 1
+    return pos
+
+
+def _skip_template_expression(js: str, pos: int) -> int:
+    """Return the position just past the "}" closing a ${ ... } expression."""
+    depth = 1
+    while pos < len(js) and depth:
+        char = js[pos]
+        if char in "\"'":
+            pos = _skip_string(js, pos)
+            continue
+        if char == "`":
+            pos = _skip_template(js, pos)
+            continue
+        depth += {"{": 1, "}": -1}.get(char, 0)
+        pos += 1
+    return pos
+
+
+def _skip_regex(js: str, pos: int) -> int:
+    """Return the position just past the regular expression literal (and flags) at pos."""
+    pos += 1
+    in_class = False
+    while pos < len(js) and js[pos] != "\n":
+        char = js[pos]
+        if char == "\\":
+            pos += 2
+            continue
+        if char == "[":
+            in_class = True
+        elif char == "]":
+            in_class = False
+        elif char == "/" and not in_class:
+            pos += 1
+            break
+        pos += 1
+    while pos < len(js) and (js[pos].isalnum() or js[pos] in "_$"):
+        pos += 1
+    return pos
+
+
+def _skip_parenthesized(js: str, pos: int) -> int:
+    """Return the position just past the ")" matching the "(" at pos."""
+    depth = 0
+    while pos < len(js):
+        char = js[pos]
+        if char in "\"'":
+            pos = _skip_string(js, pos)
+            continue
+        if char == "`":
+            pos = _skip_template(js, pos)
+            continue
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if depth == 0:
+                return pos + 1
+        pos += 1
+    return pos
@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+Multi-page Site Generator for HTML Documentation Coverage Report
+
+Writes a report as a static site for trees too large for a single page: an
+overview page with the summary cards and a list of pages, plus one gaps page
+per directory (split every max_gaps_per_page gaps). All pages share one
+content-hashed asset bundle, one source chunk directory and a site-wide search
+index. Gap pages are rendered in parallel, and a page whose inputs have not
+changed since the previous run (and whose source chunks are all still present)
+is neither re-rendered nor rewritten. Pages, assets and source chunks that no
+current page refers to are removed.
+"""
+
+import copy
+import hashlib
+import html
+import json
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from ...models import CoverageReport, DocumentationGap
+except ImportError:
+    # Fallback for when running as standalone module
+    from typing import Any as CoverageReport, Any as DocumentationGap
+
+from ..output_files import write_if_changed
+from .html_generator import HtmlGenerator
+from .js_components.site_navigation import get_site_navigation_js
+from .minify import minify_js
+
+# Bump when page markup or the manifest changes in a way the page keys do not capture
+SITE_VERSION = 2
+
+DEFAULT_SITE_DIR = "documentation-coverage-site"
+DEFAULT_DIRECTORY_DEPTH = 2
+DEFAULT_MAX_GAPS_PER_PAGE = 500
+
+MANIFEST_NAME = "site-manifest.json"
+SITE_INDEX_NAME = "site-index.js"
+PAGES_DIR = "pages"
+ASSETS_DIR = "assets"
+SOURCES_DIR = "sources"
+
+
+@dataclass(slots=True)
+class SitePage:
+    """One gaps page of the site: the gaps of a directory, or a slice of them."""
+    slug: str
+    title: str
+    gaps: List[DocumentationGap]
+
+    @property
+    def href(self) -> str:
+        """Path of the page relative to the site root."""
+        return f"{PAGES_DIR}/{self.slug}.html"
+
+
+@dataclass(slots=True)
+class SiteAssets:
+    """Site-root-relative paths of the shared, content-hashed assets."""
+    css: str
+    js: str
+    site_js: str
+
+
+class HtmlSiteGenerator:
+    """Generates the multi-page html-site report."""
+
+    def __init__(self, config: Dict[str, Any]):
+        """Initialize the site generator.
+
+        Args:
+            config: Config dictionary; sources are always written as sidecar chunks
+        """
+        self.config = copy.deepcopy(config)
+        reporting = self.config.setdefault("reporting", {})
+        reporting.setdefault("html", {})["source_embedding"] = "sidecar"
+
+        site_config = reporting.get("html_site", {})
+        self.directory_depth = max(1, site_config.get("directory_depth", DEFAULT_DIRECTORY_DEPTH))
+        self.max_gaps_per_page = max(1, site_config.get("max_gaps_per_page", DEFAULT_MAX_GAPS_PER_PAGE))
+        self.workers = site_config.get("workers") or min(8, os.cpu_count() or 1)
+
+        self.html_generator = HtmlGenerator(self.config)
+        self.content_generator = self.html_generator.content_generator
+
+    def set_code_files(self, code_files: List[Any]) -> None:
+        """Set the code files data for line count information."""
+        self.html_generator.set_code_files(code_files)
+
+    def plan_pages(self, report: CoverageReport) -> List[SitePage]:
+        """Group the gaps into pages by directory prefix, in directory order."""
+        groups: Dict[str, List[DocumentationGap]] = {}
+        for gap in report.gaps:
+            directory = "/".join(gap.code_file.split("/")[:-1][:self.directory_depth]) or "."
+            groups.setdefault(directory, []).append(gap)
+
+        pages: List[SitePage] = []
+        used_slugs = set()
+        for directory in sorted(groups):
+            gaps = groups[directory]
+            slices = [gaps[start:start + self.max_gaps_per_page]
+                      for start in range(0, len(gaps), self.max_gaps_per_page)]
+            base_slug = re.sub(r'[^a-z0-9]+', '-', directory.lower()).strip('-') or "root"
+
+            for number, page_gaps in enumerate(slices, 1):
+                slug = base_slug if len(slices) == 1 else f"{base_slug}-{number}"
+                # Directories differing only in punctuation or case map to the same slug
+                while slug in used_slugs:
+                    slug += "-x"
+                used_slugs.add(slug)
+                title = directory if len(slices) == 1 else f"{directory} ({number}/{len(slices)})"
+                pages.append(SitePage(slug=slug, title=title, gaps=page_gaps))
+        return pages
+
+    def write_site(self, report: CoverageReport, output_dir: str) -> str:
+        """Write the site into output_dir and return the path of its overview page."""
+        os.makedirs(os.path.join(output_dir, PAGES_DIR), exist_ok=True)
+        self.content_generator.set_source_sidecar(os.path.join(output_dir, SOURCES_DIR), f"../{SOURCES_DIR}")
+
+        pages = self.plan_pages(report)
+        assets = self._write_assets(output_dir)
+        write_if_changed(os.path.join(output_dir, SITE_INDEX_NAME), self._build_site_index(pages))
+
+        manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+        previous_keys, previous_chunks = self._load_manifest(manifest_path)
+        keys = {page.href: self._page_key(page, pages, assets) for page in pages}
+        stale = [page for page in pages
+                 if previous_keys.get(page.href) != keys[page.href]
+                 or page.href not in previous_chunks
+                 or not os.path.exists(os.path.join(output_dir, page.href))
+                 or not all(map(self.content_generator.source_chunk_exists, previous_chunks[page.href]))]
+
+        print(f"🗂️  Rendering {len(stale)} of {len(pages)} site pages "
+              f"({len(pages) - len(stale)} unchanged) with {self.workers} workers...", file=sys.stderr)
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            # list() re-raises the first rendering error
+            list(executor.map(lambda page: write_if_changed(
+                os.path.join(output_dir, page.href), self._render_page(report, page, pages, assets)
+            ), stale))
+
+        # Unchanged pages still refer to the chunks recorded by the run that rendered them
+        rendered = {page.href for page in stale}
+        chunks = {page.href: sorted(self.content_generator.source_chunks_for(page.gaps))
+                  if page.href in rendered else previous_chunks[page.href] for page in pages}
+
+        index_path = os.path.join(output_dir, "index.html")
+        write_if_changed(index_path, self._render_index(report, pages, assets))
+        write_if_changed(manifest_path, json.dumps({"version": SITE_VERSION, "pages": keys,
+                                                          "chunks": chunks}, indent=2))
+        self._prune(output_dir, pages, assets, chunks)
+        return index_path
+
+    def _write_assets(self, output_dir: str) -> SiteAssets:
+        """Write the shared CSS/JS under content-hashed names, so pages can be cached forever."""
+        site_js = get_site_navigation_js()
+        # The site navigation renders classes of its own, so its CSS rules must be kept
+        bundle = self.html_generator._get_asset_bundle(site_js)
+        if self.config["reporting"]["html"].get("minify_assets", True):
+            site_js = minify_js(site_js)
+
+        paths = []
+        for prefix, suffix, content in (("report", "css", bundle.css), ("report", "js", bundle.js),
+                                        ("site", "js", site_js)):
+            content_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()[:12]
+            path = f"{ASSETS_DIR}/{prefix}-{content_hash}.{suffix}"
+            full_path = os.path.join(output_dir, path)
+            if not os.path.exists(full_path):
+                write_if_changed(full_path, content)
+            paths.append(path)
+        return SiteAssets(*paths)
+
+    def _build_site_index(self, pages: List[SitePage]) -> str:
+        """Script defining window.docsCoverageSiteIndex: every page with its search tokens."""
+        entries = []
+        for page in pages:
+            tokens = set()
+            for gap in page.gaps:
+                tokens.update(self.content_generator.gap_search_tokens(gap))
+            entries.append({'slug': page.slug, 'title': page.title, 'href': page.href,
+                            'gaps': len(page.gaps), 'tokens': sorted(tokens)})
+
+        data = json.dumps({'version': SITE_VERSION, 'pages': entries}, separators=(',', ':'))
+        return f"window.docsCoverageSiteIndex = {data};\n"
+
+    def _page_key(self, page: SitePage, pages: List[SitePage], assets: SiteAssets) -> str:
+        """Hash everything a gaps page is rendered from.
+
+        Source files are identified by size and modification time, so an
+        edited source changes the page (its chunk hash) without reading it.
+        """
+        previous_page, next_page = self._neighbours(page, pages)
+        digest = hashlib.sha256(json.dumps([
+            SITE_VERSION, page.slug, page.title, assets.css, assets.js, assets.site_js,
+            [(p.href, p.title) if p else None for p in (previous_page, next_page)],
+            self.content_generator._get_github_url(""), self.config
+        ], sort_keys=True, default=str).encode('utf-8'))
+
+        for gap in page.gaps:
+            try:
+                stat = os.stat(gap.code_file)
+                source = [stat.st_size, stat.st_mtime_ns]
+            except OSError:
+                source = None
+            line_count = self.content_generator._get_line_count_for_file(gap.code_file)
+            digest.update(json.dumps([gap.to_dict(), line_count, source]).encode('utf-8'))
+        return digest.hexdigest()
+
+    def _neighbours(self, page: SitePage, pages: List[SitePage]) -> Tuple[Optional[SitePage], Optional[SitePage]]:
+        index = pages.index(page)
+        return (pages[index - 1] if index > 0 else None,
+                pages[index + 1] if index + 1 < len(pages) else None)
+
+    def _render_page(self, report: CoverageReport, page: SitePage, pages: List[SitePage],
+                     assets: SiteAssets) -> str:
+        """Render one gaps page; it contains nothing that depends on other pages' gaps."""
+        page_report = replace(report, gaps=page.gaps)
+        previous_page, next_page = self._neighbours(page, pages)
+
+        def link(target: Optional[SitePage], label: str) -> str:
+            if target is None:
+                return f'<span class="site-nav-link disabled">{label}</span>'
+            return f'<a class="site-nav-link" href="../{target.href}" title="{html.escape(target.title)}">{label}</a>'
+
+        parts = list(self.html_generator.iter_document_head(
+            html.escape(f"Documentation Coverage - {page.title}"), stylesheet_href=f"../{assets.css}"
+        ))
+        parts.append(f"""
+        <nav class="site-nav" data-site-page="{page.slug}" data-site-root="../">
+            <a class="site-nav-link" href="../index.html">🏠 Overview</a>
+            {link(previous_page, "◀️ Previous")}
+            {link(next_page, "Next ▶️")}
+        </nav>
+        <div class="header">
+            <h1>📁 {html.escape(page.title)}</h1>
+            <p>{len(page.gaps)} documentation gaps</p>
+        </div>
+        <div id="site-search-results" class="site-search-results" style="display: none;"></div>
+""")
+        parts.extend(self.content_generator.iter_gaps_analysis(page_report))
+        parts.extend(self.html_generator.iter_document_tail(
+            page_report, script_hrefs=[f"../{assets.js}", f"../{SITE_INDEX_NAME}", f"../{assets.site_js}"]
+        ))
+        return "".join(parts)
+
+    def _render_index(self, report: CoverageReport, pages: List[SitePage], assets: SiteAssets) -> str:
+        """Render the overview page: summary cards, the list of pages and recommendations."""
+        content = self.content_generator
+        parts = list(self.html_generator.iter_document_head(
+            f"Documentation Coverage Report - {report.timestamp}", stylesheet_href=assets.css
+        ))
+        parts.append("\n" + content.generate_header(report))
+        parts.append("\n" + content.generate_overview_cards(report))
+        parts.append("\n" + content.generate_quality_metrics(report))
+        parts.append("\n" + content.generate_priority_breakdown(report))
+        parts.append("\n" + self._generate_pages_list(pages))
+        parts.append("\n" + content.generate_recommendations(report))
+        parts.append("\n" + content.generate_footer(report))
+        parts.extend(self.html_generator.iter_document_tail(
+            replace(report, gaps=[]), script_hrefs=[assets.js, SITE_INDEX_NAME, assets.site_js]
+        ))
+        return "".join(parts)
+
+    def _generate_pages_list(self, pages: List[SitePage]) -> str:
+        """Generate the searchable list of gaps pages with their priority counts."""
+        rows = []
+        for page in pages:
+            counts = {}
+            for gap in page.gaps:
+                counts[gap.priority] = counts.get(gap.priority, 0) + 1
+            cells = "".join(f"<td>{counts.get(priority, 0)}</td>" for priority in ("critical", "high", "medium", "low"))
+            rows.append(f"""
+                    <tr data-site-page="{page.slug}">
+                        <td><a href="{page.href}">{html.escape(page.title)}</a></td>
+                        <td>{len(page.gaps)}</td>{cells}
+                    </tr>""")
+
+        return f"""
+        <div class="card">
+            <h2>🗂️ Report Pages</h2>
+            <div class="search-container">
+                <input type="text" id="site-search" placeholder="🔍 Search files, paths, or issues on all pages..." class="search-input">
+            </div>
+            <p class="site-pages-summary"><span id="site-pages-count">{len(pages)}</span> of {len(pages)} pages</p>
+            <table class="advanced-table site-pages-table">
+                <thead>
+                    <tr>
+                        <th>📁 Directory</th>
+                        <th>📄 Gaps</th>
+                        <th>🚨 Critical</th>
+                        <th>⚠️ High</th>
+                        <th>📝 Medium</th>
+                        <th>💡 Low</th>
+                    </tr>
+                </thead>
+                <tbody>{''.join(rows)}
+                </tbody>
+            </table>
+        </div>"""
+
+    def _load_manifest(self, manifest_path: str) -> Tuple[Dict[str, str], Dict[str, List[str]]]:
+        """Load the page keys and source chunks of the previous run, or none if missing or from another version."""
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}, {}
+        if manifest.get("version") != SITE_VERSION:
+            return {}, {}
+        return manifest.get("pages", {}), manifest.get("chunks", {})
+
+    def _prune(self, output_dir: str, pages: List[SitePage], assets: SiteAssets,
+               chunks: Dict[str, List[str]]) -> None:
+        """Remove pages, assets and source chunks of earlier runs that nothing links to any more."""
+        keep = {page.href for page in pages} | {assets.css, assets.js, assets.site_js}
+        for directory in (PAGES_DIR, ASSETS_DIR):
+            for path in Path(output_dir, directory).glob("*"):
+                if path.is_file() and f"{directory}/{path.name}" not in keep:
+                    path.unlink()
+        self.content_generator.prune_source_chunks({chunk for page_chunks in chunks.values()
+                                                    for chunk in page_chunks})
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Syntax Pre-tokenization for HTML Report Source Previews
+
+Mirrors the built-in tokenizer of js/utils/syntax-highlighting.js so that the
+report can ship ready-made token streams for large sources: the modal then
+only renders spans and never tokenizes those files in the browser.
+
+A stream is base64-encoded unsigned LEB128 varints, three per token: the gap
+since the end of the previous token, the token length and the kind index
+(SYNTAX_TOKEN_KINDS). Offsets count UTF-16 code units, like JavaScript strings.
+"""
+
+import base64
+import re
+from typing import Dict, List, Optional, Pattern, Tuple
+
+# Token kinds in stream order; the JavaScript maps them to hljs-* classes
+SYNTAX_TOKEN_KINDS = (
+    'keyword', 'literal', 'built_in', 'type', 'string', 'comment', 'number', 'regexp',
+    'function', 'class', 'language', 'meta', 'name', 'attr', 'selector'
+)
+
+# Bumped whenever the grammars or the stream format change
+SYNTAX_TOKENS_VERSION = 1
+
+_KIND = {kind: index for index, kind in enumerate(SYNTAX_TOKEN_KINDS)}
+
+_DOUBLE_QUOTED = r'"(?:[^"\\\n]|\\[\s\S])*"?'
+_SINGLE_QUOTED = r"'(?:[^'\\\n]|\\[\s\S])*'?"
+
+# Alternatives of one regex, each a token kind or a rule ('word', 'regexp_literal')
+_GRAMMAR_SOURCES: Dict[str, Dict[str, object]] = {
+    'script': {
+        'rules': [
+            ('comment', r'\/\/[^\n]*|\/\*[\s\S]*?\*\/|\/\*[\s\S]*'),
+            ('string', rf'{_DOUBLE_QUOTED}|{_SINGLE_QUOTED}|`(?:[^`\\]|\\[\s\S])*`?'),
+            ('regexp_literal', r'\/(?![*\/])(?:[^\/\\\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\])+\/[a-z]*'),
+            ('number', r'(?<![\w$.])(?:0[xXbBoO][\da-fA-F_]+n?|(?:\d[\d_]*(?:\.[\d_]*)?|\.\d[\d_]*)(?:[eE][+-]?\d+)?n?)'),
+            ('meta', r'@[A-Za-z_$][\w$.]*'),
+            ('name', r'(?<![\w$)\]])<\/?[A-Za-z][\w.:-]*'),
+            ('word', r'[A-Za-z_$][\w$]*'),
+        ],
+        'keywords': 'break case catch class const continue debugger default delete do else export extends finally for from function if import in instanceof let new of return static switch throw try typeof var void while with yield async await get set as',
+        'literals': 'true false null undefined NaN Infinity',
+        'built_ins': 'Array Boolean console Date document Error JSON Map Math Number Object Promise Reflect RegExp Set String Symbol WeakMap WeakSet window globalThis process require module exports',
+        'language': 'this super arguments',
+    },
+    'python': {
+        'rules': [
+            ('comment', r'#[^\n]*'),
+            ('string', rf'[rRbBuUfF]{{0,2}}(?:"""[\s\S]*?"""|\'\'\'[\s\S]*?\'\'\'|"""[\s\S]*|\'\'\'[\s\S]*|{_DOUBLE_QUOTED}|{_SINGLE_QUOTED})'),
+            ('number', r'(?<![\w.])(?:0[xXbBoO][\da-fA-F_]+|(?:\d[\d_]*(?:\.[\d_]*)?|\.\d[\d_]*)(?:[eE][+-]?\d+)?j?)'),
+            ('meta', r'@[A-Za-z_][\w.]*'),
+            ('word', r'[A-Za-z_]\w*'),
+        ],
+        'keywords': 'and as assert async await break class continue def del elif else except finally for from global if import in is lambda nonlocal not or pass raise return try while with yield match case',
+        'literals': 'True False None',
+        'built_ins': 'print len range open dict list set tuple str int float bool bytes type isinstance issubclass super enumerate zip map filter sorted reversed min max sum abs any all getattr setattr hasattr repr iter next object Exception',
+        'language': 'self cls',
+    },
+    'css': {
+        'rules': [
+            ('comment', r'\/\*[\s\S]*?\*\/|\/\*[\s\S]*|(?<![:(\w])\/\/[^\n]*'),
+            ('string', rf'{_DOUBLE_QUOTED}|{_SINGLE_QUOTED}'),
+            ('keyword', r'@[\w-]+|!important'),
+            ('selector', r'(?<![\w-])[.#][A-Za-z_-][\w-]*(?=[^;{}]*\{)'),
+            ('attr', r'(?<![\w-])-?[A-Za-z][\w-]*(?=\s*:[^;{}]*[;}])'),
+            ('number', r'#[\da-fA-F]{3,8}(?![\w-])|(?<![\w-])-?(?:\d+\.?\d*|\.\d+)(?:%|[A-Za-z]+)?'),
+        ],
+    },
+    'json': {
+        'rules': [
+            ('attr', r'"(?:[^"\\\n]|\\[\s\S])*"(?=\s*:)'),
+            ('string', _DOUBLE_QUOTED),
+            ('number', r'-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?'),
+            ('literal', r'\b(?:true|false|null)\b'),
+        ],
+    },
+    'shell': {
+        'rules': [
+            ('comment', r'(?<![^\s])#[^\n]*'),
+            ('string', rf'{_DOUBLE_QUOTED}|{_SINGLE_QUOTED}'),
+            ('number', r'(?<![\w.-])\d+(?:\.\d+)?(?![\w.-])'),
+        ],
+    },
+}
+
+# TypeScript is JavaScript plus its own keywords and primitive types
+_TYPESCRIPT_KEYWORDS = 'abstract declare enum implements interface keyof namespace private protected public readonly type satisfies infer is asserts override'
+_TYPESCRIPT_TYPES = 'any boolean never number object string symbol unknown bigint'
+
+# Words after which a "/" starts a regular expression rather than a division
+_REGEXP_PREFIX_WORDS = frozenset('return typeof instanceof in of new delete void throw case do else yield await'.split())
+_OPERAND_END = re.compile(r'[\w$)\]"\'`]', re.ASCII)
+_WORD_CHAR = re.compile(r'[\w$]', re.ASCII)
+
+_LANGUAGE_GRAMMARS = {
+    'javascript': 'script', 'typescript': 'script', 'python': 'python', 'css': 'css', 'scss': 'css',
+    'sass': 'css', 'less': 'css', 'json': 'json', 'bash': 'shell', 'yaml': 'shell',
+}
+
+
+class _Grammar:
+    """A compiled grammar: one alternation regex plus identifier word sets."""
+
+    def __init__(self, source: Dict[str, object], typescript: bool):
+        rules = source['rules']
+        self.pattern: Pattern[str] = re.compile('|'.join(f'({pattern})' for _, pattern in rules), re.ASCII)
+        self.rules = [_KIND.get(rule, rule) for rule, _ in rules]
+        keywords = str(source.get('keywords', ''))
+        self.keywords = frozenset((keywords + (' ' + _TYPESCRIPT_KEYWORDS if typescript else '')).split())
+        self.types = frozenset(_TYPESCRIPT_TYPES.split() if typescript else ())
+        self.literals = frozenset(str(source.get('literals', '')).split())
+        self.built_ins = frozenset(str(source.get('built_ins', '')).split())
+        self.language = frozenset(str(source.get('language', '')).split())
+
+    def classify_word(self, text: str, word: str, end: int) -> Optional[int]:
+        if word in self.keywords:
+            return _KIND['keyword']
+        if word in self.literals:
+            return _KIND['literal']
+        if word in self.language:
+            return _KIND['language']
+        if word in self.types:
+            return _KIND['type']
+        if word in self.built_ins:
+            return _KIND['built_in']
+
+        while end < len(text) and text[end] in ' \t':
+            end += 1
+        if end < len(text) and text[end] == '(':
+            return _KIND['function']
+        if 'A' <= word[0] <= 'Z':
+            return _KIND['class']
+        return None
+
+
+_grammars: Dict[str, Optional[_Grammar]] = {}
+
+
+def _get_grammar(language: str) -> Optional[_Grammar]:
+    if language not in _grammars:
+        name = _LANGUAGE_GRAMMARS.get(language)
+        _grammars[language] = _Grammar(_GRAMMAR_SOURCES[name], language == 'typescript') if name else None
+    return _grammars[language]
+
+
+def _regexp_allowed(text: str, start: int) -> bool:
+    """A "/" starts a regex literal unless it follows an operand."""
+    index = start - 1
+    while index >= 0 and text[index].isspace():
+        index -= 1
+    if index < 0 or not _OPERAND_END.match(text[index]):
+        return True
+    word_start = index
+    while word_start > 0 and _WORD_CHAR.match(text[word_start - 1]):
+        word_start -= 1
+    return text[word_start:index + 1] in _REGEXP_PREFIX_WORDS
+
+
+def tokenize_source(text: str, language: str) -> Optional[List[Tuple[int, int, int]]]:
+    """Tokenize source text into (start, end, kind) tuples of code point offsets.
+
+    Returns None for languages without a grammar (shown as plain text).
+    """
+    grammar = _get_grammar(language)
+    if grammar is None:
+        return None
+
+    tokens = []
+    search = grammar.pattern.search
+    pos = 0
+    while pos < len(text):
+        match = search(text, pos)
+        if match is None:
+            break
+        start, end = match.span()
+        kind = grammar.rules[match.lastindex - 1]
+        if kind == 'regexp_literal':
+            if not _regexp_allowed(text, start):
+                pos = start + 1
+                continue
+            kind = _KIND['regexp']
+        elif kind == 'word':
+            kind = grammar.classify_word(text, match.group(), end)
+
+        pos = max(end, start + 1)
+        if kind is not None:
+            tokens.append((start, end, kind))
+    return tokens
+
+
+def _varint(value: int, out: bytearray) -> None:
+    while value >= 0x80:
+        out.append(value & 0x7f | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def encode_syntax_tokens(text: str, tokens: List[Tuple[int, int, int]]) -> str:
+    """Encode tokens as a base64 varint stream with UTF-16 offsets."""
+    if len(text.encode('utf-16-le')) != 2 * len(text):
+        # Characters outside the BMP take two UTF-16 code units in the browser
+        units = [0]
+        for char in text:
+            units.append(units[-1] + (2 if ord(char) > 0xFFFF else 1))
+        tokens = [(units[start], units[end], kind) for start, end, kind in tokens]
+
+    out = bytearray()
+    previous_end = 0
+    for start, end, kind in tokens:
+        _varint(start - previous_end, out)
+        _varint(end - start, out)
+        _varint(kind, out)
+        previous_end = end
+    return base64.b64encode(bytes(out)).decode('ascii')
+
+
+def pretokenize_source(data: bytes, language: str) -> Optional[str]:
+    """Pre-tokenize raw source bytes into an encoded token stream, or None without a grammar.
+
+    Sources are decoded like the browser's TextDecoder does: invalid UTF-8 is
+    replaced and a leading byte order mark is dropped.
+    """
+    text = data.decode('utf-8-sig', errors='replace')
+    tokens = tokenize_source(text, language)
+    if tokens is None:
+        return None
+    return encode_syntax_tokens(text, tokens)
@@ -6,12 +6,75 @@ Loads HTML templates and CSS files from the file system to avoid inline content.
 """
 
 import os
+import re
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+# Template placeholders look like {{name}}
+_PLACEHOLDER = re.compile(r"\{\{(\w+)\}\}")
+
+# Files read by any loader in this process, keyed by path: (size, mtime_ns, content)
+_file_cache: Dict[Path, Tuple[int, int, str]] = {}
+
+# Compiled templates, keyed by path: (size, mtime_ns, template)
+_compiled_cache: Dict[Path, Tuple[int, int, "CompiledTemplate"]] = {}
+
+
+class CompiledTemplate:
+    """A template split into literal text and placeholder names."""
+    
+    def __init__(self, source: str):
+        """Compile template source.
+        
+        Args:
+            source: Template text with {{name}} placeholders
+        """
+        pieces = _PLACEHOLDER.split(source)
+        # Literals sit at even indexes, placeholder names at odd ones
+        self.segments: List[str] = pieces
+        self.placeholders: List[Tuple[int, str]] = [
+            (index, pieces[index]) for index in range(1, len(pieces), 2)
+        ]
+    
+    def render(self, values: Dict[str, Any]) -> str:
+        """Render the template in one join.
+        
+        Placeholders without a value are kept as written.
+        """
+        parts = list(self.segments)
+        for index, name in self.placeholders:
+            parts[index] = str(values[name]) if name in values else f"{{{{{name}}}}}"
+        return "".join(parts)
+
+
+def _read_cached(path: Path, kind: str) -> Tuple[int, int, str]:
+    """Read a file through the process-wide cache, re-reading it only when it changed.
+    
+    Returns:
+        (size, mtime_ns, content) of the file
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        raise FileNotFoundError(f"{kind} not found: {path}") from None
+    
+    cached = _file_cache.get(path)
+    if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+        return cached
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    entry = _file_cache[path] = (stat.st_size, stat.st_mtime_ns, content)
+    return entry
 
 
 class TemplateLoader:
-    """Loads HTML templates and CSS files from the file system."""
+    """Loads HTML templates and CSS files from the file system.
+    
+    Loaded files and compiled templates are cached for the whole process and
+    shared by all loaders; a file is read again only when its size or
+    modification time changes.
+    """
     
     def __init__(self, base_path: Optional[Path] = None):
         """Initialize the template loader.
@@ -26,11 +89,6 @@ class TemplateLoader:
         self.templates_dir = base_path / "templates"
         self.styles_dir = base_path / "styles"
         self.scripts_dir = base_path / "scripts"
-        
-        # Cache for loaded templates
-        self._template_cache: Dict[str, str] = {}
-        self._style_cache: Dict[str, str] = {}
-        self._script_cache: Dict[str, str] = {}
     
     def load_template(self, template_name: str) -> str:
         """Load an HTML template from the templates directory.
@@ -41,18 +99,7 @@ class TemplateLoader:
         Returns:
             Template content as string
         """
-        if template_name in self._template_cache:
-            return self._template_cache[template_name]
-        
-        template_path = self.templates_dir / template_name
-        if not template_path.exists():
-            raise FileNotFoundError(f"Template not found: {template_path}")
-        
-        with open(template_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        self._template_cache[template_name] = content
-        return content
+        return _read_cached(self.templates_dir / template_name, "Template")[2]
     
     def load_style(self, style_name: str) -> str:
         """Load a CSS file from the styles directory.
@@ -63,18 +110,7 @@ class TemplateLoader:
         Returns:
             CSS content as string
         """
-        if style_name in self._style_cache:
-            return self._style_cache[style_name]
-        
-        style_path = self.styles_dir / style_name
-        if not style_path.exists():
-            raise FileNotFoundError(f"Style not found: {style_path}")
-        
-        with open(style_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        self._style_cache[style_name] = content
-        return content
+        return _read_cached(self.styles_dir / style_name, "Style")[2]
     
     def load_script(self, script_name: str) -> str:
         """Load a JavaScript file from the scripts directory.
@@ -85,18 +121,27 @@ class TemplateLoader:
         Returns:
             JavaScript content as string
         """
-        if script_name in self._script_cache:
-            return self._script_cache[script_name]
+        return _read_cached(self.scripts_dir / script_name, "Script")[2]
+    
+    def compile_template(self, template_name: str) -> CompiledTemplate:
+        """Load and compile a template, reusing the compiled form while the file is unchanged.
         
-        script_path = self.scripts_dir / script_name
-        if not script_path.exists():
-            raise FileNotFoundError(f"Script not found: {script_path}")
+        Args:
+            template_name: Name of the template file
+            
+        Returns:
+            Compiled template
+        """
+        template_path = self.templates_dir / template_name
+        size, mtime_ns, source = _read_cached(template_path, "Template")
         
-        with open(script_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        cached = _compiled_cache.get(template_path)
+        if cached and cached[0] == size and cached[1] == mtime_ns:
+            return cached[2]
         
-        self._script_cache[script_name] = content
-        return content
+        compiled = CompiledTemplate(source)
+        _compiled_cache[template_path] = (size, mtime_ns, compiled)
+        return compiled
     
     def render_template(self, template_name: str, **kwargs) -> str:
         """Render a template with variable substitution.
@@ -108,14 +153,7 @@ class TemplateLoader:
         Returns:
             Rendered template content
         """
-        template = self.load_template(template_name)
-        
-        # Simple template variable substitution
-        for key, value in kwargs.items():
-            placeholder = f"{{{{{key}}}}}"
-            template = template.replace(placeholder, str(value))
-        
-        return template
+        return self.compile_template(template_name).render(kwargs)
     
     def get_inline_styles(self) -> str:
         """Get all CSS styles as inline <style> tags.
@@ -164,7 +202,6 @@ class TemplateLoader:
         return f"<script>\n{chr(10).join(scripts)}\n</script>"
     
     def clear_cache(self):
-        """Clear all cached templates and styles."""
-        self._template_cache.clear()
-        self._style_cache.clear()
-        self._script_cache.clear() 
\ No newline at end of file
+        """Clear all cached templates and styles (for every loader in the process)."""
+        _file_cache.clear()
+        _compiled_cache.clear() 
\ No newline at end of file
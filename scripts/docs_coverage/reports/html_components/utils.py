@@ -93,6 +93,15 @@ class HtmlUtils:
         }
         return effort_values.get(effort.lower(), 0)
     
+    @staticmethod
+    def get_status_sort_value(gap_type: str) -> int:
+        """Get numeric sort value for gap status (higher number = more severe)."""
+        status_values = {
+            'missing': 2,
+            'inadequate': 1
+        }
+        return status_values.get(gap_type.lower(), 0)
+    
     @staticmethod
     def get_github_url(file_path: str) -> str:
         """Generate GitHub URL for a file in the main branch."""
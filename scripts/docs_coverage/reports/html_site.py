@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Multi-page HTML Site Report Generator for Documentation Coverage
+
+Writes the report as a static site for very large trees:
+- Overview page with statistics, priority breakdown and a searchable page list
+- One interactive gaps page per directory (or per max_gaps_per_page gaps)
+- Shared content-hashed assets and lazily loaded source chunks
+- Only pages whose content changed are rewritten
+"""
+
+from typing import Any, List
+
+from ..config import ConfigManager
+from ..models import CoverageReport
+
+
+class HtmlSiteReporter:
+    """Multi-page HTML site report generator."""
+    
+    def __init__(self, config: ConfigManager):
+        self.config = config
+        self.code_files = None  # Will be set by the checker
+        self.output_dir = "documentation-coverage-site"  # Default output directory
+    
+    def set_code_files(self, code_files: List[Any]) -> None:
+        """Set the code files data for line count information."""
+        self.code_files = code_files
+    
+    def set_output_file(self, output_file: str) -> None:
+        """Set custom output directory (named like the other file reporters' setter)."""
+        self.output_dir = output_file
+    
+    def generate(self, report: CoverageReport) -> str:
+        """Write the site and return the path of its overview page."""
+        from .html_components.site_generator import HtmlSiteGenerator
+        
+        try:
+            site_generator = HtmlSiteGenerator(self.config.config)
+            if self.code_files:
+                site_generator.set_code_files(self.code_files)
+            index_path = site_generator.write_site(report, self.output_dir)
+            
+            print(f"📄 HTML site generated: {index_path}")
+            return index_path
+            
+        except Exception as e:
+            print(f"❌ Failed to generate HTML site: {e}")
+            raise
@@ -3,10 +3,9 @@
 JSON report generator for documentation coverage analysis
 """
 
-import json
-from dataclasses import asdict
 from ..models import CoverageReport
 from ..config import ConfigManager
+from ..serialization import report_json
 
 class JsonReporter:
     """Generates JSON reports for API integration"""
@@ -21,4 +20,4 @@ class JsonReporter:
     
     def generate(self, report: CoverageReport) -> str:
         """Generate JSON report"""
-        return json.dumps(asdict(report), indent=2, default=str) 
\ No newline at end of file
+        return report_json(report)
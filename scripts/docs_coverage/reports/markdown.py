@@ -1,11 +1,65 @@
 #!/usr/bin/env python3
 """
 Markdown report generator for documentation
+
+MarkdownReporter writes the single-page report. MarkdownCommentReporter writes
+a compact variant for pull request comments, with one collapsible <details>
+section per priority and a hard cap on its length.
 """
 
-from ..models import CoverageReport
+import re
+from typing import Callable, Dict, List
+
+from ..models import CoverageReport, DocumentationGap
 from ..config import ConfigManager
 
+PRIORITY_ORDER = ("critical", "high", "medium", "low")
+
+PRIORITY_EMOJI = {"critical": "🚨", "high": "⚠️", "medium": "📝", "low": "💡"}
+
+PRIORITY_DESCRIPTIONS = {
+    "critical": "Public APIs, complex services - immediate action required",
+    "high": "Core components, important utilities - action needed soon",
+    "medium": "Supporting code, hooks - should be documented",
+    "low": "Internal utilities, simple helpers - nice to have"
+}
+
+GAP_TABLE_HEADER = ["| File | Status | Expected Documentation | Issues |",
+                    "|------|--------|------------------------|--------|"]
+
+# GitHub rejects comments over 65,536 characters; leave room for the
+# surrounding badges and links the workflow adds
+DEFAULT_MAX_COMMENT_CHARS = 60000
+
+
+def bucket_gaps(gaps: List[DocumentationGap],
+                key: Callable[[DocumentationGap], str] = lambda gap: gap.priority) -> Dict[str, List[DocumentationGap]]:
+    """Group gaps by key in a single pass, keeping their order within each group."""
+    buckets: Dict[str, List[DocumentationGap]] = {}
+    for gap in gaps:
+        buckets.setdefault(key(gap), []).append(gap)
+    return buckets
+
+
+def gap_row(gap: DocumentationGap, full_path: bool = False, escape: bool = False) -> str:
+    """One gaps table row; file names only unless full_path is set.
+
+    With escape, characters that would end a table cell or start MDX markup
+    (| < > { }) are backslash-escaped in the issues column.
+    """
+    if full_path:
+        file_name, doc_name = gap.code_file, gap.expected_doc_path
+    else:
+        file_name = gap.code_file.split("/")[-1]
+        doc_name = gap.expected_doc_path.split("/")[-1]
+    issues = ", ".join(gap.quality_issues[:3])  # Limit to first 3 issues
+    if len(gap.quality_issues) > 3:
+        issues += "..."
+    if escape:
+        issues = re.sub(r'([|<>{}])', r'\\\1', issues)
+    return f"| `{file_name}` | {gap.gap_type.title()} | `{doc_name}` | {issues} |"
+
+
 class MarkdownReporter:
     """Generates markdown reports for documentation"""
     
@@ -20,13 +74,37 @@ class MarkdownReporter:
     def generate(self, report: CoverageReport) -> str:
         """Generate markdown report with PR context if available"""
         output = []
+        output.extend(self._front_matter(report))
+        output.extend(self._overview(report))
+        
+        # Detailed gaps
+        if report.gaps:
+            output.append("## ❌ Documentation Gaps")
+            output.append("")
+            
+            buckets = bucket_gaps(report.gaps)
+            for priority in PRIORITY_ORDER:
+                priority_gaps = buckets.get(priority)
+                if priority_gaps:
+                    output.append(f"### {PRIORITY_EMOJI[priority]} {priority.title()} Priority")
+                    output.append("")
+                    output.extend(GAP_TABLE_HEADER)
+                    output.extend(gap_row(gap) for gap in priority_gaps)
+                    output.append("")
         
-        # Check if this is a PR-specific report
+        return "\n".join(output)
+    
+    def _is_pr_report(self) -> bool:
         pr_context = getattr(self, 'pr_context', None)
+        return bool(pr_context and pr_context.get('is_pr_analysis'))
+    
+    def _front_matter(self, report: CoverageReport) -> List[str]:
+        """Front matter, plus the PR heading and scope for PR reports."""
+        output = []
         
-        if pr_context and pr_context.get('is_pr_analysis'):
-            pr_info = pr_context.get('pr_info', {})
-            pr_files = pr_context.get('pr_files', [])
+        if self._is_pr_report():
+            pr_info = self.pr_context.get('pr_info', {})
+            pr_files = self.pr_context.get('pr_files', [])
             
             output.append("---")
             output.append("title: PR Documentation Coverage Report")
@@ -43,11 +121,7 @@ class MarkdownReporter:
             
             # PR context information
             if pr_info.get('pr_number'):
-                output.append(f"**Pull Request:** #{pr_info.get('pr_number', 'Unknown')}")
-                if pr_info.get('title'):
-                    output.append(f"**Title:** {pr_info.get('title')}")
-                if pr_info.get('author'):
-                    output.append(f"**Author:** {pr_info.get('author')}")
+                output.extend(self._pr_lines(pr_info))
                 output.append("")
             
             output.append(f"**PR Scope:** Analyzing {len(pr_files)} changed files")
@@ -62,12 +136,31 @@ class MarkdownReporter:
             output.append("---")
             output.append("")
         
+        return output
+    
+    def _pr_lines(self, pr_info: dict) -> List[str]:
+        output = [f"**Pull Request:** #{pr_info.get('pr_number', 'Unknown')}"]
+        if pr_info.get('title'):
+            output.append(f"**Title:** {pr_info.get('title')}")
+        if pr_info.get('author'):
+            output.append(f"**Author:** {pr_info.get('author')}")
+        return output
+    
+    def _overview(self, report: CoverageReport) -> List[str]:
+        """Title, headline numbers, summary table and priority breakdown."""
+        output = []
         output.append("# Documentation Coverage Report")
         output.append("")
         
         output.append(f"**Generated:** {report.timestamp}")
         output.append(f"**Coverage:** {report.coverage_percentage:.1f}% ({report.adequately_documented}/{report.total_code_files} files)")
         output.append(f"**Quality Score:** {report.quality_score:.2f}/1.0")
+        if report.estimate:
+            output.append("")
+            output.append(self._estimate_note(report))
+        if report.top_k:
+            output.append("")
+            output.append(f"> 🔝 **{report.describe_top_k()}.** Totals count every gap.")
         output.append("")
         
         # Summary table
@@ -84,52 +177,111 @@ class MarkdownReporter:
         output.append(f"| Average Quality Score | {report.quality_score:.2f}/1.0 |")
         output.append("")
         
-        # Priority breakdown
+        output.extend(self._priority_breakdown(report))
+        return output
+    
+    def _estimate_note(self, report: CoverageReport) -> str:
+        estimate = report.estimate
+        coverage_low, coverage_high = estimate.coverage_interval
+        quality_low, quality_high = estimate.quality_interval
+        return (f"> ⚠️ **{estimate.describe()}.** "
+                f"Coverage CI: {coverage_low:.1f}% – {coverage_high:.1f}%, "
+                f"quality CI: {quality_low:.2f} – {quality_high:.2f}. "
+                f"Counts cover sampled files only.")
+    
+    def _priority_breakdown(self, report: CoverageReport) -> List[str]:
+        output = []
         if any(count > 0 for count in report.by_priority.values()):
             output.append("## 🎯 Priority Breakdown")
             output.append("")
             output.append("| Priority | Count | Description |")
             output.append("|----------|-------|-------------|")
             
-            priority_descriptions = {
-                "critical": "Public APIs, complex services - immediate action required",
-                "high": "Core components, important utilities - action needed soon",
-                "medium": "Supporting code, hooks - should be documented",
-                "low": "Internal utilities, simple helpers - nice to have"
-            }
-            
             for priority, count in report.by_priority.items():
                 if count > 0:
-                    emoji = {"critical": "🚨", "high": "⚠️", "medium": "📝", "low": "💡"}[priority]
-                    desc = priority_descriptions[priority]
-                    output.append(f"| {emoji} {priority.title()} | {count} | {desc} |")
+                    output.append(f"| {PRIORITY_EMOJI[priority]} {priority.title()} | {count} | {PRIORITY_DESCRIPTIONS[priority]} |")
             
             output.append("")
+        return output
+
+
+class MarkdownCommentReporter(MarkdownReporter):
+    """Generates a compact markdown summary for pull request comments"""
+    
+    def __init__(self, config_manager: ConfigManager):
+        super().__init__(config_manager)
+        markdown_config = self.config.get("reporting", {}).get("markdown", {})
+        self.max_chars = markdown_config.get("max_comment_chars") or DEFAULT_MAX_COMMENT_CHARS
+    
+    def generate(self, report: CoverageReport) -> str:
+        """Generate the comment, listing gaps in priority order until max_chars is reached."""
+        output = []
+        if self._is_pr_report():
+            pr_info = self.pr_context.get('pr_info', {})
+            if pr_info.get('pr_number'):
+                output.extend(self._pr_lines(pr_info))
+                output.append("")
         
-        # Detailed gaps
-        if report.gaps:
-            output.append("## ❌ Documentation Gaps")
+        summary = (f"**Coverage:** {report.coverage_percentage:.1f}% "
+                   f"({report.adequately_documented}/{report.total_code_files} files) · "
+                   f"**Quality:** {report.quality_score:.2f}/1.0 · "
+                   f"**Gaps:** {report.total_gaps}")
+        output.append(summary)
+        if report.estimate:
             output.append("")
+            output.append(self._estimate_note(report))
+        if report.top_k:
+            output.append("")
+            output.append(f"> 🔝 **{report.describe_top_k()}.**")
+        output.append("")
+        output.extend(self._priority_breakdown(report))
+        
+        buckets = bucket_gaps(report.gaps)
+        sections = [(priority, buckets[priority]) for priority in PRIORITY_ORDER if buckets.get(priority)]
+        
+        # Every section's frame, table header and "more" line is reserved up
+        # front; rows fill what is left, most urgent priorities first
+        header = "\n".join(GAP_TABLE_HEADER)
+        frames = [self._section_frame(priority, gaps) for priority, gaps in sections]
+        reserved = [len(opening) + len(closing) + len(header) + len(more.format(count=len(gaps))) + 4
+                    for (_, gaps), (opening, closing, more) in zip(sections, frames)]
+        budget = self.max_chars - len("\n".join(output)) - sum(reserved)
+        if budget < 0:
+            # Not even the empty sections fit; only the headline numbers do
+            collapsed = f"{summary}\n\n_Gap details do not fit in this comment, see the full report._"
+            return collapsed[:self.max_chars]
+        full = False
+        
+        for (priority, gaps), (opening, closing, more), reserve in zip(sections, frames, reserved):
+            rows = []
+            for gap in gaps if not full else ():
+                row = gap_row(gap, full_path=True, escape=True)
+                if len(row) + 1 > budget:
+                    full = True
+                    break
+                rows.append(row)
+                budget -= len(row) + 1
             
-            for priority in ["critical", "high", "medium", "low"]:
-                priority_gaps = [g for g in report.gaps if g.priority == priority]
-                if priority_gaps:
-                    emoji = {"critical": "🚨", "high": "⚠️", "medium": "📝", "low": "💡"}[priority]
-                    output.append(f"### {emoji} {priority.title()} Priority")
-                    output.append("")
-                    
-                    output.append("| File | Status | Expected Documentation | Issues |")
-                    output.append("|------|--------|------------------------|--------|")
-                    
-                    for gap in priority_gaps:
-                        file_name = gap.code_file.split("/")[-1]
-                        doc_name = gap.expected_doc_path.split("/")[-1]
-                        issues = ", ".join(gap.quality_issues[:3])  # Limit to first 3 issues
-                        if len(gap.quality_issues) > 3:
-                            issues += "..."
-                        
-                        output.append(f"| `{file_name}` | {gap.gap_type.title()} | `{doc_name}` | {issues} |")
-                    
-                    output.append("")
+            output.append(opening)
+            if rows:
+                output.append(header)
+                output.extend(rows)
+            if len(rows) < len(gaps):
+                output.append(more.format(count=len(gaps) - len(rows)))
+            output.append(closing)
+            # Give back what this section did not use
+            budget += reserve - (len(opening) + len(closing) + 2 +
+                                 (len(header) + 1 if rows else 0) +
+                                 (len(output[-2]) + 1 if len(rows) < len(gaps) else 0))
         
-        return "\n".join(output) 
\ No newline at end of file
+        return "\n".join(output)
+    
+    def _section_frame(self, priority: str, gaps: List[DocumentationGap]) -> tuple:
+        """Opening, closing and "more" line template of a priority's <details> section."""
+        opening = "\n".join([
+            "<details>",
+            f"<summary>{PRIORITY_EMOJI[priority]} {priority.title()} priority ({len(gaps)})</summary>",
+            ""
+        ])
+        more = "\n_… and {count} more " + priority + " priority gaps, see the full report._"
+        return opening, "\n</details>\n", more
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Multi-page Markdown Report Generator for Documentation Coverage
+
+Writes the report as a directory of Docusaurus-ready pages for trees whose
+single markdown page is too large to build or review:
+- index.md with the summary, priority breakdown and a list of gap pages
+- One gaps page per priority (or per directory), split so that no page has
+  more than max_gaps_per_page rows or max_page_kb of markdown
+- Front matter with sidebar labels and positions, plus _category_.json files
+- Only pages whose content changed are rewritten, so unchanged pages do not
+  trigger rebuilds
+"""
+
+import json
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List
+
+from ..config import ConfigManager
+from ..models import CoverageReport, DocumentationGap
+from .markdown import (GAP_TABLE_HEADER, PRIORITY_EMOJI, PRIORITY_ORDER, MarkdownReporter,
+                       bucket_gaps, gap_row)
+from .output_files import write_if_changed
+
+DEFAULT_SITE_DIR = "documentation-coverage-docs"
+DEFAULT_DIRECTORY_DEPTH = 2
+DEFAULT_MAX_GAPS_PER_PAGE = 500
+DEFAULT_MAX_PAGE_KB = 100
+
+GAPS_DIR = "gaps"
+
+
+@dataclass(slots=True)
+class MarkdownPage:
+    """One gaps page: the table rows of a priority or directory, or a slice of them."""
+    slug: str
+    title: str
+    rows: List[str]
+    
+    @property
+    def href(self) -> str:
+        """Path of the page relative to the site root."""
+        return f"{GAPS_DIR}/{self.slug}.md"
+
+
+class MarkdownSiteReporter(MarkdownReporter):
+    """Multi-page markdown report generator."""
+
+    def __init__(self, config_manager: ConfigManager):
+        super().__init__(config_manager)
+        self.output_dir = DEFAULT_SITE_DIR  # Default output directory
+        
+        site_config = self.config.get("reporting", {}).get("markdown_site", {})
+        self.split_by = site_config.get("split_by", "priority")
+        if self.split_by not in ("priority", "directory"):
+            raise ValueError(f"reporting.markdown_site.split_by must be 'priority' or 'directory', not {self.split_by!r}")
+        self.directory_depth = max(1, site_config.get("directory_depth", DEFAULT_DIRECTORY_DEPTH))
+        self.max_gaps_per_page = max(1, site_config.get("max_gaps_per_page", DEFAULT_MAX_GAPS_PER_PAGE))
+        self.max_page_bytes = max(1, site_config.get("max_page_kb", DEFAULT_MAX_PAGE_KB)) * 1024
+    
+    def set_output_file(self, output_file: str) -> None:
+        """Set custom output directory (named like the other file reporters' setter)."""
+        self.output_dir = output_file
+    
+    def generate(self, report: CoverageReport) -> str:
+        """Write the pages and return a short summary."""
+        pages = self.plan_pages(report)
+        gaps_dir = os.path.join(self.output_dir, GAPS_DIR)
+        os.makedirs(gaps_dir, exist_ok=True)
+        
+        written = 0
+        for position, page in enumerate(pages, 1):
+            written += write_if_changed(os.path.join(self.output_dir, page.href),
+                                        self._render_page(page, position))
+        written += write_if_changed(os.path.join(self.output_dir, "index.md"), self._render_index(report, pages))
+        # index.md doubles as the category page of the site directory
+        write_if_changed(os.path.join(self.output_dir, "_category_.json"),
+                         self._category("Documentation Coverage", collapsed=False))
+        write_if_changed(os.path.join(gaps_dir, "_category_.json"), self._category("Gaps", collapsed=True))
+        
+        # Pages of earlier runs that nothing links to any more
+        keep = {Path(page.href).name for page in pages}
+        for path in Path(gaps_dir).glob("*.md"):
+            if path.name not in keep:
+                path.unlink()
+        
+        print(f"📄 Markdown site generated: {os.path.join(self.output_dir, 'index.md')}")
+        return (f"{len(pages) + 1} pages ({written} rewritten), "
+                f"{len(report.gaps)} gaps by {self.split_by}, coverage {report.coverage_percentage:.1f}%")
+    
+    def plan_pages(self, report: CoverageReport) -> List[MarkdownPage]:
+        """Bucket the gaps in one pass and split each bucket by row and size caps."""
+        if self.split_by == "priority":
+            buckets = bucket_gaps(report.gaps)
+            groups = [(priority, f"{PRIORITY_EMOJI[priority]} {priority.title()} Priority", buckets[priority])
+                      for priority in PRIORITY_ORDER if buckets.get(priority)]
+        else:
+            depth = self.directory_depth
+            buckets = bucket_gaps(report.gaps, lambda gap: "/".join(gap.code_file.split("/")[:-1][:depth]) or ".")
+            groups = [(directory, directory, buckets[directory]) for directory in sorted(buckets)]
+        
+        pages: List[MarkdownPage] = []
+        used_slugs = set()
+        for name, title, gaps in groups:
+            slices = self._split(gaps)
+            base_slug = re.sub(r'[^a-z0-9]+', '-', name.lower()).strip('-') or "root"
+            
+            for number, rows in enumerate(slices, 1):
+                slug = base_slug if len(slices) == 1 else f"{base_slug}-{number}"
+                # Directories differing only in punctuation or case map to the same slug
+                while slug in used_slugs:
+                    slug += "-x"
+                used_slugs.add(slug)
+                page_title = title if len(slices) == 1 else f"{title} ({number}/{len(slices)})"
+                pages.append(MarkdownPage(slug=slug, title=page_title, rows=rows))
+        return pages
+    
+    def _split(self, gaps: List[DocumentationGap]) -> List[List[str]]:
+        """Render the rows of a bucket and cut them into slices within the page caps."""
+        slices: List[List[str]] = []
+        current: List[str] = []
+        size = 0
+        for gap in gaps:
+            row = gap_row(gap, full_path=True, escape=True)
+            row_bytes = len(row.encode('utf-8')) + 1
+            if current and (len(current) >= self.max_gaps_per_page or size + row_bytes > self.max_page_bytes):
+                slices.append(current)
+                current, size = [], 0
+            current.append(row)
+            size += row_bytes
+        if current:
+            slices.append(current)
+        return slices
+    
+    def _render_page(self, page: MarkdownPage, position: int) -> str:
+        # No timestamp, so a page is only rewritten when its gaps change
+        output = [
+            "---",
+            f"id: {page.slug}",
+            f"title: {json.dumps(page.title, ensure_ascii=False)}",
+            f"sidebar_label: {json.dumps(page.title, ensure_ascii=False)}",
+            f"sidebar_position: {position}",
+            "tags: [documentation, coverage, quality]",
+            "---",
+            "",
+            f"# {page.title}",
+            "",
+            f"{len(page.rows)} gaps. [Back to the overview](../index.md)",
+            "",
+            *GAP_TABLE_HEADER,
+            *page.rows,
+            ""
+        ]
+        return "\n".join(output)
+    
+    def _render_index(self, report: CoverageReport, pages: List[MarkdownPage]) -> str:
+        output = self._front_matter(report)
+        # Docusaurus sidebar metadata goes into the front matter block
+        output[1:1] = ["sidebar_label: Overview", "sidebar_position: 0"]
+        output.extend(self._overview(report))
+        
+        if pages:
+            output.append("## ❌ Documentation Gaps")
+            output.append("")
+            output.append("| Page | Gaps |")
+            output.append("|------|------|")
+            for page in pages:
+                output.append(f"| [{page.title}]({page.href}) | {len(page.rows)} |")
+            output.append("")
+        
+        return "\n".join(output)
+    
+    def _category(self, label: str, collapsed: bool) -> str:
+        return json.dumps({"label": label, "collapsed": collapsed}, indent=2) + "\n"
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+NDJSON report generator for documentation coverage analysis
+
+Streams one JSON record per line: a "gap" record for every documentation gap,
+a "file" record for every analysed code file and a closing "summary" record
+with the report totals. Records are written as they are serialized, so
+consumers (jq, dashboards, log shippers) can process them incrementally and
+the report is never held in memory as one document.
+"""
+
+import sys
+from typing import Dict, List, Optional, TextIO
+
+from ..models import CodeFileAnalysis, CoverageReport, DocumentationQuality
+from ..config import ConfigManager
+from ..serialization import file_record, gap_record, summary_record
+
+class NdjsonReporter:
+    """Generates newline-delimited JSON records for streaming consumers"""
+    
+    def __init__(self, config_manager: ConfigManager):
+        self.config = config_manager.config
+        self.output_file: Optional[str] = None  # stdout unless set
+        self.pr_context = None
+        self.code_files: List[CodeFileAnalysis] = []
+        self.quality_assessments: Dict[str, DocumentationQuality] = {}
+        self.documentation_files: Dict[str, str] = {}
+    
+    def set_output_file(self, output_file: Optional[str]) -> None:
+        """Set the output file (None writes to stdout)."""
+        self.output_file = output_file
+    
+    def set_code_files(self, code_files: List[CodeFileAnalysis]) -> None:
+        """Set the analysed code files, one record each."""
+        self.code_files = code_files
+    
+    def set_quality_assessments(self, quality_assessments: Dict[str, DocumentationQuality],
+                                documentation_files: Dict[str, str]) -> None:
+        """Set per-file documentation quality (keyed by code file path)."""
+        self.quality_assessments = quality_assessments
+        self.documentation_files = documentation_files
+    
+    def set_pr_context(self, pr_context: dict) -> None:
+        """Set PR context for the reporter."""
+        self.pr_context = pr_context
+    
+    def generate(self, report: CoverageReport) -> str:
+        """Write the records to the output file or stdout and return a short summary."""
+        if self.output_file:
+            with open(self.output_file, 'w', encoding='utf-8', buffering=1024 * 1024) as f:
+                count = self.write(report, f)
+        else:
+            count = self.write(report, sys.stdout)
+            sys.stdout.flush()
+        return f"{count:,} NDJSON records ({len(report.gaps):,} gaps, {len(self.code_files or []):,} files, 1 summary)"
+    
+    def write(self, report: CoverageReport, stream: TextIO) -> int:
+        """Stream all records to a text stream, returning the number written."""
+        count = 0
+        write = stream.write
+        
+        for gap in report.gaps:
+            write(gap_record(gap) + '\n')
+            count += 1
+        
+        min_quality = self.config["documentation_standards"]["minimum_quality_score"]
+        qualities = self.quality_assessments
+        documentation_files = self.documentation_files
+        for code_file in self.code_files or []:
+            write(file_record(code_file, qualities.get(code_file.path),
+                              documentation_files.get(code_file.path), min_quality) + '\n')
+            count += 1
+        
+        extra = {"pr_info": self.pr_context.get("pr_info")} if self.pr_context else None
+        write(summary_record(report, extra) + '\n')
+        return count + 1
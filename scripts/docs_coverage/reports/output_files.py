@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+File output helpers shared by the multi-page report generators
+"""
+
+import os
+import tempfile
+
+
+def write_if_changed(path: str, content: str) -> bool:
+    """Atomically write a file unless it already has this content; returns whether it was written.
+
+    Leaving unchanged files alone keeps their mtime, so static site builds and
+    caches do not see them as modified.
+    """
+    data = content.encode('utf-8')
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except OSError:
+        pass
+
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(prefix=".tmp-", dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+    return True
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+XLSX Report Generator for Documentation Coverage Analysis
+
+Writes the CSV report's sheets into one Excel workbook with real styling:
+title, section and header rows use the brand palette, and data rows are
+colored by conditional formatting on their Color Code column. Only the
+standard library is used; rows are streamed as XML into spooled temporary
+files (one per sheet, since all sheets fill at once) and then copied into the
+zip archive, so memory stays bounded for sheets with 100k+ rows.
+"""
+
+import os
+import re
+import shutil
+import sys
+import tempfile
+import zipfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from xml.sax.saxutils import escape, quoteattr
+
+from .csv import CsvReporter
+from ..models import CoverageReport
+from ..config import ConfigManager
+
+# Workbook sheet for each CsvReporter sheet, in tab order
+SHEET_NAMES = {
+    'main': 'Summary',
+    'detailed': 'Gaps',
+    'priorities': 'Priorities',
+    'recommendations': 'Recommendations',
+    'files': 'Files'
+}
+
+# Color Code values, in the order of their conditional formats in styles.xml
+COLOR_CODES = ('SUCCESS', 'WARNING', 'ERROR', 'INFO')
+
+# Cell style indexes (cellXfs in styles.xml)
+STYLE_DEFAULT, STYLE_TITLE, STYLE_SECTION, STYLE_HEADER = range(4)
+
+# Sheet XML is kept in memory up to this size, then spooled to disk
+SPOOL_MAX_BYTES = 1024 * 1024
+
+_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_XML_HEADER = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+# Characters XML 1.0 does not allow
+_ILLEGAL_XML = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]')
+
+
+@lru_cache(maxsize=None)
+def column_letter(index: int) -> str:
+    """Spreadsheet column letter for a 0-based column index (0 -> A, 26 -> AA)."""
+    letters = ''
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+class XlsxSheetWriter:
+    """Streams rows of one worksheet as XML, with a csv.writer-like interface.
+
+    Row styles follow the CSV layout: the first row is the sheet title, a
+    one-cell upper-case row starts a section and the row after it holds the
+    column headers. Data rows ending in a Color Code are grouped into ranges
+    for conditional formatting; only the current range and a per-column width
+    are kept in memory.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.rows = 0
+        self.max_columns = 0
+        self.widths: Dict[int, int] = {}
+        self.color_ranges: List[Tuple[int, int, int]] = []
+        self._open_range: Optional[List[int]] = None
+        self._after_section = False
+        self._data = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES, mode='w+b')
+
+    def writerow(self, row: Iterable[Any]) -> None:
+        """Append one row."""
+        values = list(row)
+        self.rows += 1
+        number = self.rows
+
+        cells = [(column, value) for column, value in enumerate(values) if value is not None and value != '']
+        style = self._row_style(cells)
+        self._track_color_code(values, style)
+
+        parts = [f'<row r="{number}">']
+        style_attr = f' s="{style}"' if style else ''
+        for column, value in cells:
+            reference = f'{column_letter(column)}{number}'
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                parts.append(f'<c r="{reference}"{style_attr}><v>{value}</v></c>')
+                length = len(str(value))
+            else:
+                text = _ILLEGAL_XML.sub('', str(value))
+                space = ' xml:space="preserve"' if text != text.strip() else ''
+                parts.append(f'<c r="{reference}"{style_attr} t="inlineStr"><is><t{space}>{escape(text)}</t></is></c>')
+                length = len(text)
+            if style != STYLE_TITLE and style != STYLE_SECTION:
+                self.widths[column] = max(self.widths.get(column, 0), length)
+        parts.append('</row>')
+
+        if cells:
+            self.max_columns = max(self.max_columns, cells[-1][0] + 1)
+        self._data.write(''.join(parts).encode('utf-8'))
+
+    def writerows(self, rows: Iterable[Iterable[Any]]) -> None:
+        """Append rows one at a time."""
+        for row in rows:
+            self.writerow(row)
+
+    def _row_style(self, cells: List[Tuple[int, Any]]) -> int:
+        if self.rows == 1:
+            return STYLE_TITLE
+        if self._after_section:
+            self._after_section = False
+            return STYLE_HEADER
+        if len(cells) == 1 and isinstance(cells[0][1], str):
+            text = cells[0][1]
+            if text.upper() == text and any(char.isalpha() for char in text):
+                self._after_section = True
+                return STYLE_SECTION
+        return STYLE_DEFAULT
+
+    def _track_color_code(self, values: List[Any], style: int) -> None:
+        # Extend the open range while consecutive rows keep their code in the same column
+        column = len(values) - 1
+        if style != STYLE_DEFAULT or column < 0 or values[column] not in COLOR_CODES:
+            self._close_range()
+            return
+        current = self._open_range
+        if current and current[0] == column and current[2] == self.rows - 1:
+            current[2] = self.rows
+        else:
+            self._close_range()
+            self._open_range = [column, self.rows, self.rows]
+
+    def _close_range(self) -> None:
+        if self._open_range:
+            self.color_ranges.append(tuple(self._open_range))
+            self._open_range = None
+
+    def copy_to(self, target) -> None:
+        """Write the complete worksheet XML to a binary file object."""
+        self._close_range()
+        last = f'{column_letter(max(self.max_columns, 1) - 1)}{max(self.rows, 1)}'
+
+        head = [_XML_HEADER, f'<worksheet xmlns="{_MAIN_NS}" xmlns:r="{_REL_NS}">',
+                f'<dimension ref="A1:{last}"/>']
+        if self.widths:
+            head.append('<cols>')
+            for column in sorted(self.widths):
+                width = min(60, max(10, self.widths[column] + 2))
+                head.append(f'<col min="{column + 1}" max="{column + 1}" width="{width}" customWidth="1"/>')
+            head.append('</cols>')
+        head.append('<sheetData>')
+        target.write(''.join(head).encode('utf-8'))
+
+        self._data.seek(0)
+        shutil.copyfileobj(self._data, target, 1024 * 1024)
+
+        tail = ['</sheetData>']
+        priority = 1
+        for column, first_row, last_row in self.color_ranges:
+            code = f'${column_letter(column)}{first_row}'
+            code_cells = f'{column_letter(column)}{first_row}:{column_letter(column)}{last_row}'
+            ranges = [(code_cells, len(COLOR_CODES))]
+            if column > 0:
+                ranges.append((f'A{first_row}:{column_letter(column - 1)}{last_row}', 0))
+            for sqref, dxf_offset in ranges:
+                tail.append(f'<conditionalFormatting sqref="{sqref}">')
+                for index, color_code in enumerate(COLOR_CODES):
+                    tail.append(f'<cfRule type="expression" dxfId="{dxf_offset + index}" priority="{priority}">'
+                                f'<formula>{code}="{color_code}"</formula></cfRule>')
+                    priority += 1
+                tail.append('</conditionalFormatting>')
+        tail.append('</worksheet>')
+        target.write(''.join(tail).encode('utf-8'))
+
+    def close(self) -> None:
+        """Discard the spooled rows."""
+        self._data.close()
+
+
+def _argb(hex_color: str) -> str:
+    return 'FF' + hex_color.lstrip('#').upper()
+
+
+def workbook_styles(colors: Dict[str, str]) -> str:
+    """styles.xml: brand-colored title/section/header rows and Color Code formats."""
+    palette = {code: colors[code.lower()] for code in COLOR_CODES}
+    dark = _argb(colors['brand_quinary'])
+
+    # Row text takes the code's color; the Color Code cell itself is filled
+    text_formats = ''.join(f'<dxf><font><color rgb="{_argb(palette[code])}"/></font></dxf>' for code in COLOR_CODES)
+    cell_formats = ''.join(
+        f'<dxf><font><b/><color rgb="FFFFFFFF"/></font>'
+        f'<fill><patternFill patternType="solid"><bgColor rgb="{_argb(palette[code])}"/></patternFill></fill></dxf>'
+        for code in COLOR_CODES
+    )
+
+    return (
+        f'{_XML_HEADER}<styleSheet xmlns="{_MAIN_NS}">'
+        '<fonts count="4">'
+        '<font><sz val="11"/><name val="Calibri"/></font>'
+        f'<font><b/><sz val="14"/><color rgb="{dark}"/><name val="Calibri"/></font>'
+        f'<font><b/><sz val="11"/><color rgb="{dark}"/><name val="Calibri"/></font>'
+        '<font><b/><sz val="11"/><name val="Calibri"/></font>'
+        '</fonts>'
+        '<fills count="5">'
+        '<fill><patternFill patternType="none"/></fill>'
+        '<fill><patternFill patternType="gray125"/></fill>'
+        f'<fill><patternFill patternType="solid"><fgColor rgb="{_argb(colors["brand_primary"])}"/></patternFill></fill>'
+        f'<fill><patternFill patternType="solid"><fgColor rgb="{_argb(colors["brand_secondary"])}"/></patternFill></fill>'
+        f'<fill><patternFill patternType="solid"><fgColor rgb="{_argb(colors["brand_tertiary"])}"/></patternFill></fill>'
+        '</fills>'
+        '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+        '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+        '<cellXfs count="4">'
+        '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+        '<xf numFmtId="0" fontId="1" fillId="2" borderId="0" xfId="0" applyFont="1" applyFill="1"/>'
+        '<xf numFmtId="0" fontId="2" fillId="3" borderId="0" xfId="0" applyFont="1" applyFill="1"/>'
+        '<xf numFmtId="0" fontId="3" fillId="4" borderId="0" xfId="0" applyFont="1" applyFill="1"/>'
+        '</cellXfs>'
+        '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+        f'<dxfs count="{2 * len(COLOR_CODES)}">{text_formats}{cell_formats}</dxfs>'
+        '</styleSheet>'
+    )
+
+
+def write_workbook(path: Path, sheets: List[XlsxSheetWriter], colors: Dict[str, str]) -> None:
+    """Assemble the workbook package, replacing path atomically."""
+    directory = path.parent
+    directory.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(prefix=".tmp-", suffix=".xlsx", dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f, zipfile.ZipFile(f, 'w', zipfile.ZIP_DEFLATED) as archive:
+            sheet_overrides = ''.join(
+                f'<Override PartName="/xl/worksheets/sheet{number}.xml" '
+                'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+                for number in range(1, len(sheets) + 1)
+            )
+            archive.writestr('[Content_Types].xml', (
+                f'{_XML_HEADER}<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+                '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+                '<Default Extension="xml" ContentType="application/xml"/>'
+                '<Override PartName="/xl/workbook.xml" '
+                'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+                '<Override PartName="/xl/styles.xml" '
+                'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+                f'{sheet_overrides}</Types>'
+            ))
+            archive.writestr('_rels/.rels', (
+                f'{_XML_HEADER}<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                f'<Relationship Id="rId1" Type="{_REL_NS}/officeDocument" Target="xl/workbook.xml"/>'
+                '</Relationships>'
+            ))
+
+            sheet_entries = ''.join(
+                f'<sheet name={quoteattr(sheet.name)} sheetId="{number}" r:id="rId{number}"/>'
+                for number, sheet in enumerate(sheets, 1)
+            )
+            archive.writestr('xl/workbook.xml', (
+                f'{_XML_HEADER}<workbook xmlns="{_MAIN_NS}" xmlns:r="{_REL_NS}">'
+                f'<sheets>{sheet_entries}</sheets></workbook>'
+            ))
+            relationships = ''.join(
+                f'<Relationship Id="rId{number}" Type="{_REL_NS}/worksheet" Target="worksheets/sheet{number}.xml"/>'
+                for number in range(1, len(sheets) + 1)
+            )
+            archive.writestr('xl/_rels/workbook.xml.rels', (
+                f'{_XML_HEADER}<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                f'{relationships}<Relationship Id="rId{len(sheets) + 1}" Type="{_REL_NS}/styles" Target="styles.xml"/>'
+                '</Relationships>'
+            ))
+            archive.writestr('xl/styles.xml', workbook_styles(colors))
+
+            for number, sheet in enumerate(sheets, 1):
+                with archive.open(f'xl/worksheets/sheet{number}.xml', 'w', force_zip64=True) as target:
+                    sheet.copy_to(target)
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+
+class XlsxReporter(CsvReporter):
+    """Generates the CSV report's sheets as one styled Excel workbook."""
+
+    def __init__(self, config_manager: ConfigManager):
+        super().__init__(config_manager)
+        self.output_file = Path("documentation-coverage-report.xlsx")
+
+    def generate(self, report: CoverageReport) -> str:
+        """Generate the workbook, streaming every sheet's rows."""
+        writers = {sheet: XlsxSheetWriter(name) for sheet, name in SHEET_NAMES.items()}
+        try:
+            self._write_sheets(writers, report)
+            write_workbook(self.output_file, list(writers.values()), self.colors)
+        finally:
+            for writer in writers.values():
+                writer.close()
+
+        print(f"📗 XLSX workbook written: {self.output_file} "
+              f"({sum(writer.rows for writer in writers.values()):,} rows in {len(writers)} sheets)", file=sys.stderr)
+        return self._generate_workbook_summary(report)
+
+    def _generate_workbook_summary(self, report: CoverageReport) -> str:
+        """Generate console summary."""
+        return f"""
+📗 Excel Workbook Generated! 🎨
+
+📈 Coverage Summary:
+   • Total Files: {report.total_code_files}
+   • Documented: {report.adequately_documented}
+   • Coverage: {report.coverage_percentage:.1f}%
+   • Quality Score: {report.quality_score:.2f}
+
+📄 Workbook: {self.output_file}
+   • Sheets: {', '.join(SHEET_NAMES.values())}
+   • Rows are colored by their Color Code through conditional formatting:
+     SUCCESS {self.colors['success']}, WARNING {self.colors['warning']}, ERROR {self.colors['error']}, INFO {self.colors['info']}
+        """
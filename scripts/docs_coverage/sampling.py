@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Approximate coverage from a stratified random sample of code files
+
+Discovered files are stratified by file type and top-level directory, a
+proportionally allocated random sample is analysed and assessed, and the
+coverage percentage and quality score are estimated as stratified ratio
+estimators with normal-approximation confidence intervals. Only the sampled
+files (and their documentation) are ever read.
+"""
+
+import math
+import random
+import sys
+from collections import Counter
+from pathlib import Path
+from statistics import NormalDist
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .checker import DocumentationChecker
+from .models import CoverageReport, SampleEstimate
+
+# Number of leading directory components used for the directory stratum
+STRATUM_DEPTH = 2
+
+# Strata expected to receive less than one sampled file are pooled into this one
+POOLED_STRATUM = ("mixed", "*")
+
+StratumKey = Tuple[str, str]
+
+
+def stratify(checker: DocumentationChecker, paths: Sequence[str]) -> Dict[StratumKey, List[str]]:
+    """Group discovered file paths by (file type, top-level directory)"""
+    strata: Dict[StratumKey, List[str]] = {}
+    for path in paths:
+        directory = "/".join(Path(path).parent.parts[:STRATUM_DEPTH]) or "."
+        key = (str(checker.analyzer._determine_file_type(path)), directory)
+        strata.setdefault(key, []).append(path)
+
+    for members in strata.values():
+        members.sort()
+    return strata
+
+
+def pool_small_strata(strata: Dict[StratumKey, List[str]], sample_size: int) -> Dict[StratumKey, List[str]]:
+    """Merge strata whose proportional share of the sample is below one file"""
+    population = sum(len(members) for members in strata.values())
+    pooled: Dict[StratumKey, List[str]] = {}
+    for key in sorted(strata):
+        members = strata[key]
+        if len(members) * sample_size / population >= 1:
+            pooled[key] = members
+        else:
+            pooled.setdefault(POOLED_STRATUM, []).extend(members)
+    return pooled
+
+
+def allocate(stratum_sizes: Dict[StratumKey, int], sample_size: int) -> Dict[StratumKey, int]:
+    """Proportional allocation (largest remainder), at least one file per stratum"""
+    population = sum(stratum_sizes.values())
+    sample_size = min(sample_size, population)
+    quotas = {key: size * sample_size / population for key, size in stratum_sizes.items()}
+    allocation = {key: min(stratum_sizes[key], max(1, int(quota))) for key, quota in quotas.items()}
+
+    remaining = sample_size - sum(allocation.values())
+    by_remainder = sorted(quotas, key=lambda key: quotas[key] - int(quotas[key]), reverse=True)
+    while remaining > 0:
+        for key in by_remainder:
+            if remaining == 0:
+                break
+            if allocation[key] < stratum_sizes[key]:
+                allocation[key] += 1
+                remaining -= 1
+    while remaining < 0:
+        key = max(allocation, key=lambda k: allocation[k])
+        allocation[key] -= 1
+        remaining += 1
+
+    return allocation
+
+
+def ratio_estimate(strata: Dict[StratumKey, Tuple[int, List[Tuple[float, float]]]],
+                   z: float) -> Tuple[Optional[float], Tuple[float, float]]:
+    """Stratified ratio estimate sum(y)/sum(x) with a linearized confidence interval
+
+    strata maps each key to (population size, sampled (y, x) pairs). Returns
+    (None, (0, 0)) when the estimated denominator is zero.
+    """
+    total_y = total_x = 0.0
+    for population, units in strata.values():
+        if units:
+            total_y += population * sum(y for y, _ in units) / len(units)
+            total_x += population * sum(x for _, x in units) / len(units)
+    if total_x == 0:
+        return None, (0.0, 0.0)
+
+    ratio = total_y / total_x
+
+    def variance(values: List[float]) -> float:
+        mean = sum(values) / len(values)
+        return sum((v - mean) ** 2 for v in values) / (len(values) - 1)
+
+    # Strata with a single sampled file borrow the pooled residual variance
+    residuals = [[y - ratio * x for y, x in units] for _, units in strata.values()]
+    everything = [r for stratum in residuals for r in stratum]
+    pooled_variance = variance(everything) if len(everything) > 1 else 0.0
+
+    var_total = 0.0
+    for (population, units), stratum_residuals in zip(strata.values(), residuals):
+        n = len(units)
+        if n == 0:
+            continue
+        s2 = variance(stratum_residuals) if n > 1 else pooled_variance
+        var_total += population ** 2 * (1 - n / population) * s2 / n
+
+    half_width = z * math.sqrt(var_total) / total_x
+    return ratio, (ratio - half_width, ratio + half_width)
+
+
+def run_sampled_check(checker: DocumentationChecker, sample_size: Optional[int] = None,
+                      sample_fraction: Optional[float] = None, seed: int = 0,
+                      confidence: float = 0.95) -> CoverageReport:
+    """Estimate coverage from a stratified sample of the discovered code files
+
+    The returned report's counts and gaps cover the sampled files only; its
+    coverage_percentage and quality_score are population estimates, and its
+    estimate field carries the sample details and confidence intervals.
+    """
+    paths = checker.analyzer.discover_code_files()
+    population = len(paths)
+    if sample_size is None:
+        sample_size = max(1, math.ceil(population * sample_fraction))
+    sample_size = min(sample_size, population)
+
+    strata = pool_small_strata(stratify(checker, paths), sample_size) if population else {}
+    allocation = allocate({key: len(members) for key, members in strata.items()}, sample_size) if strata else {}
+
+    rng = random.Random(seed)
+    sampled = {key: rng.sample(strata[key], count) for key, count in allocation.items()}
+    sampled_paths = sorted({path for members in sampled.values() for path in members})
+    print(f"🎲 Sampling {sample_size:,} of {population:,} code files across {len(strata)} strata", file=sys.stderr)
+
+    # Analyse and assess only the sample
+    analyses = checker.analyzer.scan_code_files(sampled_paths)
+    checker.analyzer.classify(analyses)
+    checker.code_files = [analysis for analysis in analyses if analysis.documentation_required]
+    checker.documentation_files = checker.quality_assessor.find_documentation_files(checker.code_files)
+    print(f"📁 Found {len(checker.code_files)} sampled code files requiring documentation", file=sys.stderr)
+    report = checker._build_report(checker.code_files)
+
+    # Per-file indicators for the ratio estimators. Overlapping file patterns
+    # list some paths more than once; like the full report, coverage counts
+    # every occurrence while the quality average divides by distinct documents.
+    multiplicity = Counter(paths)
+    required = {analysis.path for analysis in checker.code_files}
+    min_quality = checker.config_manager.config["documentation_standards"]["minimum_quality_score"]
+    coverage_units: Dict[StratumKey, Tuple[int, List[Tuple[float, float]]]] = {}
+    quality_units: Dict[StratumKey, Tuple[int, List[Tuple[float, float]]]] = {}
+    for key, members in sampled.items():
+        coverage_pairs, quality_pairs = [], []
+        for path in members:
+            quality = checker.quality_assessments.get(path) if path in checker.documentation_files else None
+            is_required = path in required
+            adequate = is_required and quality is not None and quality.quality_score >= min_quality
+            coverage_pairs.append((float(adequate), float(is_required)))
+            documented = is_required and quality is not None
+            quality_pairs.append((quality.quality_score if documented else 0.0,
+                                  documented / multiplicity[path]))
+        coverage_units[key] = (len(strata[key]), coverage_pairs)
+        quality_units[key] = (len(strata[key]), quality_pairs)
+
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    coverage, (coverage_low, coverage_high) = ratio_estimate(coverage_units, z)
+    quality, (quality_low, quality_high) = ratio_estimate(quality_units, z)
+
+    if coverage is None:
+        report.coverage_percentage, coverage_interval = 100, (100.0, 100.0)
+    else:
+        report.coverage_percentage = coverage * 100
+        coverage_interval = (max(0.0, coverage_low * 100), min(100.0, coverage_high * 100))
+    if quality is None:
+        report.quality_score, quality_interval = 0.0, (0.0, 0.0)
+    else:
+        report.quality_score = quality
+        quality_interval = (max(0.0, quality_low), min(1.0, quality_high))
+
+    estimated_required = sum(
+        population_size * sum(x for _, x in units) / len(units)
+        for population_size, units in coverage_units.values() if units
+    )
+    report.estimate = SampleEstimate(
+        population_files=population,
+        sampled_files=sample_size,
+        strata=len(strata),
+        confidence_level=confidence,
+        estimated_requiring_docs=estimated_required,
+        coverage_interval=coverage_interval,
+        quality_interval=quality_interval
+    )
+    return report
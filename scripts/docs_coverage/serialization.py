@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Fast JSON serialization for coverage reports
+
+Gaps and analysed files have fixed shapes, so they are serialized by string
+templates (with the C-accelerated string encoder of the json module) instead
+of copying every model into dictionaries with dataclasses.asdict and walking
+them with json.dumps. NDJSON records use orjson when it is installed.
+
+report_json produces exactly what json.dumps(report.to_dict(), indent=2)
+did, so existing consumers of the JSON report see no change.
+"""
+
+import json
+from dataclasses import asdict, fields
+from json.encoder import encode_basestring_ascii
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+from .models import CodeFileAnalysis, CoverageReport, DocumentationGap, DocumentationQuality
+
+_str = encode_basestring_ascii
+
+
+def _compact_list(values: Iterable[str]) -> str:
+    return '[' + ','.join(map(_str, values)) + ']'
+
+
+def _indented_list(values, indent: str) -> str:
+    """A list of strings as json.dumps(indent=2) writes it with items at indent."""
+    if not values:
+        return '[]'
+    return '[\n' + indent + (',\n' + indent).join(map(_str, values)) + '\n' + indent[:-2] + ']'
+
+
+def _gap_indented(gap: DocumentationGap) -> str:
+    # A gap inside the report's "gaps" list: keys at 6 spaces, list items at 8
+    return (
+        '{\n      "code_file": ' + _str(gap.code_file) +
+        ',\n      "expected_doc_path": ' + _str(gap.expected_doc_path) +
+        ',\n      "gap_type": ' + _str(gap.gap_type) +
+        ',\n      "priority": ' + _str(gap.priority) +
+        ',\n      "required_sections": ' + _indented_list(gap.required_sections, '        ') +
+        ',\n      "quality_issues": ' + _indented_list(gap.quality_issues, '        ') +
+        ',\n      "estimated_effort": ' + _str(gap.estimated_effort) +
+        '\n    }'
+    )
+
+
+def report_fields(report: CoverageReport) -> Dict[str, Any]:
+    """Top-level report values in to_dict() order, with the gaps list left as is."""
+    data = {field.name: getattr(report, field.name) for field in fields(report)}
+    if report.estimate is None:
+        del data["estimate"]
+    else:
+        data["estimate"] = asdict(report.estimate)
+    if report.top_k is None:
+        del data["top_k"]
+    return data
+
+
+def iter_report_json(report: CoverageReport, head: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+    """Yield the indented JSON report in chunks, one per top-level key and gap.
+
+    Args:
+        report: Coverage report to serialize
+        head: Extra top-level keys written before the report's own keys
+    """
+    items = list((head or {}).items()) + list(report_fields(report).items())
+    yield '{'
+    for index, (key, value) in enumerate(items):
+        separator = ',' if index < len(items) - 1 else ''
+        yield '\n  ' + _str(key) + ': '
+        if key == "gaps" and value:
+            yield '[\n    '
+            for gap_index, gap in enumerate(value):
+                yield (',\n    ' if gap_index else '') + _gap_indented(gap)
+            yield '\n  ]' + separator
+        else:
+            yield json.dumps(value, indent=2, default=str).replace('\n', '\n  ') + separator
+    yield '\n}'
+
+
+def report_json(report: CoverageReport, head: Optional[Dict[str, Any]] = None) -> str:
+    """Serialize a report exactly like json.dumps(report.to_dict(), indent=2)."""
+    return ''.join(iter_report_json(report, head))
+
+
+def file_status(quality: Optional[DocumentationQuality], min_quality: float) -> str:
+    """Documentation status of an analysed file: adequate, inadequate or missing."""
+    if quality is None:
+        return "missing"
+    return "adequate" if quality.quality_score >= min_quality else "inadequate"
+
+
+def gap_record(gap: DocumentationGap) -> str:
+    """One NDJSON line (without newline) for a documentation gap."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps({"type": "gap", **gap.to_dict()}).decode('utf-8')
+    return (
+        '{"type":"gap","code_file":' + _str(gap.code_file) +
+        ',"expected_doc_path":' + _str(gap.expected_doc_path) +
+        ',"gap_type":' + _str(gap.gap_type) +
+        ',"priority":' + _str(gap.priority) +
+        ',"required_sections":' + _compact_list(gap.required_sections) +
+        ',"quality_issues":' + _compact_list(gap.quality_issues) +
+        ',"estimated_effort":' + _str(gap.estimated_effort) + '}'
+    )
+
+
+def file_record(code_file: CodeFileAnalysis, quality: Optional[DocumentationQuality],
+                doc_path: Optional[str], min_quality: float) -> str:
+    """One NDJSON line (without newline) for an analysed code file."""
+    status = file_status(quality, min_quality)
+    quality_score = None if quality is None else round(float(quality.quality_score), 4)
+    doc_path = doc_path if quality is not None else None
+
+    if ORJSON_AVAILABLE:
+        return orjson.dumps({
+            "type": "file",
+            "path": code_file.path,
+            "file_type": str(code_file.file_type),
+            "language": str(code_file.language),
+            "size_lines": int(code_file.size_lines),
+            "complexity_score": int(code_file.complexity_score),
+            "exported_functions": code_file.exported_functions,
+            "exported_classes": code_file.exported_classes,
+            "exported_types": code_file.exported_types,
+            "exported_constants": code_file.exported_constants,
+            "has_tests": code_file.has_tests,
+            "is_public_api": code_file.is_public_api,
+            "priority": str(code_file.priority),
+            "documentation": doc_path,
+            "quality_score": quality_score,
+            "status": status
+        }).decode('utf-8')
+    return (
+        '{"type":"file","path":' + _str(code_file.path) +
+        ',"file_type":' + _str(code_file.file_type) +
+        ',"language":' + _str(code_file.language) +
+        ',"size_lines":' + str(int(code_file.size_lines)) +
+        ',"complexity_score":' + str(int(code_file.complexity_score)) +
+        ',"exported_functions":' + _compact_list(code_file.exported_functions) +
+        ',"exported_classes":' + _compact_list(code_file.exported_classes) +
+        ',"exported_types":' + _compact_list(code_file.exported_types) +
+        ',"exported_constants":' + _compact_list(code_file.exported_constants) +
+        ',"has_tests":' + ('true' if code_file.has_tests else 'false') +
+        ',"is_public_api":' + ('true' if code_file.is_public_api else 'false') +
+        ',"priority":' + _str(code_file.priority) +
+        ',"documentation":' + ('null' if doc_path is None else _str(doc_path)) +
+        ',"quality_score":' + ('null' if quality_score is None else repr(quality_score)) +
+        ',"status":' + _str(status) + '}'
+    )
+
+
+def summary_record(report: CoverageReport, extra: Optional[Dict[str, Any]] = None) -> str:
+    """The closing NDJSON line: every report value except the gaps list."""
+    summary = {"type": "summary", **(extra or {})}
+    for key, value in report_fields(report).items():
+        if key != "gaps":
+            summary[key] = value
+    summary["gap_count"] = len(report.gaps)
+    # One small record; the json module also takes NumPy floats as plain floats
+    return json.dumps(summary, separators=(',', ':'), default=str)
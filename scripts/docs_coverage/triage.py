@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Top-K gap triage
+
+Ranks documentation gaps by urgency (priority, then complexity and size of
+the code file, then the smaller effort first) and keeps only the K most urgent
+in a bounded heap while the report is built. Reporters then materialize, sort
+and render K gaps instead of all of them; the report's totals still count
+every gap.
+"""
+
+import heapq
+from typing import Any, Generic, List, Tuple, TypeVar
+
+from .models import CodeFileAnalysis, Effort, Priority
+
+T = TypeVar("T")
+
+# Larger is more urgent
+PRIORITY_URGENCY = {Priority.CRITICAL: 3, Priority.HIGH: 2, Priority.MEDIUM: 1, Priority.LOW: 0}
+EFFORT_URGENCY = {Effort.LOW: 2, Effort.MEDIUM: 1, Effort.HIGH: 0}
+
+
+def urgency_key(code_file: CodeFileAnalysis, effort: str) -> Tuple[int, int, int, int]:
+    """Sort key of a gap; a larger key is more urgent."""
+    return (
+        PRIORITY_URGENCY.get(code_file.priority, 0),
+        code_file.complexity_score,
+        code_file.size_lines,
+        EFFORT_URGENCY.get(effort, 0)
+    )
+
+
+class TopK(Generic[T]):
+    """Keeps the k items with the largest keys; earlier items win ties."""
+
+    __slots__ = ("k", "_heap", "_count")
+
+    def __init__(self, k: int):
+        if k < 1:
+            raise ValueError(f"k must be at least 1, not {k}")
+        self.k = k
+        self._heap: List[Tuple[Any, int, T]] = []
+        self._count = 0
+
+    def push(self, key: Any, item: T) -> None:
+        """Offer an item; it is kept only while it is among the k largest keys."""
+        # The negated arrival order breaks ties, so items themselves are never compared
+        entry = (key, -self._count, item)
+        self._count += 1
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif entry > self._heap[0]:
+            heapq.heapreplace(self._heap, entry)
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    @property
+    def offered(self) -> int:
+        """Number of items offered so far."""
+        return self._count
+
+    def items(self) -> List[T]:
+        """The kept items, most urgent first."""
+        return [item for _, _, item in sorted(self._heap, reverse=True)]
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+"What-if" threshold re-evaluation against cached raw metrics
+
+The first what-if run scans the tree for threshold-independent raw metrics
+(complexity, line counts, exports, documentation heading flags, word counts)
+and caches them on disk, so alternative thresholds can be re-evaluated in
+milliseconds. Later runs only stat the scanned files: the cache is rebuilt
+when a code or documentation file changes size or mtime, when a directory
+that documentation is looked up in gains or loses entries, or when the set of
+discovered code files changes.
+"""
+
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from .checker import DocumentationChecker
+from .models import CodeFileAnalysis, CoverageReport, DocumentationQuality, FileType, Language, Priority
+
+DEFAULT_METRICS_CACHE = ".docs-coverage-cache/raw-metrics.json"
+
+# Config sections that affect which raw metrics are collected; a cache built
+# with different values is stale
+_SCAN_CONFIG_KEYS = (
+    ("code_analysis", "file_patterns"),
+    ("code_analysis", "exclude_patterns"),
+    ("documentation_discovery", "co_located_patterns"),
+)
+
+_DOC_FLAGS = (
+    "has_overview", "has_usage_examples", "has_api_documentation",
+    "has_installation_guide", "has_configuration_docs", "has_troubleshooting",
+    "has_code_examples", "has_proper_headings"
+)
+
+
+def _stat_signature(path: str) -> Optional[List[int]]:
+    """[size, mtime_ns] of a path, or None if it does not exist"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _doc_directories(paths: List[str], co_located_patterns: List[str]) -> List[str]:
+    """Directories that documentation discovery looks in for the given code files"""
+    directories = set()
+    for path in paths:
+        file_dir = os.path.dirname(path)
+        basename = os.path.splitext(os.path.basename(path))[0]
+        for pattern in co_located_patterns:
+            directories.add(os.path.dirname(os.path.join(file_dir, pattern.replace("{basename}", basename))))
+    return sorted(directories)
+
+
+class RawMetricsCache:
+    """Threshold-independent metrics for every scanned code file and its documentation"""
+
+    VERSION = 2
+
+    def __init__(self, files: List[Dict[str, Any]], docs: Dict[str, Dict[str, Any]],
+                 scan_config: Dict[str, Any], created: str,
+                 paths: List[str], sources: Dict[str, Optional[List[int]]]):
+        self.files = files
+        self.docs = docs
+        self.scan_config = scan_config
+        self.created = created
+        # Discovered code paths and the [size, mtime_ns] of every file and
+        # directory the metrics were read from
+        self.paths = paths
+        self.sources = sources
+
+    @staticmethod
+    def scan_config_for(config: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract the config values that the raw metrics depend on"""
+        return {f"{section}.{key}": config.get(section, {}).get(key) for section, key in _SCAN_CONFIG_KEYS}
+
+    @classmethod
+    def capture(cls, checker: DocumentationChecker) -> "RawMetricsCache":
+        """Scan the tree and record raw metrics for all files, required or not"""
+        config = checker.config_manager.config
+        paths = checker.analyzer.discover_code_files()
+        # Stat before reading, so an edit made during the scan invalidates the cache
+        sources = {path: _stat_signature(path) for path in paths}
+        for directory in _doc_directories(paths, config["documentation_discovery"]["co_located_patterns"]):
+            sources[directory] = _stat_signature(directory)
+        analyses = checker.analyzer.scan_code_files(paths)
+        assessor = checker.quality_assessor
+
+        files = [{
+            "path": cf.path,
+            "name": cf.name,
+            "file_type": str(cf.file_type),
+            "language": str(cf.language),
+            "size_lines": cf.size_lines,
+            "complexity_score": cf.complexity_score,
+            "exported_functions": cf.exported_functions,
+            "exported_classes": cf.exported_classes,
+            "exported_types": cf.exported_types,
+            "exported_constants": cf.exported_constants,
+            "has_tests": cf.has_tests,
+            "is_public_api": cf.is_public_api
+        } for cf in analyses]
+
+        docs = {}
+        for code_path, doc_path in assessor.find_documentation_files(analyses).items():
+            sources[doc_path] = _stat_signature(doc_path)
+            content = assessor.read_documentation(doc_path)
+            if content is None:
+                quality, sections = DocumentationQuality(), []
+            else:
+                quality, sections = assessor.measure_content(content, FileType.UNKNOWN), assessor.detect_sections(content)
+            docs[code_path] = {
+                "doc_path": doc_path,
+                "word_count": quality.word_count,
+                "line_count": quality.line_count,
+                "sections": sections,
+                **{flag: getattr(quality, flag) for flag in _DOC_FLAGS}
+            }
+
+        return cls(files, docs, cls.scan_config_for(config), datetime.now().isoformat(), paths, sources)
+
+    @classmethod
+    def load(cls, path: str) -> Optional["RawMetricsCache"]:
+        """Load a cache file, returning None if it is missing or unreadable"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if data.get("version") != cls.VERSION:
+            return None
+        return cls(data["files"], data["docs"], data["scan_config"], data["created"],
+                   data["paths"], data["sources"])
+
+    def save(self, path: str) -> None:
+        """Write the cache to disk"""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({
+                "version": self.VERSION,
+                "created": self.created,
+                "scan_config": self.scan_config,
+                "paths": self.paths,
+                "sources": self.sources,
+                "files": self.files,
+                "docs": self.docs
+            }, f)
+
+    def is_valid_for(self, checker: DocumentationChecker) -> bool:
+        """Check the cache matches the scan configuration and the files on disk
+
+        Discovers the code files again and stats every recorded file and
+        directory, but reads none of them.
+        """
+        if self.scan_config != self.scan_config_for(checker.config_manager.config):
+            return False
+        # Overlapping patterns can list a path twice, so compare as sorted lists
+        if sorted(checker.analyzer.discover_code_files()) != sorted(self.paths):
+            return False
+        return all(_stat_signature(path) == signature for path, signature in self.sources.items())
+
+    def evaluate(self, checker: DocumentationChecker) -> CoverageReport:
+        """Re-run classification and quality scoring with the checker's current thresholds"""
+        analyses = [
+            CodeFileAnalysis(
+                **{**row, "file_type": FileType(row["file_type"]), "language": Language(row["language"])},
+                documentation_required=False,
+                priority=Priority.LOW
+            )
+            for row in self.files
+        ]
+        checker.analyzer.classify(analyses)
+        code_files = [cf for cf in analyses if cf.documentation_required]
+
+        assessor = checker.quality_assessor
+        required_sections = checker.config_manager.config["documentation_standards"]["required_sections"]
+        documentation_files = {}
+        qualities = {}
+        for code_file in code_files:
+            raw = self.docs.get(code_file.path)
+            if raw is None or code_file.path in qualities:
+                continue
+            documentation_files[code_file.path] = raw["doc_path"]
+            qualities[code_file.path] = DocumentationQuality(
+                word_count=raw["word_count"],
+                line_count=raw["line_count"],
+                missing_sections=assessor.missing_sections(
+                    raw["sections"], required_sections.get(code_file.file_type, [])
+                ),
+                **{flag: raw[flag] for flag in _DOC_FLAGS}
+            )
+
+        checker.code_files = code_files
+        checker.documentation_files = documentation_files
+        return checker._build_report(code_files, qualities)
+
+
+def parse_override(override: str) -> Tuple[str, Any]:
+    """Parse a KEY=VALUE override; VALUE is read as JSON when possible"""
+    if "=" not in override:
+        raise ValueError(f"Invalid override '{override}', expected KEY=VALUE")
+
+    key, raw_value = override.split("=", 1)
+    try:
+        value = json.loads(raw_value)
+    except ValueError:
+        value = raw_value
+    return key.strip(), value
+
+
+def load_metrics(checker: DocumentationChecker, cache_path: str, refresh: bool = False) -> RawMetricsCache:
+    """Load cached raw metrics, scanning the tree if the cache is missing or stale"""
+    cache = None if refresh else RawMetricsCache.load(cache_path)
+    if cache is not None and cache.is_valid_for(checker):
+        return cache
+
+    print("🔍 Scanning code and documentation files for raw metrics...", file=sys.stderr)
+    cache = RawMetricsCache.capture(checker)
+    cache.save(cache_path)
+    print(f"💾 Raw metrics cached at {cache_path}", file=sys.stderr)
+    return cache
+
+
+def run_what_if(config_path: str, overrides: List[Tuple[str, Any]],
+                cache_path: str = DEFAULT_METRICS_CACHE, refresh: bool = False) -> str:
+    """Compare the configured thresholds against the given overrides"""
+    baseline_checker = DocumentationChecker(config_path)
+    cache = load_metrics(baseline_checker, cache_path, refresh)
+
+    scenario_checker = DocumentationChecker(config_path)
+    for key, value in overrides:
+        scenario_checker.set_threshold(key, value)
+
+    start = time.perf_counter()
+    baseline = cache.evaluate(baseline_checker)
+    scenario = cache.evaluate(scenario_checker)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    return format_comparison(baseline, scenario, overrides, cache, elapsed_ms)
+
+
+def format_comparison(baseline: CoverageReport, scenario: CoverageReport,
+                      overrides: List[Tuple[str, Any]], cache: RawMetricsCache,
+                      elapsed_ms: float) -> str:
+    """Format a side-by-side comparison of two reports"""
+    output = []
+    output.append("=" * 70)
+    output.append("🔮 WHAT-IF THRESHOLD ANALYSIS")
+    output.append("=" * 70)
+    output.append("")
+
+    output.append("⚙️  Overrides:")
+    if overrides:
+        for key, value in overrides:
+            output.append(f"  • {key} = {json.dumps(value)}")
+    else:
+        output.append("  • (none - scenario matches the configured thresholds)")
+    output.append("")
+
+    rows = [
+        ("Files requiring docs", baseline.total_code_files, scenario.total_code_files, "{:,}"),
+        ("Adequately documented", baseline.adequately_documented, scenario.adequately_documented, "{:,}"),
+        ("Coverage (%)", baseline.coverage_percentage, scenario.coverage_percentage, "{:.1f}"),
+        ("Quality score", baseline.quality_score, scenario.quality_score, "{:.2f}"),
+        ("Missing documentation", baseline.missing_documentation, scenario.missing_documentation, "{:,}"),
+        ("Inadequate documentation", baseline.inadequate_documentation, scenario.inadequate_documentation, "{:,}"),
+        ("Total gaps", len(baseline.gaps), len(scenario.gaps), "{:,}"),
+    ]
+    for priority in baseline.by_priority:
+        rows.append((f"  {priority.title()} gaps", baseline.by_priority[priority],
+                     scenario.by_priority.get(priority, 0), "{:,}"))
+
+    output.append(f"{'Metric':<28}{'Baseline':>12}{'Scenario':>12}{'Change':>12}")
+    output.append("-" * 64)
+    for label, before, after, fmt in rows:
+        delta = after - before
+        change = "—" if delta == 0 else ("+" if delta > 0 else "") + fmt.format(delta)
+        output.append(f"{label:<28}{fmt.format(before):>12}{fmt.format(after):>12}{change:>12}")
+    output.append("")
+
+    output.append(f"⏱️  Re-evaluated {len(cache.files):,} files in {elapsed_ms:.1f} ms "
+                  f"(raw metrics captured {cache.created})")
+    output.append("=" * 70)
+
+    return "\n".join(output)